@@ -0,0 +1,58 @@
+"""Measure cold start time of the CLI.
+
+Every command is run in a new interpreter, so nothing is imported yet:
+
+    python benchmarks/startup.py --runs 10
+
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "import package": ["-c", "import jira_report_generator"],
+    "cli --help": ["-m", "jira_report_generator.cli", "--help"],
+    "import app": ["-c", "import jira_report_generator.app"],
+}
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--runs",
+    type=int,
+    default=5,
+    help="how many times every command is run",
+)
+
+
+def measure(args: list[str], runs: int) -> list[float]:
+    """Returns wall times of running python with arguments."""
+    times = []
+
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - started)
+
+    return times
+
+
+def main():
+    cli_args = parser.parse_args()
+
+    for name, args in COMMANDS.items():
+        times = measure(args, cli_args.runs)
+        print(
+            f"{name:<16} "
+            f"min {min(times) * 1000:7.1f} ms  "
+            f"median {statistics.median(times) * 1000:7.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
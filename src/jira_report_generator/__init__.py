@@ -1,13 +1,41 @@
-from .tables.assignees import generate_assignees_table
-from .tables.backlog import generate_backlog_table
-from .tables.epics import generate_epics_table
-from .tables.issues import generate_issues_table
-from .tables.statuses import generate_statuses_table
-from .tables.versions import generate_versions_table
-from .utils.data import (
-    filter_data_by_statuses,
-    prepare_backlog_table_data,
-    prepare_components_data,
-    prepare_issues_table_data,
-    prepare_not_finished_statuses_data,
-)
+import importlib
+
+# public name -> module it's imported from on first access, so importing
+# the package (and starting the CLI) doesn't load pandas and jira
+_EXPORTS = {
+    "get_project_fingerprint": ".app",
+    "get_report_model": ".app",
+    "get_tables": ".app",
+    "is_project_changed": ".app",
+    "Cube": ".cube",
+    "build_cube": ".cube",
+    "ReportModel": ".model",
+    "build_report_model": ".model",
+    "generate_assignees_table": ".tables.assignees",
+    "generate_backlog_table": ".tables.backlog",
+    "generate_epics_table": ".tables.epics",
+    "generate_issues_table": ".tables.issues",
+    "generate_statuses_table": ".tables.statuses",
+    "generate_versions_table": ".tables.versions",
+    "save_fingerprint": ".utils.cache",
+    "filter_data_by_statuses": ".utils.data",
+    "prepare_backlog_table_data": ".utils.data",
+    "prepare_components_data": ".utils.data",
+    "prepare_issues_table_data": ".utils.data",
+    "prepare_not_finished_statuses_data": ".utils.data",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
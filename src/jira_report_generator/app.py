@@ -1,37 +1,105 @@
 import argparse
 import collections
+import dataclasses
 import functools
 import itertools
 import logging
+import math
 import os
 import sys
 import typing
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from logging import Formatter, StreamHandler
 
 import jira.resources
-from jinja2 import Environment, FileSystemLoader
+import numpy
 from jira import JIRA
-from pandas import DataFrame
+from pandas import DataFrame, isna
 
-from .constants import JIRA_FETCH_FIELDS, MAX_THREADS_COUNT
-from .tables.assignees import generate_assignees_table
+from .changelogs import (
+    CHANGELOG_FIELDS,
+    Changelogs,
+    get_changelogs_tables,
+    get_issue_histories,
+    is_changelog_truncated,
+    load_changelogs,
+    merge_changelogs,
+    save_changelogs,
+)
+from .constants import (
+    CACHE_DIR,
+    CHECKPOINT_DIR,
+    JIRA_FETCH_FIELDS,
+    MAX_THREADS_COUNT,
+    MEMORY_BUDGET,
+    SEARCH_PAGE_SIZE,
+    SHARD_MIN_DURATION,
+    SprintState,
+)
+from .cube import (
+    Cube,
+    build_cube,
+    merge_cubes,
+    slice_backlog,
+    slice_board,
+    slice_statuses,
+    slice_unversioned,
+    slice_versioned,
+)
+from .export import export_report
+from .model import (
+    ReportModel,
+    build_assignees_matrix,
+    build_project_totals,
+    build_report_model,
+    build_rollup,
+    build_sprints_timeline,
+    build_status_history,
+    build_statuses_matrix,
+    build_versions_timeline,
+)
+from .tables.assignees import generate_assignees_table, render_assignees_table
 from .tables.backlog import generate_backlog_table
 from .tables.board import generate_board_table
-from .tables.epics import generate_epics_table
+from .tables.durations import (
+    render_cycle_time_table,
+    render_time_in_status_table,
+)
+from .tables.epics import generate_epics_table, render_epics_table
 from .tables.issues import generate_issues_table
-from .tables.project import generate_project_table
-from .tables.sprints import generate_sprints_table
-from .tables.statuses import generate_statuses_table
-from .tables.stories import generate_stories_table
+from .tables.project import generate_project_table, render_project_table
+from .tables.sprints import generate_sprints_table, render_sprints_table
+from .tables.statuses import generate_statuses_table, render_statuses_table
+from .tables.stories import generate_stories_table, render_stories_table
 from .tables.unversioned import generate_unversioned_table
-from .tables.versions import generate_versions_table
+from .tables.versions import generate_versions_table, render_versions_table
+from .utils.cache import (
+    CHANGELOGS_CACHE_DIR,
+    ISSUES_CACHE_DIR,
+    WORKLOGS_CACHE_DIR,
+    IssuesWriter,
+    ResponseCache,
+    SectionCache,
+    dump_resources,
+    get_cache_path,
+    get_data_hash,
+    iter_stored_issues,
+    load_closed_sprints,
+    load_fingerprint,
+    load_resources,
+    read_issues_header,
+    save_closed_sprints,
+)
+from .utils.checkpoint import Checkpoint
+from .utils.chunks import IssueChunks
 from .utils.data import (
+    apply_board_data,
     filter_by_board,
     filter_data_by_statuses,
     get_dataframe,
     get_epics,
+    get_section_hash,
     get_sprinted_issues,
     get_stories,
     get_versioned_issues,
@@ -41,8 +109,19 @@ from .utils.data import (
     prepare_not_finished_statuses_data,
     prepare_unversioned_table_data,
 )
+from .utils.formatters import format_jql_datetime, parse_jira_datetime
+from .utils.snapshot import load_snapshot, save_snapshot
 from .utils.tabs import wrap_with_tabs
 from .utils.tags import H2, Div, Section
+from .worklogs import (
+    fetch_worklogs,
+    filter_worklogs,
+    get_changed_worklog_ids,
+    get_worklogs_table,
+    load_worklogs,
+    merge_worklogs,
+    save_worklogs,
+)
 
 parser = argparse.ArgumentParser()
 parser.add_argument("key", type=str, help="JIRA project key")
@@ -59,12 +138,6 @@ parser.add_argument(
     action='store_true',
 )
 
-env = Environment(
-    loader=FileSystemLoader(
-        os.path.join(os.path.dirname(__file__), "static"),
-    ),
-)
-
 logger = logging.getLogger(__name__)
 handler = StreamHandler(stream=sys.stdout)
 formatter = Formatter(fmt="[%(asctime)s: %(levelname)s] %(message)s")
@@ -72,12 +145,499 @@ formatter = Formatter(fmt="[%(asctime)s: %(levelname)s] %(message)s")
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+VERSIONS_TAB_ID = 1
+EMPTY_TAB_CONTENT = "No data."
+
+
+def get_cached_resources(
+    jira_client: JIRA,
+    cache: ResponseCache | None,
+    entity: str,
+    key: str | int,
+    resource_class: type,
+    fetch: typing.Callable[[], list],
+) -> list:
+    """Get Jira resources from cache or fetch and store them."""
+    if cache is None:
+        return list(fetch())
+
+    raws = cache.get(entity, key)
+    if raws is not None:
+        return load_resources(jira_client, resource_class, raws)
+
+    resources = list(fetch())
+    cache.set(entity, key, dump_resources(resources))
+
+    return resources
+
+
+def get_issues_summary(
+    jira_client: JIRA,
+    project_key: str,
+) -> dict[str, typing.Any]:
+    """Get project issues count and the latest issue update time."""
+    result = jira_client.search_issues(
+        f"project={project_key} ORDER BY updated DESC",
+        startAt=0,
+        maxResults=1,
+        fields=["updated"],
+        json_result=True,
+    )
+    issues = result.get("issues", [])
+
+    return {
+        "total": result["total"],
+        "updated": issues[0]["fields"]["updated"] if issues else None,
+    }
+
+
+def iter_issues_pages(
+    jira_client: JIRA,
+    jql_str: str,
+    fields: list = JIRA_FETCH_FIELDS,
+    checkpoint: Checkpoint | None = None,
+    expand: str | None = None,
+) -> typing.Iterator[list[dict]]:
+    """Yield raw issues found by JQL query page by page.
+
+    Pages may overlap if issues are created meanwhile, so issues
+    should be deduplicated by id. With `checkpoint` only issues created
+    before it are searched and its pages are used if issues count is
+    the same, otherwise they are requested again.
+
+    """
+    start_at = 0
+
+    if checkpoint is not None:
+        jql_str = checkpoint.pin(
+            jql_str,
+            lambda: jira_client.myself().get("timeZone", "UTC"),
+        )
+        stored = checkpoint.get_page(jql_str, start_at)
+
+        # issues were deleted or moved, stored pages are shifted
+        if (
+            stored is not None
+            and stored["total"] != count_issues(jira_client, jql_str)
+        ):
+            checkpoint.remove_pages(jql_str)
+
+    while True:
+        page = (
+            checkpoint.get_page(jql_str, start_at)
+            if checkpoint is not None
+            else None
+        )
+        if page is None:
+            page = jira_client.search_issues(
+                jql_str,
+                startAt=start_at,
+                maxResults=SEARCH_PAGE_SIZE,
+                fields=fields,
+                expand=expand,
+                json_result=True,
+            )
+            if checkpoint is not None:
+                checkpoint.set_page(jql_str, start_at, page)
+
+        yield page["issues"]
+
+        start_at += len(page["issues"])
+        if not page["issues"] or start_at >= page["total"]:
+            break
+
+
+def search_all_issues(
+    jira_client: JIRA,
+    jql_str: str,
+    fields: list = JIRA_FETCH_FIELDS,
+    checkpoint: Checkpoint | None = None,
+) -> list[jira.resources.Issue]:
+    """Get all issues found by JQL query.
+
+    With `checkpoint` issues are requested page by page, stored pages
+    are not requested again.
+
+    """
+    if checkpoint is None:
+        return jira_client.search_issues(
+            jql_str,
+            startAt=0,
+            maxResults=False,
+            fields=fields,
+        )
+
+    raws: dict[str, dict] = {}
+    for page in iter_issues_pages(jira_client, jql_str, fields, checkpoint):
+        for raw in page:
+            raws.setdefault(raw["id"], raw)
+
+    return load_resources(
+        jira_client,
+        jira.resources.Issue,
+        list(raws.values()),
+    )
+
+
+def count_issues(jira_client: JIRA, jql_str: str) -> int:
+    """Get count of issues found by JQL query."""
+    result = jira_client.search_issues(
+        jql_str,
+        startAt=0,
+        maxResults=1,
+        fields=["created"],
+        json_result=True,
+    )
+    return result["total"]
+
+
+def get_created_bounds(
+    jira_client: JIRA,
+    project_key: str,
+) -> dict[str, typing.Any]:
+    """Get project issues count, the oldest and the newest creation time."""
+    bounds: dict[str, typing.Any] = {}
+
+    for order, bound in (("ASC", "oldest"), ("DESC", "newest")):
+        result = jira_client.search_issues(
+            f"project={project_key} ORDER BY created {order}",
+            startAt=0,
+            maxResults=1,
+            fields=["created"],
+            json_result=True,
+        )
+        issues = result.get("issues", [])
+        bounds["total"] = result["total"]
+        bounds[bound] = (
+            parse_jira_datetime(issues[0]["fields"]["created"])
+            if issues
+            else None
+        )
+
+    return bounds
+
+
+def get_shard_jql(
+    project_key: str,
+    start: datetime | None,
+    end: datetime | None,
+) -> str:
+    """Get JQL query for issues created in [start, end) range.
+
+    Missing bound means the range is open from that side.
+
+    """
+    conditions = [f"project={project_key}"]
+
+    if start is not None:
+        conditions.append(f"created >= \"{format_jql_datetime(start)}\"")
+    if end is not None:
+        conditions.append(f"created < \"{format_jql_datetime(end)}\"")
+
+    return f"{' AND '.join(conditions)} ORDER BY created DESC"
+
+
+def round_to_minute(value: datetime) -> datetime:
+    """Drop seconds, JQL doesn't support them."""
+    return value.replace(second=0, microsecond=0)
+
+
+def get_initial_shards(
+    bounds: dict[str, typing.Any],
+    shard_size: int,
+) -> list[tuple[datetime | None, datetime | None]]:
+    """Split creation time range into equal shards by issues count.
+
+    The first and the last shards are open, so issues created out
+    of bounds (for example, because of timezone) are not lost.
+
+    """
+    count = math.ceil(bounds["total"] / shard_size)
+    duration = bounds["newest"] - bounds["oldest"]
+    limits = sorted({
+        round_to_minute(bounds["oldest"] + duration * i / count)
+        for i in range(1, count)
+    })
+
+    return list(zip([None, *limits], [*limits, None]))
+
+
+def split_shard(
+    shard: tuple[datetime | None, datetime | None],
+    bounds: dict[str, typing.Any],
+) -> list[tuple[datetime | None, datetime | None]] | None:
+    """Split shard into two halves, None if it is too short."""
+    start, end = shard
+    middle = round_to_minute(
+        (start or bounds["oldest"])
+        + ((end or bounds["newest"]) - (start or bounds["oldest"])) / 2,
+    )
+
+    if (
+        (start is not None and middle <= start)
+        or (end is not None and middle >= end)
+        or (end or bounds["newest"]) - (start or bounds["oldest"])
+        < timedelta(seconds=SHARD_MIN_DURATION)
+    ):
+        return None
+
+    return [(start, middle), (middle, end)]
+
+
+def get_shards(
+    jira_client: JIRA,
+    project_key: str,
+    shard_size: int,
+    bounds: dict[str, typing.Any],
+    executor: ThreadPoolExecutor,
+) -> list[tuple[datetime | None, datetime | None]]:
+    """Split project issues into creation date ranges.
+
+    Ranges are sized from pre-flight count and split until every range
+    has at most `shard_size` issues (or can't be split anymore).
+    Ranges are ordered by creation date, newest first.
+
+    """
+    pending = get_initial_shards(bounds, shard_size)
+    shards = []
+
+    while pending:
+        counts = executor.map(
+            lambda shard: count_issues(
+                jira_client,
+                get_shard_jql(project_key, *shard),
+            ),
+            pending,
+        )
+
+        split_shards = []
+        for shard, count in zip(pending, counts):
+            if not count:
+                continue
+
+            halves = (
+                split_shard(shard, bounds)
+                if count > shard_size
+                else None
+            )
+            if halves:
+                split_shards.extend(halves)
+            else:
+                shards.append(shard)
+
+        pending = split_shards
+
+    # newest first
+    shards.sort(
+        key=lambda shard: (shard[1] is None, shard[1] or bounds["oldest"]),
+        reverse=True,
+    )
+
+    logger.info(
+        f"Collect {bounds['total']} issue(s) in {len(shards)} shard(s)",
+    )
+
+    return shards
+
+
+def get_sharded_issues(
+    jira_client: JIRA,
+    project_key: str,
+    shard_size: int,
+    checkpoint: Checkpoint | None = None,
+) -> list[jira.resources.Issue]:
+    """Get all project issues by creation date ranges.
+
+    Ranges have at most `shard_size` issues (see `get_shards`), they
+    are fetched in parallel. Issues are deduplicated by id and ordered
+    by creation date, newest first.
+
+    """
+    bounds = get_created_bounds(jira_client, project_key)
+
+    if bounds["total"] <= shard_size:
+        return search_all_issues(
+            jira_client,
+            get_shard_jql(project_key, None, None),
+            checkpoint=checkpoint,
+        )
+
+    with ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT) as executor:
+        shards = get_shards(
+            jira_client,
+            project_key,
+            shard_size,
+            bounds,
+            executor,
+        )
+        results = executor.map(
+            lambda shard: search_all_issues(
+                jira_client,
+                get_shard_jql(project_key, *shard),
+                checkpoint=checkpoint,
+            ),
+            shards,
+        )
+
+        issues: list[jira.resources.Issue] = []
+        issue_ids = set()
+        for shard_issues in results:
+            for issue in shard_issues:
+                if issue.id not in issue_ids:
+                    issue_ids.add(issue.id)
+                    issues.append(issue)
+
+    return issues
+
+
+def iter_project_pages(
+    jira_client: JIRA,
+    project_key: str,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> typing.Iterator[list[dict]]:
+    """Yield raw project issues page by page, newest first.
+
+    Issues are searched by creation date ranges of at most `shard_size`
+    issues one by one if it is set. Pages may overlap, so issues
+    should be deduplicated by id.
+
+    """
+    jql_strs = [get_shard_jql(project_key, None, None)]
+
+    if shard_size:
+        bounds = get_created_bounds(jira_client, project_key)
+
+        if bounds["total"] > shard_size:
+            with ThreadPoolExecutor(
+                max_workers=MAX_THREADS_COUNT,
+            ) as executor:
+                jql_strs = [
+                    get_shard_jql(project_key, *shard)
+                    for shard in get_shards(
+                        jira_client,
+                        project_key,
+                        shard_size,
+                        bounds,
+                        executor,
+                    )
+                ]
+
+    for jql_str in jql_strs:
+        yield from iter_issues_pages(
+            jira_client,
+            jql_str,
+            checkpoint=checkpoint,
+        )
+
+
+def get_project_issues(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> list[jira.resources.Issue]:
+    """Get all project issues.
+
+    Cached issues are refreshed incrementally: only issues updated
+    since the latest cached update are requested. If issues were
+    deleted or moved, all issues are requested again, by creation date
+    ranges of at most `shard_size` issues if it is set.
+
+    """
+    jql_str = f"project={project_key} ORDER BY created DESC"
+    cached = (
+        cache.read("issues", project_key)
+        if cache is not None
+        else None
+    )
+
+    if cached is not None:
+        summary = get_issues_summary(jira_client, project_key)
+        raws = cached["issues"]
+
+        if (
+            summary["updated"] != cached["updated"]
+            or summary["total"] != len(raws)
+        ):
+            # JQL uses user timezone, so take some extra time
+            since = format_jql_datetime(
+                parse_jira_datetime(cached["updated"]) - timedelta(days=1),
+            )
+            updated_issues = search_all_issues(
+                jira_client,
+                f"project={project_key} AND updated >= \"{since}\" "
+                f"ORDER BY created DESC",
+                checkpoint=checkpoint,
+            )
+            logger.info(f"Collected {len(updated_issues)} updated issue(s)")
+            raws = merge_issues(raws, dump_resources(updated_issues))
+            store_project_issues(cache, project_key, raws)
+
+        if summary["total"] == len(raws):
+            cache.hit("issues")
+            return load_resources(jira_client, jira.resources.Issue, raws)
+
+    if shard_size:
+        issues = get_sharded_issues(
+            jira_client,
+            project_key,
+            shard_size,
+            checkpoint,
+        )
+    else:
+        issues = search_all_issues(
+            jira_client,
+            jql_str,
+            checkpoint=checkpoint,
+        )
+
+    if cache is not None:
+        cache.miss("issues")
+        store_project_issues(cache, project_key, dump_resources(issues))
+
+    return issues
+
+
+def merge_issues(raws: list[dict], updated_raws: list[dict]) -> list[dict]:
+    """Merge updated issues into issues list keeping their order.
+
+    Both lists are expected to be ordered by creation date, newest first.
+
+    """
+    updated_map = {raw["id"]: raw for raw in updated_raws}
+    existing_ids = {raw["id"] for raw in raws}
+
+    return [
+        *[raw for raw in updated_raws if raw["id"] not in existing_ids],
+        *[updated_map.get(raw["id"], raw) for raw in raws],
+    ]
+
+
+def store_project_issues(
+    cache: ResponseCache,
+    project_key: str,
+    raws: list[dict],
+) -> None:
+    """Store project issues with the latest update time."""
+    updated = max(
+        (raw["fields"]["updated"] for raw in raws),
+        key=parse_jira_datetime,
+        default=None,
+    )
+    if updated is None:
+        return
+
+    cache.set("issues", project_key, {"updated": updated, "issues": raws})
+
 
 def get_paginated_issues_for_sprint(
     project_key: str,
     jira_client: JIRA,
     sprint: jira.resources.Sprint,
     fields: list = JIRA_FETCH_FIELDS,
+    checkpoint: Checkpoint | None = None,
 ) -> list[dict[str, typing.Any]]:
     """Get list of issues for project sprint."""
     jql_str = (
@@ -85,12 +645,7 @@ def get_paginated_issues_for_sprint(
         f"AND sprint={sprint.id} "
         f"ORDER BY created DESC"
     )
-    issues = jira_client.search_issues(
-        jql_str,
-        startAt=0,
-        maxResults=False,
-        fields=fields,
-    )
+    issues = search_all_issues(jira_client, jql_str, fields, checkpoint)
     return [
         {"issue_id": issue.id, "sprint": sprint}
         for issue in issues
@@ -101,12 +656,27 @@ def get_board_issues_data(
     jira_client: JIRA,
     project_key: str,
     board: jira.resources.Board,
+    cache: ResponseCache | None = None,
+    checkpoint: Checkpoint | None = None,
 ) -> dict[str, list | dict]:
-    """Get issues for board with info about sprints."""
+    """Get issues for board with info about sprints.
+
+    Issues of closed sprints are stored in cache directory of `cache`
+    or in the default one and never requested again, even without
+    `cache`: they don't expire like Jira responses.
+
+    """
     logger.info(f"Collect sprints for Board {board.id}")
 
     try:
-        sprints = jira_client.sprints(board_id=board.id, maxResults=False)
+        sprints = get_cached_resources(
+            jira_client,
+            cache,
+            "sprints",
+            board.id,
+            jira.resources.Sprint,
+            lambda: jira_client.sprints(board_id=board.id, maxResults=False),
+        )
     except Exception as e:
         logger.debug(e)
         sprints = []
@@ -123,14 +693,64 @@ def get_board_issues_data(
 
     logger.info(f"Collected {len(sprints)} sprints(s)")
 
+    sprints_cache_dir = cache.cache_dir if cache is not None else CACHE_DIR
+    closed_sprints = load_closed_sprints(
+        project_key,
+        board.id,
+        sprints_cache_dir,
+    )
+    # closed sprints membership is immutable, request only the rest
+    sprints_to_fetch = [
+        sprint for sprint in sprints
+        if not (
+            sprint.state == SprintState.CLOSED.value
+            and sprint.id in closed_sprints
+        )
+    ]
+
+    logger.info(
+        f"Use cached issues for {len(sprints) - len(sprints_to_fetch)} "
+        f"closed sprint(s)",
+    )
+
     with ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT) as executor:
         issues_for_sprint_func = functools.partial(
             get_paginated_issues_for_sprint,
             project_key,
             jira_client,
+            checkpoint=checkpoint,
+        )
+        issues_result_lists = executor.map(
+            issues_for_sprint_func,
+            sprints_to_fetch,
+        )
+        fetched_issue_ids = {
+            sprint.id: [issue_data["issue_id"] for issue_data in result]
+            for sprint, result in zip(sprints_to_fetch, issues_result_lists)
+        }
+
+    newly_closed_sprints = {
+        sprint.id: fetched_issue_ids[sprint.id]
+        for sprint in sprints_to_fetch
+        if sprint.state == SprintState.CLOSED.value
+    }
+    if newly_closed_sprints:
+        save_closed_sprints(
+            project_key,
+            board.id,
+            {**closed_sprints, **newly_closed_sprints},
+            sprints_cache_dir,
         )
-        issues_result_lists = executor.map(issues_for_sprint_func, sprints)
-        issues_data = itertools.chain(*issues_result_lists)
+
+    # keep sprints order -- issue belongs to the latest sprint
+    issues_data = [
+        {"issue_id": issue_id, "sprint": sprint}
+        for sprint in sprints
+        for issue_id in fetched_issue_ids.get(
+            sprint.id,
+            closed_sprints.get(sprint.id, []),
+        )
+    ]
 
     return {
         "board": {
@@ -150,11 +770,13 @@ def get_board_issues_data(
 def get_extra_data(
     jira_client: JIRA,
     project_key: str,
+    cache: ResponseCache | None = None,
+    checkpoint: Checkpoint | None = None,
 ) -> dict[str, list | dict]:
     """Get boards and issues data."""
     logger.info(f"Connect to Jira ({project_key})")
 
-    boards = jira_client.boards(projectKeyOrID=project_key)
+    boards = get_boards(jira_client, project_key, cache)
 
     logger.info(f"Collected {len(boards)} board(s)")
 
@@ -163,6 +785,8 @@ def get_extra_data(
             get_board_issues_data,
             jira_client,
             project_key,
+            cache=cache,
+            checkpoint=checkpoint,
         )
         results = list(executor.map(board_issues_data_func, boards))
     return {
@@ -173,259 +797,1878 @@ def get_extra_data(
     }
 
 
-def get_data(jira_client: JIRA, project_key: str) -> dict[str, list]:
+def get_boards(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache | None = None,
+) -> list[jira.resources.Board]:
+    """Get project boards."""
+    return get_cached_resources(
+        jira_client,
+        cache,
+        "boards",
+        project_key,
+        jira.resources.Board,
+        lambda: jira_client.boards(projectKeyOrID=project_key),
+    )
+
+
+def get_data(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> dict[str, list]:
     """Get all project issues and versions."""
     logger.info(f"Connect to Jira ({project_key})")
 
-    issues = jira_client.search_issues(
-        f"project={project_key} ORDER BY created DESC",
-        startAt=0,
-        maxResults=False,
-        fields=JIRA_FETCH_FIELDS,
+    issues = get_project_issues(
+        jira_client,
+        project_key,
+        cache,
+        shard_size,
+        checkpoint,
     )
 
+    return {
+        "versions": get_versions(jira_client, project_key, cache),
+        "issues": issues,
+    }
+
+
+def get_versions(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache | None = None,
+) -> list[jira.resources.Version]:
+    """Get not archived release versions ordered by start date."""
     logger.info("Get versions")
 
-    # get not archived release versions
     versions = [
-        version for version in jira_client.project_versions(project_key)
+        version for version in get_cached_resources(
+            jira_client,
+            cache,
+            "versions",
+            project_key,
+            jira.resources.Version,
+            lambda: jira_client.project_versions(project_key),
+        )
         if not version.archived
     ]
     versions.sort(key=lambda x: getattr(x, "startDate", ""))
 
-    return {
-        "versions": versions,
-        "issues": issues,
-    }
+    return versions
 
 
-def construct_tables(
-    issues_dataframe: DataFrame,
-    versions: list,
-    boards: list,
-) -> list[Section | Div]:
-    """Construct tables from data."""
-    VERSIONS_TAB_ID = 1
-    EMPTY_TAB_CONTENT = "No data."
+def get_worklogs(
+    jira_client: JIRA,
+    jira_server_url: str,
+    cache: ResponseCache | None = None,
+) -> DataFrame:
+    """Get worklogs of all issues as table, see `get_worklogs_table`.
 
-    versioned_df = get_versioned_issues(issues_dataframe)
-    unversioned_df = prepare_unversioned_table_data(issues_dataframe)
-    sprinted_df = get_sprinted_issues(issues_dataframe)
-    backlog_df = prepare_backlog_table_data(issues_dataframe)
-    tables = []
-    not_finished_statuses = prepare_not_finished_statuses_data(
-        versioned_df,
-    )
+    Worklogs are stored in cache directory by server and refreshed
+    incrementally: ids of worklogs updated or deleted since previous
+    sync are requested, then updated worklogs are requested in bulk.
+    Without `cache` all worklogs are requested.
 
-    # project table
-    logger.info("Generate Project table")
-    tables.append(Section(
-        H2("Project"),
-        generate_project_table(
-            versioned_df,
-            unversioned_df,
-            backlog_df,
-            **{"class": "project"},
-        ),
-    ))
+    """
+    logger.info("Get worklogs")
 
-    # statuses and assignees table
-    statuses_and_assignees_table_df = filter_data_by_statuses(
-        versioned_df,
-        not_finished_statuses,
+    path = (
+        get_cache_path(
+            WORKLOGS_CACHE_DIR,
+            f"{get_data_hash(jira_server_url)}.npz",
+            cache_dir=cache.cache_dir,
+        )
+        if cache is not None
+        else None
+    )
+    stored = load_worklogs(path) if path is not None else None
+    worklogs, since = (
+        stored
+        if stored is not None
+        else (get_worklogs_table([]), 0)
     )
-    if not statuses_and_assignees_table_df.empty:
-        # statuses table
-        tables.append(Section(
-            H2("Statuses"),
-            generate_statuses_table(
-                statuses_and_assignees_table_df,
-                not_finished_statuses,
-                **{"class": "issues"},
-            ),
-        ))
 
-        # assignees table
-        tables.append(Section(
-            H2("Assignees"),
-            generate_assignees_table(
-                statuses_and_assignees_table_df,
-                issues_dataframe.assignee.explode().unique().tolist(),
-                **{"class": "assignees"},
-            ),
-        ))
+    updated_ids, until = get_changed_worklog_ids(
+        jira_client,
+        "worklog/updated",
+        since,
+    )
+    # deletions are requested since the same time on the next sync,
+    # removing them again is harmless
+    deleted_ids = (
+        get_changed_worklog_ids(jira_client, "worklog/deleted", since)[0]
+        if stored is not None
+        else []
+    )
+    logger.info(
+        f"Collected {len(updated_ids)} updated and "
+        f"{len(deleted_ids)} deleted worklog(s)",
+    )
 
-    # prepare tabs header
-    tabs_header: list[tuple[str, int]] = [
-        ("Versions", VERSIONS_TAB_ID),
-    ]
-    for board in boards:
-        if board["sprints"]:
-            tabs_header.append((
-                board["board"].name,
-                board["board"].id,
-            ))
+    if updated_ids or deleted_ids:
+        worklogs = merge_worklogs(
+            worklogs,
+            fetch_worklogs(jira_client, updated_ids),
+            deleted_ids,
+        )
 
-    # prepare tabs content
-    tabs_content: list[tuple[str, int]] = []
+    if cache is not None:
+        if stored is not None:
+            cache.hit("worklogs")
+        else:
+            cache.miss("worklogs")
 
-    # versions tab
-    if not versioned_df.empty:
-        version_sections = []
+        if until != since:
+            save_worklogs(path, worklogs, until)
 
-        logger.info("Generate Versions table")
-        version_sections.append(Section(
+    return worklogs
+
+
+def get_changelogs(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache | None = None,
+) -> Changelogs:
+    """Get status transitions of project issues, see `Changelogs`.
+
+    Transitions are stored in cache directory by project and refreshed
+    incrementally: only issues updated since the latest stored update
+    are requested with changelog. Histories truncated by search are
+    requested per issue. Without `cache` all issues are requested.
+
+    """
+    logger.info("Get changelogs")
+
+    path = (
+        get_cache_path(
+            CHANGELOGS_CACHE_DIR,
+            f"{project_key}.npz",
+            cache_dir=cache.cache_dir,
+        )
+        if cache is not None
+        else None
+    )
+    stored = load_changelogs(path) if path is not None else None
+    jql_str = f"project={project_key} ORDER BY created DESC"
+
+    if stored is not None and stored.updated is not None:
+        if (
+            get_issues_summary(jira_client, project_key)["updated"]
+            == stored.updated
+        ):
+            cache.hit("changelogs")
+            return stored
+
+        # JQL uses user timezone, so take some extra time
+        since = format_jql_datetime(
+            parse_jira_datetime(stored.updated) - timedelta(days=1),
+        )
+        jql_str = (
+            f"project={project_key} AND updated >= \"{since}\" "
+            f"ORDER BY created DESC"
+        )
+
+    raws = list({
+        raw["id"]: raw
+        for page in iter_issues_pages(
+            jira_client,
+            jql_str,
+            fields=CHANGELOG_FIELDS,
+            expand="changelog",
+        )
+        for raw in page
+    }.values())
+
+    for raw in raws:
+        if is_changelog_truncated(raw):
+            raw["changelog"]["histories"] = get_issue_histories(
+                jira_client,
+                raw["id"],
+            )
+
+    logger.info(f"Collected changelogs of {len(raws)} issue(s)")
+    changelogs = get_changelogs_tables(raws)
+
+    if stored is not None:
+        changelogs = merge_changelogs(stored, changelogs)
+
+    if cache is not None:
+        if stored is not None:
+            cache.hit("changelogs")
+        else:
+            cache.miss("changelogs")
+
+        save_changelogs(path, changelogs)
+
+    return changelogs
+
+
+def get_board_sprints_fingerprint(
+    jira_client: JIRA,
+    board: jira.resources.Board,
+) -> list[tuple]:
+    """Get short description of board sprints for fingerprint."""
+    try:
+        sprints = jira_client.sprints(board_id=board.id, maxResults=False)
+    except Exception as e:
+        logger.debug(e)
+        sprints = []
+
+    return sorted(
+        (sprint.id, sprint.state, getattr(sprint, "endDate", ""))
+        for sprint in sprints
+    )
+
+
+def get_project_fingerprint(
+    jira_client: JIRA,
+    project_key: str,
+) -> dict[str, typing.Any]:
+    """Get fingerprint of project state.
+
+    It's cheap to request: the latest issue update time and issues
+    count, versions and sprints lists. If fingerprint is the same as
+    previous one, the report would be the same too.
+
+    """
+    logger.info(f"Get fingerprint ({project_key})")
+
+    summary = get_issues_summary(jira_client, project_key)
+    versions = [
+        (
+            version.id,
+            version.name,
+            version.archived,
+            version.released,
+            getattr(version, "startDate", ""),
+            getattr(version, "releaseDate", ""),
+        )
+        for version in jira_client.project_versions(project_key)
+    ]
+    boards = jira_client.boards(projectKeyOrID=project_key)
+
+    with ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT) as executor:
+        sprints = list(executor.map(
+            functools.partial(get_board_sprints_fingerprint, jira_client),
+            boards,
+        ))
+
+    return {
+        "issues": summary["total"],
+        "updated": summary["updated"],
+        "versions": len(versions),
+        "versions_hash": get_data_hash(versions),
+        "sprints": sum(map(len, sprints)),
+        "sprints_hash": get_data_hash([
+            (board.id, board_sprints)
+            for board, board_sprints in zip(boards, sprints)
+        ]),
+    }
+
+
+def is_project_changed(
+    jira_client: JIRA,
+    project_key: str,
+    filename: str,
+) -> tuple[bool, dict[str, typing.Any]]:
+    """Check if project was changed since report `filename` was written.
+
+    Returns check result and actual fingerprint, which should be stored
+    with `save_fingerprint` once report is written.
+
+    """
+    fingerprint = get_project_fingerprint(jira_client, project_key)
+    changed = (
+        not os.path.exists(filename)
+        or load_fingerprint(filename) != fingerprint
+    )
+
+    return changed, fingerprint
+
+
+def get_section(
+    section_cache: SectionCache | None,
+    construct: typing.Callable[[], Section],
+    *inputs,
+) -> Section | str:
+    """Construct section or reuse cached HTML if its inputs are the same.
+
+    `inputs` are everything the section depends on: issues, versions or
+    sprints in scope and rendering options.
+
+    """
+    if section_cache is None:
+        return construct()
+
+    key = get_section_hash(*inputs)
+    html = section_cache.get(key)
+
+    if html is None:
+        html = str(construct())
+        section_cache.set(key, html)
+
+    return html
+
+
+def construct_summary_tables(
+    issues_dataframe: DataFrame,
+    versioned_df: DataFrame,
+    unversioned_df: DataFrame,
+    backlog_df: DataFrame,
+    section_cache: SectionCache | None = None,
+    cube: Cube | None = None,
+    changelogs: Changelogs | None = None,
+    as_of: str | None = None,
+) -> list[Section | Div | str]:
+    """Construct Project, Statuses and Assignees tables.
+
+    Totals are taken from `cube` of all issues if it's given. With
+    issues `changelogs` Time in Status and Cycle Time tables are added
+    and Statuses table shows statuses at the end of `as_of` date.
+
+    """
+    tables = []
+    time_in_status = cycle_time = statuses_as_of = None
+    if changelogs is not None:
+        time_in_status, cycle_time, statuses_as_of = build_status_history(
+            changelogs,
+            versioned_df,
+            as_of,
+        )
+    not_finished_statuses = prepare_not_finished_statuses_data(
+        versioned_df,
+    )
+    statuses_cube = (
+        slice_statuses(slice_versioned(cube), not_finished_statuses)
+        if cube is not None
+        else None
+    )
+
+    # project table
+    logger.info("Generate Project table")
+    tables.append(get_section(
+        section_cache,
+        lambda: Section(
+            H2("Project"),
+            generate_project_table(
+                versioned_df,
+                unversioned_df,
+                backlog_df,
+                cube=cube,
+                **{"class": "project"},
+            ),
+        ),
+        "project",
+        versioned_df,
+        unversioned_df,
+        backlog_df,
+    ))
+
+    # statuses and assignees table
+    statuses_and_assignees_table_df = filter_data_by_statuses(
+        versioned_df,
+        not_finished_statuses,
+    )
+    if statuses_as_of is not None:
+        # statuses table of the past
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2(f"Statuses as of {as_of}"),
+                render_statuses_table(statuses_as_of, **{"class": "issues"}),
+            ),
+            "statuses_as_of",
+            dataclasses.asdict(statuses_as_of),
+        ))
+
+    if not statuses_and_assignees_table_df.empty:
+        # statuses table
+        if statuses_as_of is None:
+            tables.append(get_section(
+                section_cache,
+                lambda: Section(
+                    H2("Statuses"),
+                    generate_statuses_table(
+                        statuses_and_assignees_table_df,
+                        not_finished_statuses,
+                        cube=statuses_cube,
+                        **{"class": "issues"},
+                    ),
+                ),
+                "statuses",
+                statuses_and_assignees_table_df,
+                not_finished_statuses,
+            ))
+
+        # assignees table
+        assignees = issues_dataframe.assignee.explode().unique().tolist()
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Assignees"),
+                generate_assignees_table(
+                    statuses_and_assignees_table_df,
+                    assignees,
+                    cube=statuses_cube,
+                    **{"class": "assignees"},
+                ),
+            ),
+            "assignees",
+            statuses_and_assignees_table_df,
+            assignees,
+        ))
+
+    if time_in_status is not None and time_in_status.rows:
+        logger.info("Generate Time in Status table")
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Time in Status"),
+                render_time_in_status_table(
+                    time_in_status,
+                    **{"class": "durations"},
+                ),
+            ),
+            "time_in_status",
+            dataclasses.asdict(time_in_status),
+        ))
+
+    if cycle_time is not None and cycle_time.rows:
+        logger.info("Generate Cycle Time table")
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Cycle Time"),
+                render_cycle_time_table(
+                    cycle_time,
+                    **{"class": "durations"},
+                ),
+            ),
+            "cycle_time",
+            dataclasses.asdict(cycle_time),
+        ))
+
+    return tables
+
+
+def construct_versions_tab(
+    versioned_df: DataFrame,
+    unversioned_df: DataFrame,
+    versions: list,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    cube: Cube | None = None,
+) -> str:
+    """Construct content of the Versions tab."""
+    if versioned_df.empty:
+        return EMPTY_TAB_CONTENT
+
+    version_sections = []
+
+    logger.info("Generate Versions table")
+    version_sections.append(get_section(
+        section_cache,
+        lambda: Section(
             H2("Versions"),
             generate_versions_table(
                 versioned_df,
                 versions,
+                cube=slice_versioned(cube) if cube is not None else None,
                 **{"class": "versions"},
             ),
-        ))
+        ),
+        "versions",
+        versioned_df,
+        versions,
+    ))
 
-        # version components table
-        logger.info("Generate Components table")
-        for component in prepare_components_data(versioned_df):
-            version_sections.append(Section(
+    # version components table
+    logger.info("Generate Components table")
+    for component in prepare_components_data(versioned_df):
+        component_issues_df = prepare_issues_table_data(
+            versioned_df,
+            component,
+        )
+        version_sections.append(get_section(
+            section_cache,
+            lambda: Section(
                 H2(component),
                 generate_issues_table(
-                    prepare_issues_table_data(versioned_df, component),
+                    component_issues_df,
                     versions,
                     component_id=component.id,
+                    virtual=virtual,
+                    compact=compact,
                     **{"class": "component"},
                 ),
-            ))
+            ),
+            "version_component",
+            component,
+            component_issues_df,
+            versions,
+            virtual,
+            compact,
+        ))
 
-        # unversioned issues table
-        if not unversioned_df.empty:
-            logger.info("Generate Unversioned Issues table")
-            version_sections.append(Section(
+    # unversioned issues table
+    if not unversioned_df.empty:
+        logger.info("Generate Unversioned Issues table")
+        version_sections.append(get_section(
+            section_cache,
+            lambda: Section(
                 H2("Unversioned"),
                 generate_unversioned_table(
                     unversioned_df,
                     **{"class": "backlog"},
                 ),
-            ))
-
-        tabs_content.append((
-            "".join(map(str, version_sections)),
-            VERSIONS_TAB_ID,
-        ))
-    else:
-        tabs_content.append((
-            EMPTY_TAB_CONTENT,
-            VERSIONS_TAB_ID,
+            ),
+            "unversioned",
+            unversioned_df,
         ))
 
-    # boards tab
-    for board in boards:
-        board_issues_df = filter_by_board(sprinted_df, board["board"])
-        if board["sprints"] and not board_issues_df.empty:
-            board_sections = []
-            logger.info("Generate Sprints table")
-            board_sections.append(Section(
-                H2("Sprints"),
-                generate_sprints_table(
-                    board_issues_df,
+    return "".join(map(str, version_sections))
+
+
+def construct_board_tab(
+    sprinted_df: DataFrame,
+    board: dict,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    cube: Cube | None = None,
+    worklogs: DataFrame | None = None,
+) -> str:
+    """Construct content of the board tab.
+
+    Sprints table shows hours logged during sprints if `worklogs` are
+    passed.
+
+    """
+    board_issues_df = filter_by_board(sprinted_df, board["board"])
+    if not board["sprints"] or board_issues_df.empty:
+        return EMPTY_TAB_CONTENT
+
+    board_worklogs = (
+        filter_worklogs(worklogs, board_issues_df.id)
+        if worklogs is not None
+        else None
+    )
+
+    board_sections = []
+    logger.info("Generate Sprints table")
+    board_sections.append(get_section(
+        section_cache,
+        lambda: Section(
+            H2("Sprints"),
+            generate_sprints_table(
+                board_issues_df,
+                board["sprints"],
+                cube=(
+                    slice_board(cube, board["board"])
+                    if cube is not None
+                    else None
+                ),
+                worklogs=board_worklogs,
+                **{"class": "sprints"},
+            ),
+        ),
+        "sprints",
+        board_issues_df,
+        board["sprints"],
+        board_worklogs,
+    ))
+
+    logger.info("Generate Components table")
+    for component in prepare_components_data(board_issues_df):
+        component_issues_df = prepare_issues_table_data(
+            board_issues_df,
+            component,
+        )
+
+        if component_issues_df.empty:
+            continue
+
+        board_sections.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2(component),
+                generate_board_table(
+                    component_issues_df,
                     board["sprints"],
-                    **{"class": "sprints"},
+                    component_id=component.id,
+                    virtual=virtual,
+                    compact=compact,
+                    **{"class": "component"},
                 ),
-            ))
+            ),
+            "board_component",
+            component,
+            component_issues_df,
+            board["sprints"],
+            virtual,
+            compact,
+        ))
 
-            logger.info("Generate Components table")
-            for component in prepare_components_data(board_issues_df):
-                component_issues_df = prepare_issues_table_data(
-                    board_issues_df,
-                    component,
-                )
+    return "".join(map(str, board_sections))
 
-                if component_issues_df.empty:
-                    continue
 
-                board_sections.append(Section(
-                    H2(component),
-                    generate_board_table(
-                        component_issues_df,
-                        board["sprints"],
-                        component_id=component.id,
-                        **{"class": "component"},
-                    ),
-                ))
-            tabs_content.append((
-                "".join(map(str, board_sections)),
-                board["board"].id,
-            ))
-        else:
-            tabs_content.append((
-                EMPTY_TAB_CONTENT,
+def construct_tabs(
+    versions_tab_content: str,
+    boards: list,
+    boards_tabs_content: list[str],
+) -> Div:
+    """Wrap Versions and boards tabs content."""
+    # prepare tabs header
+    tabs_header: list[tuple[str, int]] = [
+        ("Versions", VERSIONS_TAB_ID),
+    ]
+    for board in boards:
+        if board["sprints"]:
+            tabs_header.append((
+                board["board"].name,
                 board["board"].id,
             ))
 
-    tables.append(
-        wrap_with_tabs(
-            tabs_header,
-            tabs_content,
-        ),
+    # prepare tabs content
+    tabs_content: list[tuple[str, int]] = [
+        (versions_tab_content, VERSIONS_TAB_ID),
+    ]
+    for board, board_tab_content in zip(boards, boards_tabs_content):
+        tabs_content.append((board_tab_content, board["board"].id))
+
+    return wrap_with_tabs(
+        tabs_header,
+        tabs_content,
+    )
+
+
+def construct_issues_tables(
+    issues_dataframe: DataFrame,
+    backlog_df: DataFrame,
+    section_cache: SectionCache | None = None,
+    cube: Cube | None = None,
+) -> list[Section | Div | str]:
+    """Construct Epics, Stories and Backlog tables."""
+    tables = []
+    # epics and stories depend on all issues, hash them once
+    issues_hash = (
+        get_section_hash(issues_dataframe)
+        if section_cache is not None
+        else None
     )
 
     # epics table
     epics_dataframe = get_epics(issues_dataframe)
     if not epics_dataframe.empty:
         logger.info("Generate Epics table")
-        tables.append(Section(
-            H2("Epics"),
-            generate_epics_table(
-                issues_dataframe,
-                epics_dataframe,
-                **{"class": "epics"},
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Epics"),
+                generate_epics_table(
+                    issues_dataframe,
+                    epics_dataframe,
+                    cube=cube,
+                    **{"class": "epics"},
+                ),
             ),
+            "epics",
+            issues_hash,
         ))
 
     # stories table
     stories_dataframe = get_stories(issues_dataframe)
     if not stories_dataframe.empty:
         logger.info("Generate Stories table")
-        tables.append(Section(
-            H2("Stories"),
-            generate_stories_table(
-                issues_dataframe,
-                stories_dataframe,
-                **{"class": "stories"},
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Stories"),
+                generate_stories_table(
+                    issues_dataframe,
+                    stories_dataframe,
+                    cube=cube,
+                    **{"class": "stories"},
+                ),
             ),
+            "stories",
+            issues_hash,
         ))
 
     # backlog table
     if not backlog_df.empty:
         logger.info("Generate Backlog table")
-        tables.append(Section(
-            H2("Backlog"),
-            generate_backlog_table(
-                backlog_df,
-                **{"class": "backlog"},
+        tables.append(get_section(
+            section_cache,
+            lambda: Section(
+                H2("Backlog"),
+                generate_backlog_table(
+                    backlog_df,
+                    **{"class": "backlog"},
+                ),
             ),
+            "backlog",
+            backlog_df,
         ))
 
     return tables
 
 
-def get_tables(
+def construct_tables(
+    issues_dataframe: DataFrame,
+    versions: list,
+    boards: list,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    worklogs: DataFrame | None = None,
+    changelogs: Changelogs | None = None,
+    as_of: str | None = None,
+) -> list[Section | Div | str]:
+    """Construct tables from data.
+
+    With `virtual` component tables are rendered in browser on scroll,
+    with `compact` they are rendered with minimal markup. Sections with
+    unchanged inputs are taken from `section_cache` as HTML. Totals of
+    all tables are sliced from one cube of issues. Sprints tables show
+    hours logged during sprints if issues `worklogs` are passed, time
+    in status and cycle time are shown if issues `changelogs` are.
+
+    """
+    versioned_df = get_versioned_issues(issues_dataframe)
+    unversioned_df = prepare_unversioned_table_data(issues_dataframe)
+    sprinted_df = get_sprinted_issues(issues_dataframe)
+    backlog_df = prepare_backlog_table_data(issues_dataframe)
+    cube = build_cube(issues_dataframe)
+
+    tables = construct_summary_tables(
+        issues_dataframe,
+        versioned_df,
+        unversioned_df,
+        backlog_df,
+        section_cache,
+        cube,
+        changelogs,
+        as_of,
+    )
+    tables.append(construct_tabs(
+        construct_versions_tab(
+            versioned_df,
+            unversioned_df,
+            versions,
+            virtual,
+            compact,
+            section_cache,
+            cube,
+        ),
+        boards,
+        [
+            construct_board_tab(
+                sprinted_df,
+                board,
+                virtual,
+                compact,
+                section_cache,
+                cube,
+                worklogs,
+            )
+            for board in boards
+        ],
+    ))
+    tables.extend(construct_issues_tables(
+        issues_dataframe,
+        backlog_df,
+        section_cache,
+        cube,
+    ))
+
+    return tables
+
+
+def iter_boards_issues(
+    boards_results: dict[int, dict],
+) -> typing.Iterator[tuple[int, dict[str, dict]]]:
+    """Yield boards indexes with issues not found in earlier boards.
+
+    `boards_results` are results of `get_board_issues_data` by boards
+    indexes, some of them may be missing yet.
+
+    """
+    seen: set[str] = set()
+
+    for index in sorted(boards_results):
+        board_issues = {
+            issue_id: issue_data
+            for issue_id, issue_data in boards_results[index]["issues"].items()
+            if issue_id not in seen
+        }
+        seen.update(board_issues)
+
+        yield index, board_issues
+
+
+def get_tables_pipelined(
     jira_client: JIRA,
     jira_project_key: str,
     jira_server_url: str,
-) -> list[Section | Div]:
-    """Get tables."""
-    data = get_data(jira_client, jira_project_key)
-    extra_data = get_extra_data(jira_client, jira_project_key)
+    cache: ResponseCache | None = None,
+    snapshot: str | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    worklogs: bool = False,
+    changelogs: bool = False,
+    as_of: str | None = None,
+) -> list[Section | Div | str]:
+    """Get tables, overlapping Jira requests and tables construction.
 
-    logger.info("Prepare Pandas dataframe")
-    dataframe = get_dataframe(
-        data["issues"],
-        extra_data["issues"],
-        jira_server_url,
-    )
+    Issues search, worklogs and changelogs sync and boards fetching run
+    concurrently.
+    Sections which don't depend on sprints are built as soon as issues
+    are collected, every board tab is built once its sprints data
+    arrives.
 
-    return construct_tables(
-        dataframe,
-        data["versions"],
-        extra_data["boards"],
-    )
+    """
+    with ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT) as executor:
+        data_future = executor.submit(
+            get_data,
+            jira_client,
+            jira_project_key,
+            cache,
+            shard_size,
+            checkpoint,
+        )
+        worklogs_future = (
+            executor.submit(get_worklogs, jira_client, jira_server_url, cache)
+            if worklogs
+            else None
+        )
+        changelogs_future = (
+            executor.submit(
+                get_changelogs,
+                jira_client,
+                jira_project_key,
+                cache,
+            )
+            if changelogs
+            else None
+        )
+
+        logger.info(f"Connect to Jira ({jira_project_key})")
+        boards = get_boards(jira_client, jira_project_key, cache)
+        logger.info(f"Collected {len(boards)} board(s)")
+
+        board_futures: dict[Future, int] = {
+            executor.submit(
+                get_board_issues_data,
+                jira_client,
+                jira_project_key,
+                board,
+                cache,
+                checkpoint,
+            ): index
+            for index, board in enumerate(boards)
+        }
+
+        data = data_future.result()
+
+        logger.info("Prepare Pandas dataframe")
+        dataframe = get_dataframe(data["issues"], {}, jira_server_url)
+        project_worklogs = (
+            filter_worklogs(worklogs_future.result(), dataframe.id)
+            if worklogs_future is not None
+            else None
+        )
+
+        versioned_df = get_versioned_issues(dataframe)
+        unversioned_df = prepare_unversioned_table_data(dataframe)
+        backlog_df = prepare_backlog_table_data(dataframe)
+        # board tabs build cubes of their issues, sprints come later
+        cube = build_cube(dataframe)
+
+        tables = construct_summary_tables(
+            dataframe,
+            versioned_df,
+            unversioned_df,
+            backlog_df,
+            section_cache,
+            cube,
+            (
+                changelogs_future.result()
+                if changelogs_future is not None
+                else None
+            ),
+            as_of,
+        )
+        versions_tab_content = construct_versions_tab(
+            versioned_df,
+            unversioned_df,
+            data["versions"],
+            virtual,
+            compact,
+            section_cache,
+            cube,
+        )
+        issues_tables = construct_issues_tables(
+            dataframe,
+            backlog_df,
+            section_cache,
+            cube,
+        )
+
+        # board tabs are built as their sprints data arrives, tabs
+        # order is the boards one
+        boards_results: dict[int, dict] = {}
+        boards_tabs: dict[int, tuple[set, str]] = {}
+        for board_future in as_completed(board_futures):
+            boards_results[board_futures[board_future]] = (
+                board_future.result()
+            )
+
+            for index, board_issues in iter_boards_issues(boards_results):
+                # issue belongs to the first board it was found in, so
+                # tabs of later boards are rebuilt if earlier board
+                # arrived with their issues
+                if index in boards_tabs and (
+                    boards_tabs[index][0] == board_issues.keys()
+                ):
+                    continue
+
+                board_df = apply_board_data(dataframe, board_issues)
+                boards_tabs[index] = (
+                    set(board_issues),
+                    construct_board_tab(
+                        get_sprinted_issues(board_df),
+                        boards_results[index]["board"],
+                        virtual,
+                        compact,
+                        section_cache,
+                        worklogs=project_worklogs,
+                    ),
+                )
+
+        boards_data = [
+            boards_results[index]["board"]
+            for index in range(len(boards))
+        ]
+        boards_tabs_content = [
+            boards_tabs[index][1]
+            for index in range(len(boards))
+        ]
+        boards_issues = dict(collections.ChainMap(*[
+            boards_results[index]["issues"]
+            for index in range(len(boards))
+        ]))
+
+    tables.append(construct_tabs(
+        versions_tab_content,
+        boards_data,
+        boards_tabs_content,
+    ))
+    tables.extend(issues_tables)
+
+    if snapshot:
+        logger.info(f"Save snapshot to {snapshot}")
+        save_snapshot(snapshot, {
+            "project_key": jira_project_key,
+            "issues": apply_board_data(dataframe, boards_issues),
+            "versions": data["versions"],
+            "boards": boards_data,
+        })
+
+    return tables
+
+
+def get_prepared_data(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    cache: ResponseCache | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> dict[str, typing.Any]:
+    """Get issues dataframe, versions and boards ready for tables."""
+    data = get_data(
+        jira_client,
+        jira_project_key,
+        cache,
+        shard_size,
+        checkpoint,
+    )
+    extra_data = get_extra_data(
+        jira_client,
+        jira_project_key,
+        cache=cache,
+        checkpoint=checkpoint,
+    )
+
+    logger.info("Prepare Pandas dataframe")
+    dataframe = get_dataframe(
+        data["issues"],
+        extra_data["issues"],
+        jira_server_url,
+    )
+
+    return {
+        "project_key": jira_project_key,
+        "issues": dataframe,
+        "versions": data["versions"],
+        "boards": extra_data["boards"],
+    }
+
+
+def iter_raws_pages(raws: typing.Iterable[dict]) -> typing.Iterator[list]:
+    """Split raw issues into search sized pages."""
+    raws = iter(raws)
+
+    while page := list(itertools.islice(raws, SEARCH_PAGE_SIZE)):
+        yield page
+
+
+def iter_stored_project_pages(
+    jira_client: JIRA,
+    project_key: str,
+    cache: ResponseCache,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> typing.Iterator[list[dict]]:
+    """Yield raw project issues page by page storing them in cache.
+
+    Issues are stored as JSON lines in `issues` cache directory, so
+    they are read and refreshed without loading all of them: only
+    issues updated since the latest stored update are requested and
+    merged into stored ones as they are read. If issues were deleted or
+    moved, all issues are requested again, see `iter_project_pages`.
+
+    """
+    path = get_cache_path(
+        ISSUES_CACHE_DIR,
+        f"{project_key}.jsonl",
+        cache_dir=cache.cache_dir,
+    )
+    header = read_issues_header(path)
+    pages = None
+
+    if header is not None and header["updated"] is not None:
+        summary = get_issues_summary(jira_client, project_key)
+        updated_map: dict[str, dict] = {}
+
+        if (
+            summary["updated"] != header["updated"]
+            or summary["total"] != header["count"]
+        ):
+            # JQL uses user timezone, so take some extra time
+            since = format_jql_datetime(
+                parse_jira_datetime(header["updated"]) - timedelta(days=1),
+            )
+            updated_map = {
+                issue.id: issue.raw
+                for issue in search_all_issues(
+                    jira_client,
+                    f"project={project_key} AND updated >= \"{since}\" "
+                    f"ORDER BY created DESC",
+                    checkpoint=checkpoint,
+                )
+            }
+            logger.info(f"Collected {len(updated_map)} updated issue(s)")
+
+        new_raws = list(updated_map.values())
+        if updated_map:
+            stored_ids = {raw["id"] for raw in iter_stored_issues(path)}
+            new_raws = [
+                raw for raw in new_raws if raw["id"] not in stored_ids
+            ]
+
+        if summary["total"] == header["count"] + len(new_raws):
+            cache.hit("issues")
+            pages = iter_raws_pages(itertools.chain(
+                new_raws,
+                (
+                    updated_map.get(raw["id"], raw)
+                    for raw in iter_stored_issues(path)
+                ),
+            ))
+
+    if pages is None:
+        cache.miss("issues")
+        pages = iter_project_pages(
+            jira_client,
+            project_key,
+            shard_size,
+            checkpoint,
+        )
+
+    writer = IssuesWriter(path)
+    issue_ids = set()
+
+    try:
+        for page in pages:
+            page = [raw for raw in page if raw["id"] not in issue_ids]
+            issue_ids.update(raw["id"] for raw in page)
+
+            for raw in page:
+                writer.write(raw)
+
+            yield page
+    except BaseException:
+        writer.discard()
+        raise
+
+    writer.close()
+
+
+def get_prepared_data_streaming(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    cache: ResponseCache | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    work_dir: str = CHECKPOINT_DIR,
+    memory_budget: int = MEMORY_BUDGET,
+) -> dict[str, typing.Any]:
+    """Get prepared data without keeping all fetched issues in memory.
+
+    Boards are fetched first, then issues pages are converted to
+    dataframe rows and spilled to on-disk chunks in `work_dir`, data
+    has `chunks` instead of issues dataframe (see `IssueChunks`). Issues
+    are stored in cache page by page too, see
+    `iter_stored_project_pages`.
+
+    """
+    extra_data = get_extra_data(
+        jira_client,
+        jira_project_key,
+        cache=cache,
+        checkpoint=checkpoint,
+    )
+    versions = get_versions(jira_client, jira_project_key, cache)
+
+    os.makedirs(work_dir, exist_ok=True)
+    chunks = IssueChunks(
+        os.path.join(work_dir, f"{jira_project_key}.{os.getpid()}.arrow"),
+        memory_budget,
+    )
+    pages = (
+        iter_stored_project_pages(
+            jira_client,
+            jira_project_key,
+            cache,
+            shard_size,
+            checkpoint,
+        )
+        if cache is not None
+        else iter_project_pages(
+            jira_client,
+            jira_project_key,
+            shard_size,
+            checkpoint,
+        )
+    )
+
+    try:
+        issue_ids = set()
+        for page in pages:
+            raws = [raw for raw in page if raw["id"] not in issue_ids]
+            issue_ids.update(raw["id"] for raw in raws)
+
+            chunks.append(get_dataframe(
+                load_resources(jira_client, jira.resources.Issue, raws),
+                extra_data["issues"],
+                jira_server_url,
+            ))
+
+        chunks.close()
+    except BaseException:
+        chunks.remove()
+        raise
+
+    logger.info(f"Spilled {chunks.rows} issue(s) to {chunks.path}")
+
+    return {
+        "project_key": jira_project_key,
+        "chunks": chunks,
+        "versions": versions,
+        "boards": extra_data["boards"],
+    }
+
+
+def plan_chunked_tables(
+    chunks: IssueChunks,
+    boards: list,
+    board_issue_ids: bool = False,
+) -> dict[str, typing.Any]:
+    """Collect tables data from issues chunks in one pass.
+
+    Cube of all issues is merged from cubes of chunks. Rows of tables
+    listing issues (components, unversioned, backlog, epics and
+    stories) are collected as positions in chunks, so every table loads
+    only its rows with `IssueChunks.take`. Statuses, assignees and
+    components are in the same order as if they were collected from
+    all issues. Ids of boards issues are collected with
+    `board_issue_ids`.
+
+    """
+    cubes = []
+    rows: collections.defaultdict[
+        tuple,
+        dict[int, numpy.ndarray],
+    ] = collections.defaultdict(dict)
+    components: collections.defaultdict[
+        tuple,
+        dict[typing.Any, None],
+    ] = collections.defaultdict(dict)
+    assignees: dict[typing.Any, None] = {}
+    statuses: dict[typing.Any, tuple] = {}
+    boards_ids: dict[int, list[str]] = {
+        board["board"].id: [] for board in boards
+    }
+
+    def _add(key: tuple, index: int, df: DataFrame):
+        if not df.empty:
+            rows[key][index] = df.index.to_numpy()
+
+    def _add_components(tab: tuple, index: int, df: DataFrame):
+        for component in prepare_components_data(df):
+            components[tab][component] = None
+            _add(
+                (*tab, component),
+                index,
+                prepare_issues_table_data(df, component),
+            )
+
+    for index, chunk in enumerate(chunks.iter_frames()):
+        cubes.append(build_cube(chunk))
+        assignees.update(dict.fromkeys(
+            chunk.assignee.explode().unique().tolist(),
+        ))
+
+        # versioned issues are sorted by release date and id, statuses
+        # are ordered by the first issue they have
+        versioned_df = get_versioned_issues(chunk)
+        first_df = versioned_df.drop_duplicates("status")
+        for status, release_date, id in zip(
+            first_df.status,
+            first_df.release_date,
+            first_df.id,
+        ):
+            order = (
+                isna(release_date),
+                "" if isna(release_date) else release_date,
+                id,
+            )
+            statuses[status] = min(statuses.get(status, order), order)
+
+        _add_components(("versions",), index, versioned_df)
+        _add(("unversioned",), index, prepare_unversioned_table_data(chunk))
+        _add(("backlog",), index, prepare_backlog_table_data(chunk))
+        _add(("epics",), index, get_epics(chunk))
+        _add(("stories",), index, get_stories(chunk))
+
+        sprinted_df = get_sprinted_issues(chunk)
+        for board in boards:
+            board_issues_df = filter_by_board(sprinted_df, board["board"])
+            _add_components(
+                ("board", board["board"].id),
+                index,
+                board_issues_df,
+            )
+
+            if board_issue_ids:
+                boards_ids[board["board"].id].extend(board_issues_df.id)
+
+    return {
+        "cube": merge_cubes(cubes),
+        "rows": rows,
+        "components": {
+            tab: sorted(tab_components, key=lambda x: x.id)
+            for tab, tab_components in components.items()
+        },
+        "statuses": prepare_not_finished_statuses_data(DataFrame({
+            "status": sorted(statuses, key=statuses.__getitem__),
+        })),
+        "assignees": list(assignees),
+        "board_issue_ids": boards_ids if board_issue_ids else None,
+    }
+
+
+def construct_tables_streaming(
+    chunks: IssueChunks,
+    versions: list,
+    boards: list,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    worklogs: DataFrame | None = None,
+) -> list[str]:
+    """Construct tables from issues spilled to `chunks`.
+
+    Totals of all tables are sliced from cube merged from chunks,
+    tables listing issues load only their rows (see
+    `plan_chunked_tables`). Sections are rendered to HTML at once, so
+    issues of one table only are kept in memory. Sprints tables show
+    hours logged during sprints if issues `worklogs` are passed.
+
+    """
+    logger.info("Aggregate issues chunks")
+    plan = plan_chunked_tables(chunks, boards, worklogs is not None)
+    cube = plan["cube"]
+    versioned = slice_versioned(cube)
+    statuses = slice_statuses(versioned, plan["statuses"])
+
+    def _take(*key) -> DataFrame:
+        return chunks.take(plan["rows"].get(key, {}))
+
+    def _section(construct, *inputs) -> str:
+        return str(get_section(section_cache, construct, *inputs))
+
+    # summary tables
+    logger.info("Generate Project table")
+    tables = [_section(
+        lambda: Section(
+            H2("Project"),
+            render_project_table(
+                build_project_totals(
+                    versioned,
+                    slice_unversioned(cube),
+                    slice_backlog(cube),
+                ),
+                **{"class": "project"},
+            ),
+        ),
+        "project",
+        cube.cells,
+    )]
+
+    if not statuses.empty:
+        tables.append(_section(
+            lambda: Section(
+                H2("Statuses"),
+                render_statuses_table(
+                    build_statuses_matrix(statuses, plan["statuses"]),
+                    **{"class": "issues"},
+                ),
+            ),
+            "statuses",
+            statuses.cells,
+            plan["statuses"],
+        ))
+        tables.append(_section(
+            lambda: Section(
+                H2("Assignees"),
+                render_assignees_table(
+                    build_assignees_matrix(statuses, plan["assignees"]),
+                    **{"class": "assignees"},
+                ),
+            ),
+            "assignees",
+            statuses.cells,
+            plan["assignees"],
+        ))
+
+    # versions tab
+    versions_sections = []
+    if not versioned.empty:
+        logger.info("Generate Versions table")
+        versions_sections.append(_section(
+            lambda: Section(
+                H2("Versions"),
+                render_versions_table(
+                    build_versions_timeline(versioned, versions),
+                    **{"class": "versions"},
+                ),
+            ),
+            "versions",
+            versioned.cells,
+            versions,
+        ))
+
+        logger.info("Generate Components table")
+        for component in plan["components"].get(("versions",), []):
+            component_issues_df = prepare_issues_table_data(
+                get_versioned_issues(_take("versions", component)),
+                component,
+            )
+            versions_sections.append(_section(
+                lambda: Section(
+                    H2(component),
+                    generate_issues_table(
+                        component_issues_df,
+                        versions,
+                        component_id=component.id,
+                        virtual=virtual,
+                        compact=compact,
+                        **{"class": "component"},
+                    ),
+                ),
+                "version_component",
+                component,
+                component_issues_df,
+                versions,
+                virtual,
+                compact,
+            ))
+
+        unversioned_df = prepare_unversioned_table_data(_take("unversioned"))
+        if not unversioned_df.empty:
+            logger.info("Generate Unversioned Issues table")
+            versions_sections.append(_section(
+                lambda: Section(
+                    H2("Unversioned"),
+                    generate_unversioned_table(
+                        unversioned_df,
+                        **{"class": "backlog"},
+                    ),
+                ),
+                "unversioned",
+                unversioned_df,
+            ))
+
+    # boards tabs
+    boards_tabs_content = []
+    for board in boards:
+        board_cube = slice_board(cube, board["board"])
+        if not board["sprints"] or board_cube.empty:
+            boards_tabs_content.append(EMPTY_TAB_CONTENT)
+            continue
+
+        board_worklogs = (
+            filter_worklogs(
+                worklogs,
+                plan["board_issue_ids"][board["board"].id],
+            )
+            if worklogs is not None
+            else None
+        )
+
+        logger.info("Generate Sprints table")
+        board_sections = [_section(
+            lambda: Section(
+                H2("Sprints"),
+                render_sprints_table(
+                    build_sprints_timeline(
+                        board_cube,
+                        board["sprints"],
+                        board_worklogs,
+                    ),
+                    **{"class": "sprints"},
+                ),
+            ),
+            "sprints",
+            board_cube.cells,
+            board["sprints"],
+            board_worklogs,
+        )]
+
+        logger.info("Generate Components table")
+        tab = ("board", board["board"].id)
+        for component in plan["components"].get(tab, []):
+            component_issues_df = prepare_issues_table_data(
+                get_sprinted_issues(_take(*tab, component)),
+                component,
+            )
+            board_sections.append(_section(
+                lambda: Section(
+                    H2(component),
+                    generate_board_table(
+                        component_issues_df,
+                        board["sprints"],
+                        component_id=component.id,
+                        virtual=virtual,
+                        compact=compact,
+                        **{"class": "component"},
+                    ),
+                ),
+                "board_component",
+                component,
+                component_issues_df,
+                board["sprints"],
+                virtual,
+                compact,
+            ))
+
+        boards_tabs_content.append("".join(board_sections))
+
+    tables.append(construct_tabs(
+        "".join(versions_sections) or EMPTY_TAB_CONTENT,
+        boards,
+        boards_tabs_content,
+    ))
+
+    # issues tables
+    epics_dataframe = get_epics(_take("epics"))
+    if not epics_dataframe.empty:
+        logger.info("Generate Epics table")
+        tables.append(_section(
+            lambda: Section(
+                H2("Epics"),
+                render_epics_table(
+                    build_rollup(cube, epics_dataframe),
+                    **{"class": "epics"},
+                ),
+            ),
+            "epics",
+            cube.cells,
+            epics_dataframe,
+        ))
+
+    stories_dataframe = get_stories(_take("stories"))
+    if not stories_dataframe.empty:
+        logger.info("Generate Stories table")
+        tables.append(_section(
+            lambda: Section(
+                H2("Stories"),
+                render_stories_table(
+                    build_rollup(cube, stories_dataframe),
+                    **{"class": "stories"},
+                ),
+            ),
+            "stories",
+            cube.cells,
+            stories_dataframe,
+        ))
+
+    backlog_df = prepare_backlog_table_data(_take("backlog"))
+    if not backlog_df.empty:
+        logger.info("Generate Backlog table")
+        tables.append(_section(
+            lambda: Section(
+                H2("Backlog"),
+                generate_backlog_table(
+                    backlog_df,
+                    **{"class": "backlog"},
+                ),
+            ),
+            "backlog",
+            backlog_df,
+        ))
+
+    return tables
+
+
+def fetch_prepared_data(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    cache: ResponseCache | None = None,
+    snapshot: str | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    streaming: bool = False,
+    memory_budget: int = MEMORY_BUDGET,
+    worklogs: bool = False,
+    changelogs: bool = False,
+) -> dict[str, typing.Any]:
+    """Get prepared data, optionally saving it to `snapshot`.
+
+    With `worklogs` and `changelogs` issues worklogs and changelogs are
+    added to data, they aren't saved to snapshot. With `streaming` data
+    has issues `chunks` instead of dataframe, worklogs are not filtered
+    by project issues then and changelogs are not supported.
+
+    """
+    if streaming and changelogs:
+        raise ValueError("changelogs are not supported in streaming mode")
+
+    if streaming:
+        data = get_prepared_data_streaming(
+            jira_client,
+            jira_project_key,
+            jira_server_url,
+            cache=cache,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+            memory_budget=memory_budget,
+        )
+    else:
+        data = get_prepared_data(
+            jira_client,
+            jira_project_key,
+            jira_server_url,
+            cache=cache,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+        )
+
+    if worklogs:
+        data["worklogs"] = get_worklogs(jira_client, jira_server_url, cache)
+
+        if "issues" in data:
+            data["worklogs"] = filter_worklogs(
+                data["worklogs"],
+                data["issues"].id,
+            )
+
+    if changelogs:
+        data["changelogs"] = get_changelogs(
+            jira_client,
+            jira_project_key,
+            cache,
+        )
+
+    if snapshot:
+        logger.info(f"Save snapshot to {snapshot}")
+        save_snapshot(snapshot, data)
+
+    return data
+
+
+def get_tables(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    pipelined: bool = False,
+    cache: ResponseCache | None = None,
+    snapshot: str | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    streaming: bool = False,
+    memory_budget: int = MEMORY_BUDGET,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+    worklogs: bool = False,
+    changelogs: bool = False,
+    as_of: str | None = None,
+) -> list[Section | Div | str]:
+    """Get tables.
+
+    Pass `cache` to store rarely changed Jira responses on disk,
+    `section_cache` to reuse sections rendered by previous runs,
+    `snapshot` to save prepared data for `get_tables_from_snapshot`,
+    `shard_size` to search issues of big projects by parts,
+    `checkpoint` to resume interrupted fetch, `streaming` to spill
+    fetched issues to disk and build tables chunk by chunk (`pipelined`
+    and `changelogs` are not supported then),
+    `virtual` to render component tables in browser on scroll,
+    `compact` to render them with minimal markup, `worklogs` to
+    show hours logged during sprints and `changelogs` to show time in
+    status and cycle time (Statuses table shows statuses at the end of
+    `as_of` date with them).
+
+    """
+    if streaming and (pipelined or changelogs):
+        raise ValueError(
+            "pipelined fetch and changelogs are not supported in "
+            "streaming mode",
+        )
+
+    if streaming:
+        data = fetch_prepared_data(
+            jira_client,
+            jira_project_key,
+            jira_server_url,
+            cache=cache,
+            snapshot=snapshot,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+            streaming=streaming,
+            memory_budget=memory_budget,
+            worklogs=worklogs,
+        )
+        try:
+            tables = construct_tables_streaming(
+                data["chunks"],
+                data["versions"],
+                data["boards"],
+                virtual,
+                compact,
+                section_cache,
+                data.get("worklogs"),
+            )
+        finally:
+            data["chunks"].remove()
+    elif pipelined:
+        tables = get_tables_pipelined(
+            jira_client,
+            jira_project_key,
+            jira_server_url,
+            cache=cache,
+            snapshot=snapshot,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+            virtual=virtual,
+            compact=compact,
+            section_cache=section_cache,
+            worklogs=worklogs,
+            changelogs=changelogs,
+            as_of=as_of,
+        )
+    else:
+        data = fetch_prepared_data(
+            jira_client,
+            jira_project_key,
+            jira_server_url,
+            cache=cache,
+            snapshot=snapshot,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+            worklogs=worklogs,
+            changelogs=changelogs,
+        )
+        tables = construct_tables(
+            data["issues"],
+            data["versions"],
+            data["boards"],
+            virtual,
+            compact,
+            section_cache,
+            data.get("worklogs"),
+            data.get("changelogs"),
+            as_of,
+        )
+
+    flush_cache(cache)
+
+    flush_section_cache(section_cache)
+
+    return tables
+
+
+def flush_cache(
+    cache: ResponseCache | None,
+    since: float | None = None,
+) -> None:
+    """Log cache hit/miss statistics and remove stale entries.
+
+    Entries used since `since` timestamp are kept, see
+    `ResponseCache.evict`.
+
+    """
+    if cache is None:
+        return
+
+    logger.info(f"Cache: {cache.get_stats()}")
+    cache.evict(since)
+
+
+def flush_section_cache(
+    section_cache: SectionCache | None,
+    since: float | None = None,
+) -> None:
+    """Log section cache hit ratio and remove stale sections.
+
+    Sections used since `since` timestamp are kept, see
+    `SectionCache.evict`.
+
+    """
+    if section_cache is None:
+        return
+
+    logger.info(f"Section cache: {section_cache.get_stats()}")
+    section_cache.evict(since)
+
+
+def get_report_model(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    cache: ResponseCache | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    worklogs: bool = False,
+    changelogs: bool = False,
+    as_of: str | None = None,
+) -> ReportModel:
+    """Get report data without rendering HTML, see `model.ReportModel`.
+
+    With `worklogs` hours logged by sprints and weeks are added, with
+    `changelogs` -- time in status and cycle time of issues and
+    statuses at the end of `as_of` date.
+
+    """
+    data = fetch_prepared_data(
+        jira_client,
+        jira_project_key,
+        jira_server_url,
+        cache=cache,
+        shard_size=shard_size,
+        checkpoint=checkpoint,
+        worklogs=worklogs,
+        changelogs=changelogs,
+    )
+
+    flush_cache(cache)
+
+    return build_report_model(
+        data["issues"],
+        data["versions"],
+        data["boards"],
+        worklogs=data.get("worklogs"),
+        changelogs=data.get("changelogs"),
+        as_of=as_of,
+    )
+
+
+def export_project(
+    jira_client: JIRA,
+    jira_project_key: str,
+    jira_server_url: str,
+    filename: str,
+    export_format: str,
+    cache: ResponseCache | None = None,
+    snapshot: str | None = None,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    worklogs: bool = False,
+    changelogs: bool = False,
+    as_of: str | None = None,
+) -> None:
+    """Export report aggregates to csv, json or xlsx without HTML.
+
+    Options are the same as of `get_tables`, streaming mode is not
+    supported.
+
+    """
+    data = fetch_prepared_data(
+        jira_client,
+        jira_project_key,
+        jira_server_url,
+        cache=cache,
+        snapshot=snapshot,
+        shard_size=shard_size,
+        checkpoint=checkpoint,
+        worklogs=worklogs,
+        changelogs=changelogs,
+    )
+
+    flush_cache(cache)
+
+    logger.info(f"Export {export_format} to {filename}")
+    export_report(data, filename, export_format, as_of)
+
+
+def export_snapshot(snapshot: str, filename: str, export_format: str) -> None:
+    """Export aggregates of data saved with `get_tables(snapshot=...)`."""
+    logger.info(f"Load snapshot from {snapshot}")
+    export_report(load_snapshot(snapshot), filename, export_format)
+
+
+def get_tables_from_snapshot(
+    snapshot: str,
+    virtual: bool = False,
+    compact: bool = False,
+    section_cache: SectionCache | None = None,
+) -> list[Section | Div | str]:
+    """Get tables from data saved with `get_tables(snapshot=...)`."""
+    logger.info(f"Load snapshot from {snapshot}")
+    data = load_snapshot(snapshot)
+
+    tables = construct_tables(
+        data["issues"],
+        data["versions"],
+        data["boards"],
+        virtual,
+        compact,
+        section_cache,
+    )
+    flush_section_cache(section_cache)
+
+    return tables
@@ -0,0 +1,350 @@
+import dataclasses
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+import jira.resources
+import numpy as np
+import pandas
+from jira import JIRA
+from pandas import DataFrame
+
+from .utils.formatters import parse_jira_datetime
+from .worklogs import get_datetimes
+
+# fields of issues requested with changelog
+CHANGELOG_FIELDS = ["created", "updated", "status"]
+# histories per `issue/{id}/changelog` request, maximum allowed by Jira
+HISTORIES_PAGE_SIZE = 100
+SECONDS_IN_DAY = 24 * 60 * 60
+
+
+@dataclasses.dataclass(slots=True)
+class Changelogs:
+    """Status transitions of project issues.
+
+    `issues` are issue `id` and `created` time, `transitions` are
+    `issue_id`, `time`, `from_status` and `to_status` ids ordered by
+    time, times are naive UTC. `statuses` are names of statuses ids,
+    `updated` is the latest update of synced issues.
+
+    """
+
+    issues: DataFrame
+    transitions: DataFrame
+    statuses: dict[str, str]
+    updated: str | None = None
+
+
+def get_status_changes(raw: dict) -> list[dict]:
+    """Returns status items of raw issue histories with their time."""
+    return [
+        {**item, "created": history["created"]}
+        for history in raw.get("changelog", {}).get("histories", [])
+        for item in history["items"]
+        if item.get("field") == "status"
+    ]
+
+
+def is_changelog_truncated(raw: dict) -> bool:
+    """Check if search returned only part of issue histories."""
+    changelog = raw.get("changelog", {})
+    return changelog.get("total", 0) > len(changelog.get("histories", []))
+
+
+def get_issue_histories(jira_client: JIRA, issue_id: str) -> list[dict]:
+    """Get all histories of issue page by page."""
+    histories = []
+
+    while True:
+        page = jira_client._get_json(
+            f"issue/{issue_id}/changelog",
+            params={
+                "startAt": len(histories),
+                "maxResults": HISTORIES_PAGE_SIZE,
+            },
+        )
+        histories.extend(page["values"])
+
+        if (
+            page.get("isLast", True)
+            or not page["values"]
+            or len(histories) >= page["total"]
+        ):
+            return histories
+
+
+def get_changelogs_tables(raws: list[dict]) -> Changelogs:
+    """Returns changelogs of raw issues requested with changelog."""
+    changes = [
+        (raw["id"], change)
+        for raw in raws
+        for change in get_status_changes(raw)
+    ]
+    statuses = {
+        id: name
+        for _, change in changes
+        for id, name in (
+            (change["from"], change["fromString"]),
+            (change["to"], change["toString"]),
+        )
+    }
+    transitions = DataFrame({
+        "issue_id": np.array([id for id, _ in changes], dtype=np.int64),
+        "time": get_datetimes([change["created"] for _, change in changes]),
+        "from_status": [change["from"] for _, change in changes],
+        "to_status": [change["to"] for _, change in changes],
+    })
+
+    return Changelogs(
+        DataFrame({
+            "id": np.array([raw["id"] for raw in raws], dtype=np.int64),
+            "created": get_datetimes(
+                [raw["fields"]["created"] for raw in raws],
+            ),
+        }),
+        transitions.sort_values(
+            ["issue_id", "time"],
+            kind="stable",
+            ignore_index=True,
+        ),
+        statuses,
+        max(
+            (raw["fields"]["updated"] for raw in raws),
+            key=parse_jira_datetime,
+            default=None,
+        ),
+    )
+
+
+def concat_tables(*tables: DataFrame) -> DataFrame:
+    """Concatenate tables, empty ones are skipped to keep dtypes."""
+    not_empty = [table for table in tables if not table.empty]
+    if len(not_empty) < 2:
+        return (not_empty or tables)[0].reset_index(drop=True)
+
+    return pandas.concat(not_empty, ignore_index=True)
+
+
+def merge_changelogs(
+    changelogs: Changelogs,
+    updated: Changelogs,
+) -> Changelogs:
+    """Replace changelogs of updated issues, their histories are full."""
+    ids = updated.issues.id
+    issues = changelogs.issues
+    transitions = changelogs.transitions
+
+    return Changelogs(
+        concat_tables(issues[~issues.id.isin(ids)], updated.issues),
+        concat_tables(
+            transitions[~transitions.issue_id.isin(ids)],
+            updated.transitions,
+        ).sort_values(
+            ["issue_id", "time"],
+            kind="stable",
+            ignore_index=True,
+        ),
+        {**changelogs.statuses, **updated.statuses},
+        max(
+            filter(None, (changelogs.updated, updated.updated)),
+            key=parse_jira_datetime,
+            default=None,
+        ),
+    )
+
+
+def load_changelogs(path: str) -> Changelogs | None:
+    """Load changelogs saved with `save_changelogs`.
+
+    Returns None if store is missing or broken.
+
+    """
+    try:
+        with np.load(path) as store:
+            statuses = store["status_ids"].tolist()
+
+            return Changelogs(
+                DataFrame({
+                    "id": store["issue_ids"],
+                    "created": store["created"],
+                }),
+                DataFrame({
+                    "issue_id": store["transition_issue_ids"],
+                    "time": store["times"],
+                    "from_status": pandas.Categorical.from_codes(
+                        store["from_codes"],
+                        statuses,
+                    ).astype(str),
+                    "to_status": pandas.Categorical.from_codes(
+                        store["to_codes"],
+                        statuses,
+                    ).astype(str),
+                }),
+                dict(zip(statuses, store["status_names"].tolist())),
+                str(store["updated"]) or None,
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_changelogs(path: str, changelogs: Changelogs) -> None:
+    """Store changelogs as numpy arrays atomically.
+
+    Statuses ids are stored once, transitions keep their codes only.
+
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    statuses = list(changelogs.statuses)
+    transitions = changelogs.transitions
+
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            issue_ids=changelogs.issues.id.to_numpy(dtype=np.int64),
+            created=changelogs.issues.created.to_numpy(
+                dtype="datetime64[s]",
+            ),
+            transition_issue_ids=transitions.issue_id.to_numpy(
+                dtype=np.int64,
+            ),
+            times=transitions.time.to_numpy(dtype="datetime64[s]"),
+            from_codes=pandas.Categorical(
+                transitions.from_status,
+                statuses,
+            ).codes,
+            to_codes=pandas.Categorical(
+                transitions.to_status,
+                statuses,
+            ).codes,
+            status_ids=np.array(statuses, dtype=str),
+            status_names=np.array(
+                list(changelogs.statuses.values()),
+                dtype=str,
+            ),
+            updated=np.array(changelogs.updated or ""),
+        )
+
+    os.replace(tmp_path, path)
+
+
+def get_as_of_time(as_of: str | None = None) -> np.datetime64:
+    """Returns end of `as_of` date or current time, naive UTC."""
+    if as_of is None:
+        return np.datetime64(
+            datetime.now(timezone.utc).replace(tzinfo=None),
+            "s",
+        )
+
+    return np.datetime64(date.fromisoformat(as_of) + timedelta(days=1), "s")
+
+
+def get_status_intervals(
+    changelogs: Changelogs,
+    issues_dataframe: DataFrame,
+    as_of: np.datetime64,
+) -> DataFrame:
+    """Returns intervals issues spent in statuses until `as_of`.
+
+    Issue is in status before its first transition since creation, or
+    in its current status if it has no transitions. Every transition
+    starts an interval which ends with the next one or at `as_of`.
+    Intervals have `issue_id`, `status`, `start`, `end` and `position`
+    in issue history. Issues created after `as_of` are skipped.
+
+    """
+    ids = issues_dataframe.id.astype(np.int64).to_numpy()
+    issues = changelogs.issues[
+        changelogs.issues.id.isin(ids)
+        & (changelogs.issues.created <= as_of)
+    ]
+    transitions = changelogs.transitions[
+        changelogs.transitions.issue_id.isin(issues.id)
+    ]
+    first_statuses = transitions.drop_duplicates("issue_id").set_index(
+        "issue_id",
+    ).from_status
+    current_statuses = pandas.Series(
+        issues_dataframe.status.map(lambda x: x.id).to_numpy(),
+        index=ids,
+    )
+    transitions = transitions[transitions.time <= as_of]
+
+    entries = pandas.concat(
+        [
+            DataFrame({
+                "issue_id": issues.id.to_numpy(),
+                "status": issues.id.map(first_statuses).fillna(
+                    issues.id.map(current_statuses),
+                ).to_numpy(),
+                "start": issues.created.to_numpy(),
+                "order": 0,
+            }),
+            DataFrame({
+                "issue_id": transitions.issue_id.to_numpy(),
+                "status": transitions.to_status.to_numpy(),
+                "start": transitions.time.to_numpy(),
+                "order": 1,
+            }),
+        ],
+        ignore_index=True,
+    ).sort_values(["issue_id", "order", "start"], kind="stable")
+
+    issue_ids = entries.issue_id.to_numpy()
+    starts = entries.start.to_numpy(dtype="datetime64[s]")
+    # interval ends with the next one of the same issue
+    last = np.append(issue_ids[1:] != issue_ids[:-1], True)
+    ends = np.where(last, as_of, np.append(starts[1:], as_of))
+
+    return DataFrame({
+        "issue_id": issue_ids,
+        "status": entries.status.to_numpy(),
+        "start": starts,
+        "end": ends,
+        "position": entries.groupby("issue_id").cumcount().to_numpy(),
+    })
+
+
+def get_durations(intervals: DataFrame) -> np.ndarray:
+    """Returns intervals durations in days."""
+    return (
+        (intervals.end - intervals.start).dt.total_seconds().to_numpy()
+        / SECONDS_IN_DAY
+    )
+
+
+def get_statuses_as_of(intervals: DataFrame) -> pandas.Series:
+    """Returns statuses ids of issues at the end of intervals."""
+    return intervals.drop_duplicates("issue_id", keep="last").set_index(
+        "issue_id",
+    ).status
+
+
+def get_issues_as_of(
+    issues_dataframe: DataFrame,
+    intervals: DataFrame,
+    statuses: dict[str, str],
+) -> DataFrame:
+    """Returns issues existing at the end of intervals with statuses
+    they had then.
+
+    Statuses missing in issues are made of changelogs names. Estimated
+    and spent hours are the current ones.
+
+    """
+    statuses_as_of = get_statuses_as_of(intervals)
+    ids = issues_dataframe.id.astype(np.int64)
+    existing = ids.isin(statuses_as_of.index)
+    df = issues_dataframe[existing]
+    resources = {status.id: status for status in df.status.tolist()}
+
+    for id in set(statuses_as_of.unique()) - set(resources):
+        resources[id] = jira.resources.Status(
+            None,
+            None,
+            raw={"id": id, "name": statuses.get(id, id)},
+        )
+
+    return df.assign(
+        status=ids[existing].map(statuses_as_of).map(resources),
+    )
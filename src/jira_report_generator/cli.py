@@ -1,28 +1,133 @@
 import argparse
+import functools
+import hashlib
 import logging
+import multiprocessing
 import os
 import sys
+import threading
+import time
+import typing
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from datetime import date
 
 from decouple import config
-from jinja2 import Environment, FileSystemLoader
-from jira import JIRA
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from .constants import (
+    CACHE_DIR,
+    CHECKPOINT_DIR,
+    DEFAULT_MAX_AGE,
+    EXPORT_FORMATS,
+    MAX_THREADS_COUNT,
+    MEMORY_BUDGET,
+)
+from .utils.cache import ResponseCache, SectionCache, save_fingerprint
+from .utils.checkpoint import Checkpoint
+from .utils.minify import minify_css, minify_js
+from .utils.tabs import Tabs, wrap_tab_page, wrap_with_tabs
+from .utils.tags import IFrame, Table
+from .work_queue import (
+    DEFAULT_LEASE_TIMEOUT,
+    WorkQueue,
+    get_work_queue,
+    get_worker_id,
+)
 
-from .app import get_tables
-from .utils.data import render_template
-from .utils.tags import Table
+if typing.TYPE_CHECKING:
+    from jira import JIRA
 
-SERVER_URL = str(config("SERVER_URL"))
-EMAIL = str(config("EMAIL"))
-API_TOKEN = str(config("API_TOKEN"))
 OUTPUT_DIR = ".output"
+TEMPLATES_CACHE_DIR = os.path.join(CACHE_DIR, "templates")
+ASSETS_DIR = "assets"
+ASSETS = ("style.css", "script.js")
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+SPLIT_INDEX_FILENAME = "index.html"
+SPLIT_VERSIONS_FILENAME = "versions.html"
 
 parser = argparse.ArgumentParser()
-parser.add_argument("key", type=str, help="JIRA project key")
+parser.add_argument("key", type=str, nargs="*", help="JIRA project key(s)")
 parser.add_argument(
     "-o",
     "--output",
     type=str,
-    help="output filename",
+    help="output filename (output directory for several projects)",
+)
+parser.add_argument(
+    "--projects-file",
+    type=str,
+    help="file with JIRA project keys, one per line",
+)
+parser.add_argument(
+    "--concurrency",
+    type=int,
+    default=MAX_THREADS_COUNT,
+    help="how many projects are fetched at once",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=os.cpu_count(),
+    help="how many processes render reports at once",
+)
+parser.add_argument(
+    "--serve",
+    help="serve reports over HTTP at /report/<KEY>",
+    action='store_true',
+)
+parser.add_argument(
+    "--host",
+    type=str,
+    default="127.0.0.1",
+    help="host to serve reports on",
+)
+parser.add_argument(
+    "--port",
+    type=int,
+    default=8000,
+    help="port to serve reports on",
+)
+parser.add_argument(
+    "--max-age",
+    type=int,
+    default=DEFAULT_MAX_AGE,
+    help="seconds before served report is refreshed in background",
+)
+parser.add_argument(
+    "--queue",
+    type=str,
+    help="work queue: SQLite file path or sqlite:///path",
+)
+parser.add_argument(
+    "--enqueue",
+    help="add projects to work queue",
+    action='store_true',
+)
+parser.add_argument(
+    "--worker",
+    help="generate reports for projects from work queue",
+    action='store_true',
+)
+parser.add_argument(
+    "--queue-status",
+    help="show work queue progress",
+    action='store_true',
+)
+parser.add_argument(
+    "--lease-timeout",
+    type=int,
+    default=DEFAULT_LEASE_TIMEOUT,
+    help="seconds before job of unresponsive worker is given to other",
+)
+parser.add_argument(
+    "--exit-when-empty",
+    help="stop worker when work queue is empty",
+    action='store_true',
 )
 parser.add_argument(
     "-v",
@@ -30,13 +135,124 @@ parser.add_argument(
     help="show log",
     action='store_true',
 )
-
-env = Environment(
-    loader=FileSystemLoader(
-        os.path.join(os.path.dirname(__file__), "static"),
+parser.add_argument(
+    "--pipelined",
+    help="build tables while sprints are still being fetched",
+    action='store_true',
+)
+parser.add_argument(
+    "--shard-size",
+    type=int,
+    help="search issues by creation date ranges of at most SHARD_SIZE issues",
+)
+parser.add_argument(
+    "--virtual",
+    help="render component tables in browser only when scrolled into view",
+    action='store_true',
+)
+parser.add_argument(
+    "--compact",
+    help="render component tables with minimal markup, minify report",
+    action='store_true',
+)
+parser.add_argument(
+    "--format",
+    choices=("html", *EXPORT_FORMATS),
+    default="html",
+    help=(
+        "output format: html report or export of tables aggregates "
+        "(csv files directory, newline delimited json or xlsx)"
+    ),
+)
+parser.add_argument(
+    "--worklogs",
+    help=(
+        "show hours logged during sprints periods, worklogs are synced "
+        "incrementally with bulk requests"
+    ),
+    action='store_true',
+)
+parser.add_argument(
+    "--changelogs",
+    help=(
+        "show time in status and cycle time, issues changelogs are "
+        "synced incrementally"
+    ),
+    action='store_true',
+)
+parser.add_argument(
+    "--as-of",
+    type=str,
+    help="show statuses at the end of date (YYYY-MM-DD), needs --changelogs",
+)
+parser.add_argument(
+    "--compress-sections",
+    help="embed report tables compressed, inflate them in browser",
+    action='store_true',
+)
+parser.add_argument(
+    "--split",
+    help=(
+        "write report to directory: index page with summaries and "
+        "page per tab, loaded when the tab is opened"
+    ),
+    action='store_true',
+)
+parser.add_argument(
+    "--streaming",
+    help="spill fetched issues to disk and build tables chunk by chunk",
+    action='store_true',
+)
+parser.add_argument(
+    "--memory-budget",
+    type=int,
+    default=MEMORY_BUDGET // 1024 // 1024,
+    help="MiB of issues chunks in streaming mode",
+)
+parser.add_argument(
+    "--work-dir",
+    type=str,
+    default=CHECKPOINT_DIR,
+    help="directory for fetch checkpoints to resume interrupted runs",
+)
+parser.add_argument(
+    "--checkpoint",
+    help=(
+        "store fetched search pages in --work-dir to resume interrupted "
+        "run, issues are requested page by page then"
     ),
+    action='store_true',
+)
+parser.add_argument(
+    "--no-checkpoint",
+    help="don't store fetch checkpoints (default)",
+    action='store_true',
+)
+parser.add_argument(
+    "--no-cache",
+    help=(
+        "don't use cached Jira responses and rendered sections "
+        "(issues of closed sprints are used)"
+    ),
+    action='store_true',
+)
+parser.add_argument(
+    "--snapshot",
+    type=str,
+    help="save prepared data snapshot (Arrow IPC or .parquet file)",
+)
+parser.add_argument(
+    "--from-snapshot",
+    type=str,
+    help="render report from snapshot without requests to Jira",
+)
+parser.add_argument(
+    "--if-changed",
+    help="skip report generation if project wasn't changed",
+    action='store_true',
 )
 
+
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler(stream=sys.stdout)
 formatter = logging.Formatter(fmt='[%(asctime)s: %(levelname)s] %(message)s')
@@ -45,47 +261,905 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
-def write_tables(tables: list[Table], filename: str, key: str):
-    """Write tables."""
+@functools.cache
+def get_environment() -> Environment:
+    """Returns templates environment.
+
+    Compiled templates are cached in `.cache/templates`, so big inlined
+    styles and scripts aren't compiled on every run.
+
+    """
+    os.makedirs(TEMPLATES_CACHE_DIR, exist_ok=True)
+
+    env = Environment(
+        loader=FileSystemLoader(
+            os.path.join(os.path.dirname(__file__), "static"),
+        ),
+        bytecode_cache=FileSystemBytecodeCache(TEMPLATES_CACHE_DIR),
+    )
+    env.filters.update(minify_css=minify_css, minify_js=minify_js)
+
+    return env
+
+
+def get_output_filename(
+    filename: str,
+    key: str,
+    split: bool = False,
+    extension: str = ".html",
+) -> str:
+    """Returns output filename, by default -- in output directory.
 
+    Split report is written to directory named by project key.
+
+    """
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
 
-    if not filename:
-        filename = f"{OUTPUT_DIR}/{key}.html"
+    return filename or f"{OUTPUT_DIR}/{key}{'' if split else extension}"
 
-    logger.info(f"Write to {filename}")
 
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(render_template(
+def write_assets(dirname: str, minify: bool = False) -> dict[str, str]:
+    """Write styles and scripts named by their content hash.
+
+    Assets are written once, pages of split report refer to them.
+    Returns paths relative to `dirname` by asset type.
+
+    """
+    assets = {}
+
+    for name in ASSETS:
+        env = get_environment()
+        content, *_ = env.loader.get_source(env, name)
+        stem, ext = os.path.splitext(name)
+        if minify:
+            content = MINIFIERS[ext](content)
+        content = content.encode("utf-8")
+        digest = hashlib.sha1(content).hexdigest()[:12]
+        path = f"{ASSETS_DIR}/{stem}.{digest}{ext}"
+        full_path = os.path.join(dirname, path)
+
+        if not os.path.exists(full_path):
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "wb") as f:
+                f.write(content)
+
+        assets[ext.lstrip(".")] = path
+
+    return assets
+
+
+def write_page(
+    tables: list[Table],
+    filename: str,
+    title: str,
+    assets: dict[str, str] | None = None,
+    minify: bool = False,
+    compressed: bool = False,
+):
+    """Write tables to HTML page.
+
+    Page is compressed while it's rendered if `filename` has `.gz`,
+    `.br` or `.zst` suffix.
+
+    """
+    from .utils.compression import open_output
+    from .utils.data import generate_template
+
+    with open_output(filename) as f:
+        for chunk in generate_template(
             tables,
-            key,
-            env.get_template("template.html"),
-        ))
+            title,
+            get_environment().get_template("template.html"),
+            assets,
+            minify,
+            compressed,
+        ):
+            f.write(chunk.encode("utf-8"))
 
 
-def main():
-    cli_args = parser.parse_args()
+def write_split_tables(
+    tables: list[Table],
+    dirname: str,
+    key: str,
+    minify: bool = False,
+    compressed: bool = False,
+):
+    """Write tables to directory, every tab to its own page.
+
+    Index page keeps everything except tabs content, tabs pages are
+    loaded into frames when tabs are opened. Highlights are sent to
+    frames by `script.js`.
+
+    """
+    os.makedirs(dirname, exist_ok=True)
+    assets = write_assets(dirname, minify)
+    index_tables = []
+
+    for table in tables:
+        if not isinstance(table, Tabs):
+            index_tables.append(table)
+            continue
+
+        # Versions tab goes first, its id could be the same as board's one
+        (versions_title, _), *boards_header = table.header
+        titles = {id: title for title, id in boards_header}
+        frames = []
+
+        for index, (element, id) in enumerate(table.content):
+            if index == 0:
+                page_filename = SPLIT_VERSIONS_FILENAME
+                title = versions_title
+            else:
+                page_filename = f"board-{id}.html"
+                title = titles.get(id, id)
+
+            write_page(
+                [wrap_tab_page(element, id)],
+                os.path.join(dirname, page_filename),
+                f"{key}: {title}",
+                assets,
+                compressed=compressed,
+            )
+            frames.append(
+                (IFrame(**{"src": page_filename, "class": "tab-frame"}), id),
+            )
+
+        index_tables.append(wrap_with_tabs(table.header, frames))
+
+    write_page(
+        index_tables,
+        os.path.join(dirname, SPLIT_INDEX_FILENAME),
+        key,
+        assets,
+    )
+
+
+def write_tables(
+    tables: list[Table],
+    filename: str,
+    key: str,
+    split: bool = False,
+    minify: bool = False,
+    compressed: bool = False,
+):
+    """Write tables, to directory if `split` is set.
+
+    Tables are embedded into page compressed if `compressed` is set.
+
+    """
+    filename = get_output_filename(filename, key, split)
+
+    logger.info(f"Write to {filename}")
+
+    if split:
+        write_split_tables(tables, filename, key, minify, compressed)
+    else:
+        write_page(tables, filename, key, minify=minify, compressed=compressed)
+
+
+def get_jira_client() -> tuple["JIRA", str]:
+    """Connect to Jira, returns client and server URL."""
+    from jira import JIRA
+
+    server_url = str(config("SERVER_URL"))
     jira_client = JIRA(
-        server=SERVER_URL,
-        basic_auth=(EMAIL, API_TOKEN),
+        server=server_url,
+        basic_auth=(str(config("EMAIL")), str(config("API_TOKEN"))),
         async_=True,
         async_workers=4,
     )
+    return jira_client, server_url
 
-    if cli_args.verbose:
-        logger.setLevel(logging.INFO)
+
+def get_project_keys(keys: list[str], projects_file: str | None) -> list[str]:
+    """Returns unique project keys from arguments and projects file."""
+    keys = list(keys)
+
+    if projects_file:
+        with open(projects_file, encoding="utf-8") as f:
+            keys.extend(
+                line.strip() for line in f
+                if line.strip() and not line.startswith("#")
+            )
+
+    return list(dict.fromkeys(keys))
+
+
+def fetch_project(
+    jira_client: "JIRA",
+    server_url: str,
+    key: str,
+    filename: str,
+    cache: ResponseCache | None,
+    if_changed: bool,
+    shard_size: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    memory_budget: int | None = None,
+) -> dict[str, typing.Any]:
+    """Fetch project data encoded to be passed to render process.
+
+    Data is fetched in streaming mode if `memory_budget` is set, path
+    of issues chunks is passed instead of issues then.
+
+    """
+    from .app import (
+        get_prepared_data,
+        get_prepared_data_streaming,
+        is_project_changed,
+    )
+    from .utils.snapshot import encode_data, encode_metadata
+
+    started = time.monotonic()
+    fingerprint = None
+
+    if if_changed:
+        changed, fingerprint = is_project_changed(
+            jira_client,
+            key,
+            filename,
+        )
+        if not changed:
+            return {
+                "data": None,
+                "issues": None,
+                "fingerprint": fingerprint,
+                "time": time.monotonic() - started,
+            }
+
+    if memory_budget:
+        data = get_prepared_data_streaming(
+            jira_client,
+            key,
+            server_url,
+            cache=cache,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+            memory_budget=memory_budget,
+        )
+        issues = data["chunks"].rows
+        encoded_data = {
+            "chunks": data["chunks"].path,
+            "metadata": encode_metadata(data),
+        }
+    else:
+        data = get_prepared_data(
+            jira_client,
+            key,
+            server_url,
+            cache=cache,
+            shard_size=shard_size,
+            checkpoint=checkpoint,
+        )
+        issues = len(data["issues"])
+        encoded_data = encode_data(data)
+
+    return {
+        "data": encoded_data,
+        "issues": issues,
+        "fingerprint": fingerprint,
+        "time": time.monotonic() - started,
+    }
+
+
+def render_report(
+    encoded_data: dict[str, typing.Any],
+    filename: str,
+    key: str,
+    virtual: bool = False,
+    split: bool = False,
+    compact: bool = False,
+    compressed: bool = False,
+    section_cache_dir: str | None = None,
+) -> dict[str, typing.Any]:
+    """Render and write project report in worker process.
+
+    Unchanged sections are taken from sections cache in
+    `section_cache_dir`, they are evicted by the parent process. Returns
+    spent time and section cache hits and misses. Issues chunks of data
+    fetched in streaming mode are removed.
+
+    """
+    from .app import construct_tables, construct_tables_streaming
+    from .utils.chunks import IssueChunks
+    from .utils.snapshot import decode_data, decode_metadata
+
+    started = time.monotonic()
+    section_cache = (
+        SectionCache(section_cache_dir)
+        if section_cache_dir is not None
+        else None
+    )
+
+    if "chunks" in encoded_data:
+        data = decode_metadata(encoded_data["metadata"])
+        chunks = IssueChunks(encoded_data["chunks"])
+        try:
+            tables = construct_tables_streaming(
+                chunks,
+                data["versions"],
+                data["boards"],
+                virtual,
+                compact,
+                section_cache,
+            )
+        finally:
+            chunks.remove()
+    else:
+        data = decode_data(encoded_data)
+        tables = construct_tables(
+            data["issues"],
+            data["versions"],
+            data["boards"],
+            virtual,
+            compact,
+            section_cache,
+        )
 
     write_tables(
-        get_tables(
+        tables,
+        filename,
+        key,
+        split,
+        compact,
+        compressed,
+    )
+
+    return {
+        "time": time.monotonic() - started,
+        "section_hits": section_cache.hits if section_cache else 0,
+        "section_misses": section_cache.misses if section_cache else 0,
+    }
+
+
+def run_batch(
+    jira_client: "JIRA",
+    server_url: str,
+    keys: list[str],
+    output_dir: str,
+    cache: ResponseCache | None = None,
+    if_changed: bool = False,
+    concurrency: int = MAX_THREADS_COUNT,
+    jobs: int | None = None,
+    shard_size: int | None = None,
+    work_dir: str | None = None,
+    memory_budget: int | None = None,
+    virtual: bool = False,
+    split: bool = False,
+    compact: bool = False,
+    compressed: bool = False,
+    section_cache: SectionCache | None = None,
+) -> list[dict[str, typing.Any]]:
+    """Generate reports for several projects.
+
+    Projects are fetched concurrently with shared Jira client and cache,
+    reports are rendered in worker processes as soon as data is fetched.
+    Fetch checkpoints are stored in `work_dir` if it is set, issues are
+    spilled to disk if `memory_budget` is set. Reports are written to
+    directories if `split` is set, rendered with minimal markup if
+    `compact` is set and with compressed tables if `compressed` is set.
+    Unchanged sections are taken from `section_cache` directory by
+    workers, it's evicted once all reports are rendered.
+    Returns timing summary for every project.
+
+    """
+    from .app import flush_cache, flush_section_cache
+
+    os.makedirs(output_dir, exist_ok=True)
+    summary = {
+        key: {
+            "key": key,
+            "status": "failed",
+            "issues": None,
+            "fetch": None,
+            "render": None,
+        }
+        for key in keys
+    }
+    filenames = {
+        key: os.path.join(output_dir, key if split else f"{key}.html")
+        for key in keys
+    }
+    checkpoints = {
+        key: Checkpoint(key, work_dir) if work_dir else None
+        for key in keys
+    }
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as render_executor:
+        with ThreadPoolExecutor(max_workers=concurrency) as fetch_executor:
+            fetch_futures = {
+                fetch_executor.submit(
+                    fetch_project,
+                    jira_client,
+                    server_url,
+                    key,
+                    filenames[key],
+                    cache,
+                    if_changed,
+                    shard_size,
+                    checkpoints[key],
+                    memory_budget,
+                ): key
+                for key in keys
+            }
+            render_futures = {}
+
+            for future in as_completed(fetch_futures):
+                key = fetch_futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {key}: {e}")
+                    continue
+
+                summary[key]["fetch"] = result["time"]
+
+                if result["data"] is None:
+                    logger.info(f"Project {key} wasn't changed, skip")
+                    summary[key]["status"] = "unchanged"
+                    continue
+
+                summary[key]["issues"] = result["issues"]
+                render_futures[render_executor.submit(
+                    render_report,
+                    result["data"],
+                    filenames[key],
+                    key,
+                    virtual,
+                    split,
+                    compact,
+                    compressed,
+                    section_cache.cache_dir if section_cache else None,
+                )] = (key, result["fingerprint"])
+
+        for future in as_completed(render_futures):
+            key, fingerprint = render_futures[future]
+            try:
+                rendered = future.result()
+            except Exception as e:
+                logger.error(f"Failed to render {key}: {e}")
+                continue
+
+            summary[key]["render"] = rendered["time"]
+            if section_cache is not None:
+                section_cache.hits += rendered["section_hits"]
+                section_cache.misses += rendered["section_misses"]
+
+            summary[key]["status"] = "ok"
+            if checkpoints[key] is not None:
+                checkpoints[key].clear()
+            if fingerprint is not None:
+                save_fingerprint(filenames[key], fingerprint)
+
+    flush_cache(cache)
+    # workers share sections cache directory, it's evicted once
+    flush_section_cache(section_cache)
+
+    return list(summary.values())
+
+
+def print_batch_summary(summary: list[dict[str, typing.Any]]):
+    """Print timing summary of batch run."""
+    def _format(value, ndigits=1):
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return str(round(value, ndigits))
+        return str(value)
+
+    rows = [("Project", "Status", "Issues", "Fetch, s", "Render, s")]
+    rows.extend(
+        (
+            item["key"],
+            item["status"],
+            _format(item["issues"]),
+            _format(item["fetch"]),
+            _format(item["render"]),
+        )
+        for item in summary
+    )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    for row in rows:
+        print("  ".join(
+            value.ljust(width) if i < 2 else value.rjust(width)
+            for i, (value, width) in enumerate(zip(row, widths))
+        ))
+
+
+def keep_lease(
+    queue: WorkQueue,
+    job_id: int,
+    worker_id: str,
+    lease_timeout: int,
+    stop: threading.Event,
+    lost: threading.Event,
+):
+    """Extend job lease until stopped, set `lost` if it can't be."""
+    while not stop.wait(lease_timeout / 3):
+        if not queue.extend(job_id, worker_id, lease_timeout):
+            logger.warning(f"Lease of job {job_id} is lost")
+            lost.set()
+            return
+
+
+def run_worker(
+    queue: WorkQueue,
+    jira_client: "JIRA",
+    server_url: str,
+    output_dir: str,
+    cache: ResponseCache | None = None,
+    lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    poll_interval: int = 10,
+    exit_when_empty: bool = False,
+    shard_size: int | None = None,
+    work_dir: str | None = None,
+    memory_budget: int | None = None,
+    virtual: bool = False,
+    compact: bool = False,
+    compressed: bool = False,
+    section_cache: SectionCache | None = None,
+    worklogs: bool = False,
+    changelogs: bool = False,
+    as_of: str | None = None,
+):
+    """Generate reports for projects leased from work queue."""
+    from .app import get_tables
+
+    worker_id = get_worker_id()
+    os.makedirs(output_dir, exist_ok=True)
+
+    logger.info(f"Worker {worker_id} started")
+
+    while True:
+        job = queue.lease(worker_id, lease_timeout)
+
+        if job is None:
+            if exit_when_empty:
+                return
+            time.sleep(poll_interval)
+            continue
+
+        key = job["key"]
+        logger.info(f"Generate {key} (attempt {job['attempt']})")
+
+        started = time.monotonic()
+        checkpoint = Checkpoint(key, work_dir) if work_dir else None
+        stop = threading.Event()
+        lost = threading.Event()
+        heartbeat = threading.Thread(
+            target=keep_lease,
+            args=(queue, job["id"], worker_id, lease_timeout, stop, lost),
+            daemon=True,
+        )
+        heartbeat.start()
+
+        try:
+            filename = os.path.join(output_dir, f"{key}.html")
+            tmp_filename = f"{filename}.{os.getpid()}.tmp"
+            tables = get_tables(
+                jira_client,
+                key,
+                server_url,
+                cache=cache,
+                shard_size=shard_size,
+                checkpoint=checkpoint,
+                streaming=bool(memory_budget),
+                memory_budget=memory_budget or MEMORY_BUDGET,
+                virtual=virtual,
+                compact=compact,
+                section_cache=section_cache,
+                worklogs=worklogs,
+                changelogs=changelogs,
+                as_of=as_of,
+            )
+
+            # don't expose partially written report in shared directory
+            write_tables(
+                tables,
+                tmp_filename,
+                key,
+                minify=compact,
+                compressed=compressed,
+            )
+
+            # job was leased by other worker, its report is written
+            if lost.is_set():
+                logger.warning(f"Discard {key} report, lease is lost")
+                os.remove(tmp_filename)
+                continue
+
+            os.replace(tmp_filename, filename)
+
+            if checkpoint is not None:
+                checkpoint.clear()
+        except Exception as e:
+            logger.error(f"Failed to generate {key}: {e}")
+            queue.fail(job["id"], worker_id, str(e))
+        else:
+            queue.complete(job["id"], worker_id, time.monotonic() - started)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+
+def print_queue_status(status: dict[str, typing.Any]):
+    """Print work queue progress."""
+    counts = status["counts"]
+    avg_duration = status["avg_duration"]
+
+    print(
+        f"Pending: {counts['pending']}, "
+        f"in progress: {counts['leased']} "
+        f"(workers: {status['workers']}), "
+        f"done: {counts['done']}, "
+        f"failed: {counts['failed']}",
+    )
+    print(
+        f"Throughput: {round(status['throughput'], 1)} report(s)/hour, "
+        f"average time: "
+        f"{round(avg_duration, 1) if avg_duration is not None else '-'}s",
+    )
+    for key, error in status["errors"]:
+        print(f"Failed {key}: {error}")
+
+
+def main():
+    cli_args = parser.parse_args()
+    keys = get_project_keys(cli_args.key, cli_args.projects_file)
+
+    if cli_args.verbose:
+        logging.getLogger(__package__).setLevel(logging.INFO)
+
+    cache = None if cli_args.no_cache else ResponseCache()
+    section_cache = None if cli_args.no_cache else SectionCache()
+    work_dir = (
+        cli_args.work_dir
+        if cli_args.checkpoint and not cli_args.no_checkpoint
+        else None
+    )
+    memory_budget = (
+        cli_args.memory_budget * 1024 * 1024
+        if cli_args.streaming
+        else None
+    )
+
+    if cli_args.split and (cli_args.worker or cli_args.serve):
+        parser.error("split reports are not supported by workers and server")
+
+    if cli_args.format != "html" and (
+        cli_args.worker
+        or cli_args.serve
+        or cli_args.split
+        or len(keys) > 1
+    ):
+        parser.error(
+            f"{cli_args.format} export is supported for single project "
+            "report only",
+        )
+
+    if cli_args.worklogs and (
+        cli_args.serve
+        or cli_args.from_snapshot
+        or (len(keys) > 1 and not cli_args.queue)
+    ):
+        parser.error(
+            "worklogs are supported for single project report and "
+            "workers only",
+        )
+
+    if cli_args.changelogs and (
+        cli_args.serve
+        or cli_args.from_snapshot
+        or (len(keys) > 1 and not cli_args.queue)
+    ):
+        parser.error(
+            "changelogs are supported for single project report and "
+            "workers only",
+        )
+
+    if cli_args.streaming and (
+        cli_args.format != "html"
+        or cli_args.serve
+        or cli_args.pipelined
+        or cli_args.changelogs
+    ):
+        parser.error(
+            "streaming is not supported by exports, server, pipelined "
+            "fetch and changelogs",
+        )
+
+    if cli_args.as_of is not None:
+        if not cli_args.changelogs:
+            parser.error("--as-of requires --changelogs")
+
+        try:
+            date.fromisoformat(cli_args.as_of)
+        except ValueError:
+            parser.error(f"invalid --as-of date: {cli_args.as_of}")
+
+    if cli_args.queue:
+        queue = get_work_queue(cli_args.queue)
+
+        if cli_args.enqueue:
+            added = queue.push(keys)
+            print(f"Added {added} project(s) to queue")
+
+        if cli_args.worker:
+            jira_client, server_url = get_jira_client()
+            run_worker(
+                queue,
+                jira_client,
+                server_url,
+                cli_args.output or OUTPUT_DIR,
+                cache=cache,
+                lease_timeout=cli_args.lease_timeout,
+                exit_when_empty=cli_args.exit_when_empty,
+                shard_size=cli_args.shard_size,
+                work_dir=work_dir,
+                memory_budget=memory_budget,
+                virtual=cli_args.virtual,
+                compact=cli_args.compact,
+                compressed=cli_args.compress_sections,
+                section_cache=section_cache,
+                worklogs=cli_args.worklogs,
+                changelogs=cli_args.changelogs,
+                as_of=cli_args.as_of,
+            )
+
+        if cli_args.queue_status:
+            print_queue_status(queue.get_status())
+
+        return
+
+    if cli_args.serve:
+        from .server import ReportStore, serve
+
+        jira_client, server_url = get_jira_client()
+        serve(
+            ReportStore(
+                jira_client,
+                server_url,
+                get_environment().get_template("template.html"),
+                max_age=cli_args.max_age,
+                cache=cache,
+                keys=keys,
+                section_cache=section_cache,
+            ),
+            cli_args.host,
+            cli_args.port,
+        )
+        return
+
+    if not keys:
+        parser.error("at least one JIRA project key is required")
+
+    if len(keys) > 1:
+        if cli_args.snapshot or cli_args.from_snapshot:
+            parser.error("snapshots are supported for single project only")
+
+        jira_client, server_url = get_jira_client()
+        print_batch_summary(run_batch(
             jira_client,
-            cli_args.key,
-            SERVER_URL,
-        ),
+            server_url,
+            keys,
+            cli_args.output or OUTPUT_DIR,
+            cache=cache,
+            if_changed=cli_args.if_changed,
+            concurrency=cli_args.concurrency,
+            jobs=cli_args.jobs,
+            shard_size=cli_args.shard_size,
+            work_dir=work_dir,
+            memory_budget=memory_budget,
+            virtual=cli_args.virtual,
+            split=cli_args.split,
+            compact=cli_args.compact,
+            compressed=cli_args.compress_sections,
+            section_cache=section_cache,
+        ))
+        return
+
+    from .app import (
+        export_project,
+        export_snapshot,
+        get_tables,
+        get_tables_from_snapshot,
+        is_project_changed,
+    )
+
+    key = keys[0]
+    export_format = None if cli_args.format == "html" else cli_args.format
+    filename = get_output_filename(
         cli_args.output,
-        cli_args.key,
+        key,
+        cli_args.split,
+        EXPORT_FORMATS[export_format] if export_format else ".html",
     )
 
+    if cli_args.from_snapshot and export_format:
+        export_snapshot(cli_args.from_snapshot, filename, export_format)
+        return
+
+    if cli_args.from_snapshot:
+        write_tables(
+            get_tables_from_snapshot(
+                cli_args.from_snapshot,
+                virtual=cli_args.virtual,
+                compact=cli_args.compact,
+                section_cache=section_cache,
+            ),
+            filename,
+            key,
+            cli_args.split,
+            cli_args.compact,
+            cli_args.compress_sections,
+        )
+        return
+
+    jira_client, server_url = get_jira_client()
+    checkpoint = Checkpoint(key, work_dir) if work_dir else None
+
+    if cli_args.if_changed:
+        changed, fingerprint = is_project_changed(
+            jira_client,
+            key,
+            filename,
+        )
+        if not changed:
+            logger.info(f"Project {key} wasn't changed, skip")
+            return
+
+    if export_format:
+        export_project(
+            jira_client,
+            key,
+            server_url,
+            filename,
+            export_format,
+            cache=cache,
+            snapshot=cli_args.snapshot,
+            shard_size=cli_args.shard_size,
+            checkpoint=checkpoint,
+            worklogs=cli_args.worklogs,
+            changelogs=cli_args.changelogs,
+            as_of=cli_args.as_of,
+        )
+    else:
+        write_tables(
+            get_tables(
+                jira_client,
+                key,
+                server_url,
+                pipelined=cli_args.pipelined,
+                cache=cache,
+                snapshot=cli_args.snapshot,
+                shard_size=cli_args.shard_size,
+                checkpoint=checkpoint,
+                streaming=cli_args.streaming,
+                memory_budget=memory_budget or MEMORY_BUDGET,
+                virtual=cli_args.virtual,
+                compact=cli_args.compact,
+                section_cache=section_cache,
+                worklogs=cli_args.worklogs,
+                changelogs=cli_args.changelogs,
+                as_of=cli_args.as_of,
+            ),
+            filename,
+            key,
+            cli_args.split,
+            cli_args.compact,
+            cli_args.compress_sections,
+        )
+
+    if checkpoint is not None:
+        checkpoint.clear()
+
+    if cli_args.if_changed:
+        save_fingerprint(filename, fingerprint)
+
 
 if __name__ == "__main__":
     main()
@@ -10,10 +10,49 @@ JIRA_FETCH_FIELDS = [
     "fixVersions",
     "issuetype",
     "parent",
+    "created",
+    "updated",
 ]
 
 MAX_THREADS_COUNT = 4
 
+# JQL datetime precision used for created date ranges
+SHARD_MIN_DURATION = 60  # seconds
+
+CHECKPOINT_DIR = ".checkpoints"
+CHECKPOINT_MAX_AGE = 24 * 60 * 60  # seconds
+SEARCH_PAGE_SIZE = 100
+# worklog ids per `worklog/list` request, maximum allowed by Jira
+WORKLOGS_PAGE_SIZE = 1000
+
+# fetched rows kept in memory before spilling to disk in streaming mode
+MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+
+CACHE_DIR = ".cache"
+CACHE_MAX_SIZE = 512 * 1024 * 1024  # bytes
+SECTIONS_CACHE_MAX_SIZE = 128 * 1024 * 1024  # bytes
+
+# seconds, None -- never expires
+CACHE_TTLS = {
+    "boards": 24 * 60 * 60,
+    "sprints": 60 * 60,
+    "versions": 60 * 60,
+    "issues": None,
+}
+
+# served reports older than this are refreshed in background
+DEFAULT_MAX_AGE = 15 * 60  # seconds
+# reports kept by server if project keys aren't given, least recently
+# requested ones are dropped
+SERVER_MAX_REPORTS = 20
+
+# export format -> default output suffix, csv is written to directory
+EXPORT_FORMATS = {
+    "csv": "",
+    "json": ".ndjson",
+    "xlsx": ".xlsx",
+}
+
 
 class Status(Enum):
     VERIFIED = (
@@ -49,3 +88,9 @@ class Status(Enum):
 class Type(Enum):
     EPIC = "Epic"
     STORY = "Story"
+
+
+class SprintState(Enum):
+    CLOSED = "closed"
+    ACTIVE = "active"
+    FUTURE = "future"
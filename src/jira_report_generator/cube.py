@@ -0,0 +1,314 @@
+import dataclasses
+import math
+import typing
+
+import pandas
+from pandas import DataFrame
+
+from .constants import Status
+
+DIMENSIONS = (
+    "version_id",
+    "sprint_id",
+    "board_id",
+    "component_id",
+    "status_id",
+    "assignee_id",
+    "parent_id",
+)
+# issue could have several versions and components, cells keep tuples
+# of their ids and are expanded by them on rollup only
+MULTI_VALUED = ("version_id", "component_id")
+MEASURES = ("count", "estimate", "spent")
+# dimensions with names of ids in `Cube.labels`
+LABELED = ("version_id", "component_id", "status_id")
+
+NOT_VERSIONED_STATUSES = (
+    *Status.BACKLOG.value,
+)
+
+
+@dataclasses.dataclass(slots=True)
+class Cube:
+    """Issues count, estimated and spent hours by all dimensions.
+
+    Cell is totals of issues with the same versions, sprint, board,
+    components, status, assignee and parent ids, so every issue is
+    counted once and any table is a slice and rollup of cells, see
+    `slice` and `rollup`. Unassigned issues have empty `assignee_id`.
+
+    """
+
+    cells: DataFrame
+    labels: dict[str, dict[str, str]]
+    archived_versions: frozenset[str] = frozenset()
+
+    @property
+    def empty(self) -> bool:
+        return self.cells.empty
+
+    def slice(self, **conditions: typing.Any) -> "Cube":
+        """Returns cube of cells matching all dimensions conditions.
+
+        Condition is id, collection of ids or predicate of cell value.
+        Multi valued dimension matches if any of its ids matches.
+
+        """
+        mask = pandas.Series(True, index=self.cells.index)
+
+        for dimension, condition in conditions.items():
+            mask &= self.cells[dimension].map(
+                get_matcher(dimension, condition),
+            ).astype(bool)
+
+        return dataclasses.replace(self, cells=self.cells[mask])
+
+    def rollup(self, keys: list[str]) -> DataFrame:
+        """Returns measures summed up by dimensions `keys`.
+
+        Issue is counted for every version or component it has if the
+        dimension is in `keys`, issues without them are skipped.
+
+        """
+        cells = self.cells
+
+        for key in keys:
+            if key in MULTI_VALUED:
+                cells = cells.explode(key, ignore_index=True).dropna(
+                    subset=[key],
+                )
+
+        return cells.groupby(keys, sort=False, dropna=False)[
+            list(MEASURES)
+        ].sum()
+
+    def get_names(self, dimension: str) -> list[tuple[str, str]]:
+        """Returns (id, name) of dimension values present in cube."""
+        values = self.cells[dimension]
+        if dimension in MULTI_VALUED:
+            values = values.explode()
+
+        labels = self.labels[dimension]
+
+        return [
+            (id, labels[id])
+            for id in values.dropna().unique().tolist()
+            if id in labels
+        ]
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Returns cube as JSON serializable dict."""
+        return {
+            "cells": {
+                column: [
+                    get_builtin_value(value)
+                    for value in self.cells[column].tolist()
+                ]
+                for column in self.cells.columns
+            },
+            "labels": self.labels,
+            "archived_versions": sorted(self.archived_versions),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, typing.Any]) -> "Cube":
+        """Restore cube saved with `to_dict`."""
+        cells = DataFrame(data["cells"], columns=[*DIMENSIONS, *MEASURES])
+
+        for dimension in MULTI_VALUED:
+            cells[dimension] = cells[dimension].map(tuple)
+
+        return cls(
+            cells,
+            data["labels"],
+            frozenset(data["archived_versions"]),
+        )
+
+
+def get_matcher(
+    dimension: str,
+    condition: typing.Any,
+) -> typing.Callable[[typing.Any], bool]:
+    if callable(condition):
+        return condition
+
+    values = (
+        set(condition)
+        if isinstance(condition, (list, tuple, set, frozenset))
+        else {condition}
+    )
+
+    if dimension in MULTI_VALUED:
+        return lambda ids: not values.isdisjoint(ids)
+
+    return lambda id: id in values
+
+
+def get_builtin_value(value: typing.Any) -> typing.Any:
+    """Convert cell value to JSON serializable one, NaN to None."""
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+
+    return value.item() if hasattr(value, "item") else value
+
+
+def get_id(item: typing.Any) -> typing.Any:
+    return getattr(item, "id", None)
+
+
+def get_label(item: typing.Any) -> tuple | None:
+    """Returns (id, name, archived) of Jira resource."""
+    if not hasattr(item, "id"):
+        return None
+
+    return (item.id, item.name, getattr(item, "archived", False))
+
+
+def get_labels(items: list) -> tuple:
+    return tuple(filter(None, map(get_label, items)))
+
+
+def build_cube(issues_dataframe: DataFrame) -> Cube:
+    """Group issues by all dimensions with one groupby.
+
+    Versions, components and statuses are grouped with their names,
+    which are moved to labels afterwards, so Jira resources are not
+    compared or hashed.
+
+    """
+    labels: dict[str, dict[str, str]] = {
+        dimension: {} for dimension in LABELED
+    }
+
+    if issues_dataframe.empty:
+        return Cube(DataFrame(columns=[*DIMENSIONS, *MEASURES]), labels)
+
+    df = issues_dataframe
+    columns = {
+        "version_id": df.versions.map(get_labels),
+        "sprint_id": (
+            df.sprint_id if "sprint_id" in df.columns else None
+        ),
+        "board_id": df.board_id if "board_id" in df.columns else None,
+        "component_id": df.components.map(get_labels),
+        "status_id": df.status.map(get_label),
+        "assignee_id": df.assignee.map(
+            lambda x: getattr(x, "accountId", None) or "",
+        ),
+        "parent_id": df.parent.map(get_id),
+    }
+    cells = df.assign(**columns).groupby(
+        list(DIMENSIONS),
+        sort=False,
+        dropna=False,
+    ).agg(
+        count=("id", "count"),
+        estimate=("estimate", "sum"),
+        spent=("spent", "sum"),
+    ).reset_index()
+
+    archived_versions = set()
+    for dimension in LABELED:
+        values = cells[dimension]
+        if dimension in MULTI_VALUED:
+            values = values.explode()
+
+        for id, name, archived in values.dropna().unique().tolist():
+            labels[dimension][id] = name
+
+            if archived:
+                archived_versions.add(id)
+
+    cells["status_id"] = cells.status_id.map(
+        lambda x: x[0] if isinstance(x, tuple) else None,
+    )
+    for dimension in MULTI_VALUED:
+        cells[dimension] = cells[dimension].map(
+            lambda items: tuple(id for id, _, _ in items),
+        )
+
+    return Cube(cells, labels, frozenset(archived_versions))
+
+
+def merge_cubes(cubes: list[Cube]) -> Cube:
+    """Merge cubes of issues parts, e.g. of issues dataframe chunks.
+
+    Cells with the same dimensions are summed up, so the result is the
+    same as cube of all issues.
+
+    """
+    labels: dict[str, dict[str, str]] = {
+        dimension: {} for dimension in LABELED
+    }
+    archived_versions: set[str] = set()
+
+    for cube in cubes:
+        for dimension, names in cube.labels.items():
+            labels[dimension].update(names)
+        archived_versions |= cube.archived_versions
+
+    cells = [cube.cells for cube in cubes if not cube.empty]
+    if not cells:
+        return Cube(
+            DataFrame(columns=[*DIMENSIONS, *MEASURES]),
+            labels,
+            frozenset(archived_versions),
+        )
+
+    return Cube(
+        pandas.concat(cells, ignore_index=True).groupby(
+            list(DIMENSIONS),
+            sort=False,
+            dropna=False,
+        )[list(MEASURES)].sum().reset_index(),
+        labels,
+        frozenset(archived_versions),
+    )
+
+
+def slice_versioned(cube: Cube) -> Cube:
+    """Issues with not archived versions, see `get_versioned_issues`."""
+    archived = cube.archived_versions
+
+    return cube.slice(
+        version_id=lambda ids: any(id not in archived for id in ids),
+    )
+
+
+def get_status_ids(cube: Cube, names: tuple[str, ...]) -> list[str]:
+    return [
+        id
+        for id, name in cube.labels["status_id"].items()
+        if name in names
+    ]
+
+
+def slice_unversioned(cube: Cube) -> Cube:
+    """Issues without versions which are not in backlog."""
+    backlog = set(get_status_ids(cube, NOT_VERSIONED_STATUSES))
+
+    return cube.slice(
+        version_id=lambda ids: not ids,
+        status_id=lambda id: id not in backlog,
+    )
+
+
+def slice_backlog(cube: Cube) -> Cube:
+    return cube.slice(
+        status_id=get_status_ids(cube, NOT_VERSIONED_STATUSES),
+    )
+
+
+def slice_statuses(cube: Cube, statuses: list) -> Cube:
+    """Issues with components in statuses, see `filter_data_by_statuses`."""
+    return cube.slice(
+        component_id=bool,
+        status_id=[status.id for status in statuses],
+    )
+
+
+def slice_board(cube: Cube, board: typing.Any) -> Cube:
+    """Board issues in sprints."""
+    return cube.slice(board_id=get_id(board), sprint_id=pandas.notna)
@@ -0,0 +1,425 @@
+import csv
+import io
+import json
+import math
+import os
+import typing
+
+from pandas import DataFrame
+
+from .forecast import FORECAST_PERCENTILES
+from .model import (
+    DURATION_PERCENTILES,
+    DistributionMatrix,
+    Matrix,
+    ReportModel,
+    Timeline,
+    TimelineCell,
+    Totals,
+    Weeks,
+    build_report_model,
+)
+from .utils.compression import open_output
+from .utils.data import prepare_backlog_table_data
+
+NDIGITS = 2
+SUMMARY = "Summary"
+
+# table name, columns, rows
+ExportTable = tuple[str, tuple[str, ...], typing.Iterator[tuple]]
+
+TOTALS_COLUMNS = ("count", "estimate", "spent", "left")
+TIMELINE_COLUMNS = (
+    "component",
+    "count",
+    "estimate",
+    "spent",
+    "overtime",
+    "projection",
+    *(f"p{percentile}" for percentile in FORECAST_PERCENTILES),
+)
+DISTRIBUTION_COLUMNS = (
+    "count",
+    *(f"p{percentile}" for percentile in DURATION_PERCENTILES),
+)
+ROLLUP_COLUMNS = (
+    "key",
+    "summary",
+    "status",
+    "count",
+    "testing",
+    "completed",
+    "estimate",
+    "spent",
+    "left",
+)
+
+
+def import_xlsxwriter():
+    """Import optional xlsxwriter dependency."""
+    try:
+        import xlsxwriter
+    except ImportError as e:
+        raise ImportError(
+            "XLSX export requires xlsxwriter: "
+            "pip install jira-report-generator[xlsx]",
+        ) from e
+
+    return xlsxwriter
+
+
+def get_number(value: float | None, ndigits: int = NDIGITS) -> float | None:
+    """Returns rounded number, None for missing and not finite values."""
+    if value is None or not math.isfinite(value):
+        return None
+
+    return round(value, ndigits)
+
+
+def get_totals_values(totals: Totals) -> tuple:
+    return (
+        totals.count,
+        get_number(totals.estimate),
+        get_number(totals.spent),
+        get_number(totals.left),
+    )
+
+
+def get_timeline_values(cell: TimelineCell, summary: bool = False) -> tuple:
+    # summary rows show average overtime of closed versions or sprints
+    overtime = cell.historical_overtime if summary else cell.overtime
+
+    return (
+        cell.totals.count,
+        get_number(cell.totals.estimate),
+        get_number(cell.totals.spent),
+        get_number(overtime),
+        get_number(cell.projection) if cell.historical_overtime else None,
+        *(
+            map(get_number, cell.forecast)
+            if cell.forecast
+            else [None] * len(FORECAST_PERCENTILES)
+        ),
+    )
+
+
+def iter_matrix_rows(matrix: Matrix) -> typing.Iterator[tuple]:
+    """Yield row totals followed by its components totals."""
+    rows = [*matrix.rows, *([matrix.summary] if matrix.summary else [])]
+
+    for row in rows:
+        name = row.name if row is not matrix.summary else SUMMARY
+
+        yield (name, "", *get_totals_values(row.totals))
+
+        for component in matrix.components:
+            if component.id in row.components:
+                yield (
+                    name,
+                    component.name,
+                    *get_totals_values(row.components[component.id]),
+                )
+
+
+def iter_timeline_rows(
+    timeline: Timeline,
+    logged: bool = False,
+) -> typing.Iterator[tuple]:
+    """Yield version or sprint totals followed by its components.
+
+    With `logged` sprint rows end with hours logged during sprint
+    period.
+
+    """
+    for row in [*timeline.rows, timeline.summary]:
+        summary = row is timeline.summary
+
+        yield (
+            row.name,
+            row.start_date,
+            row.end_date,
+            row.closed,
+            "",
+            *get_timeline_values(row.cell, summary),
+            *((get_number(row.logged_in_period),) if logged else ()),
+        )
+
+        for component in timeline.components:
+            if component.id in row.components:
+                yield (
+                    row.name,
+                    row.start_date,
+                    row.end_date,
+                    row.closed,
+                    component.name,
+                    *get_timeline_values(
+                        row.components[component.id],
+                        summary,
+                    ),
+                    *((None,) if logged else ()),
+                )
+
+
+def iter_weeks_rows(weeks: Weeks | None) -> typing.Iterator[tuple]:
+    """Yield week logged hours followed by its components ones."""
+    if weeks is None:
+        return
+
+    for row in weeks.rows:
+        yield (row.start, "", row.authors, get_number(row.spent))
+
+        for component in weeks.components:
+            if component.id in row.components:
+                yield (
+                    row.start,
+                    component.name,
+                    None,
+                    get_number(row.components[component.id]),
+                )
+
+
+def iter_distribution_rows(
+    matrix: DistributionMatrix | None,
+) -> typing.Iterator[tuple]:
+    """Yield row days percentiles followed by its components ones."""
+    if matrix is None:
+        return
+
+    rows = [*matrix.rows, *([matrix.summary] if matrix.summary else [])]
+
+    for row in rows:
+        name = row.name if row is not matrix.summary else SUMMARY
+
+        for component, distribution in [
+            ("", row.total),
+            *(
+                (component.name, row.components[component.id])
+                for component in matrix.components
+                if component.id in row.components
+            ),
+        ]:
+            yield (
+                name,
+                component,
+                distribution.count,
+                *map(get_number, distribution.percentiles),
+            )
+
+
+def iter_backlog_rows(backlog_df: DataFrame) -> typing.Iterator[tuple]:
+    for item in backlog_df.itertuples():
+        yield (
+            item.key,
+            item.summary,
+            str(item.type),
+            item.status.name,
+            getattr(item.assignee, "displayName", ""),
+            ", ".join(component.name for component in item.components),
+            get_number(item.spent),
+        )
+
+
+def get_export_tables(
+    model: ReportModel,
+    backlog_df: DataFrame,
+) -> list[ExportTable]:
+    """Returns tables of report aggregates, rows are generated lazily."""
+    project = model.project
+
+    return [
+        (
+            "project",
+            ("issues", *TOTALS_COLUMNS),
+            iter([
+                (name, *get_totals_values(totals))
+                for name, totals in (
+                    ("Versioned", project.versioned),
+                    ("Unversioned", project.unversioned),
+                    ("Backlog", project.backlog),
+                    (SUMMARY, project.summary),
+                )
+            ]),
+        ),
+        (
+            "statuses",
+            ("status", "component", *TOTALS_COLUMNS),
+            iter_matrix_rows(model.statuses),
+        ),
+        (
+            "assignees",
+            ("assignee", "component", *TOTALS_COLUMNS),
+            iter_matrix_rows(model.assignees),
+        ),
+        (
+            "versions",
+            (
+                "version",
+                "start_date",
+                "release_date",
+                "released",
+                *TIMELINE_COLUMNS,
+            ),
+            iter_timeline_rows(model.versions),
+        ),
+        (
+            "sprints",
+            (
+                "board",
+                "sprint",
+                "start_date",
+                "end_date",
+                "closed",
+                *TIMELINE_COLUMNS,
+                "logged_in_period",
+            ),
+            (
+                (board.name, *row)
+                for board in model.boards
+                for row in iter_timeline_rows(board.sprints, logged=True)
+            ),
+        ),
+        *[
+            (
+                name,
+                ROLLUP_COLUMNS,
+                (
+                    (
+                        row.key,
+                        row.summary,
+                        row.status,
+                        row.totals.count,
+                        row.testing,
+                        row.completed,
+                        *get_totals_values(row.totals)[1:],
+                    )
+                    for row in rows
+                ),
+            )
+            for name, rows in (
+                ("epics", model.epics),
+                ("stories", model.stories),
+            )
+        ],
+        (
+            "weeks",
+            ("week", "component", "authors", "spent"),
+            iter_weeks_rows(model.weeks),
+        ),
+        (
+            "time_in_status",
+            ("status", "component", *DISTRIBUTION_COLUMNS),
+            iter_distribution_rows(model.time_in_status),
+        ),
+        (
+            "cycle_time",
+            ("assignee", "component", *DISTRIBUTION_COLUMNS),
+            iter_distribution_rows(model.cycle_time),
+        ),
+        (
+            "backlog",
+            (
+                "key",
+                "summary",
+                "type",
+                "status",
+                "assignee",
+                "components",
+                "spent",
+            ),
+            iter_backlog_rows(backlog_df),
+        ),
+    ]
+
+
+def write_csv(tables: list[ExportTable], dirname: str):
+    """Write every table to own CSV file in directory."""
+    os.makedirs(dirname, exist_ok=True)
+
+    for name, columns, rows in tables:
+        with open(
+            os.path.join(dirname, f"{name}.csv"),
+            "w",
+            encoding="utf-8",
+            newline="",
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+
+def write_ndjson(tables: list[ExportTable], filename: str):
+    """Write rows of all tables as JSON lines with `table` field.
+
+    Output is compressed according to `filename` suffix.
+
+    """
+    with open_output(filename) as output, io.TextIOWrapper(
+        output,
+        encoding="utf-8",
+        newline="\n",
+    ) as f:
+        for name, columns, rows in tables:
+            for row in rows:
+                f.write(json.dumps({"table": name, **dict(zip(columns, row))}))
+                f.write("\n")
+
+
+def write_xlsx(tables: list[ExportTable], filename: str):
+    """Write every table to own worksheet.
+
+    Rows are flushed to disk as they are written, so memory usage
+    doesn't depend on rows count.
+
+    """
+    workbook = import_xlsxwriter().Workbook(
+        filename,
+        {"constant_memory": True},
+    )
+    bold = workbook.add_format({"bold": True})
+
+    try:
+        for name, columns, rows in tables:
+            worksheet = workbook.add_worksheet(name)
+            worksheet.write_row(0, 0, columns, bold)
+
+            for index, row in enumerate(rows, start=1):
+                worksheet.write_row(index, 0, row)
+    finally:
+        workbook.close()
+
+
+WRITERS = {
+    "csv": write_csv,
+    "json": write_ndjson,
+    "xlsx": write_xlsx,
+}
+
+
+def export_report(
+    data: dict[str, typing.Any],
+    filename: str,
+    format: str,
+    as_of: str | None = None,
+):
+    """Export report aggregates of prepared data, HTML isn't rendered.
+
+    `csv` is written to directory, `json` -- as newline delimited JSON.
+    Hours logged by sprints and weeks are exported if data has issues
+    `worklogs`, time in status and cycle time -- if it has `changelogs`
+    (statuses are the ones at the end of `as_of` date then).
+
+    """
+    issues_dataframe = data["issues"]
+    tables = get_export_tables(
+        build_report_model(
+            issues_dataframe,
+            data["versions"],
+            data["boards"],
+            worklogs=data.get("worklogs"),
+            changelogs=data.get("changelogs"),
+            as_of=as_of,
+        ),
+        prepare_backlog_table_data(issues_dataframe),
+    )
+
+    WRITERS[format](tables, filename)
@@ -0,0 +1,1090 @@
+import dataclasses
+import typing
+
+import numpy as np
+import pandas
+from pandas import DataFrame
+
+from .changelogs import (
+    Changelogs,
+    get_as_of_time,
+    get_durations,
+    get_issues_as_of,
+    get_status_intervals,
+    get_statuses_as_of,
+)
+from .constants import Status
+from .cube import (
+    Cube,
+    build_cube,
+    get_id,
+    slice_backlog,
+    slice_board,
+    slice_statuses,
+    slice_unversioned,
+    slice_versioned,
+)
+from .forecast import simulate_forecasts
+from .utils.data import (
+    filter_by_board,
+    get_epics,
+    get_sprinted_issues,
+    get_stories,
+    get_versioned_issues,
+    prepare_not_finished_statuses_data,
+)
+from .worklogs import (
+    SECONDS_IN_HOUR,
+    filter_worklogs,
+    get_sprints_spent,
+    get_week_starts,
+)
+
+HOURS_NDIGITS = 1
+
+CLOSED = "closed"
+COMPLETED_STATUSES = (
+    *Status.CLIENT_REVIEW.value,
+    *Status.COMPLETED.value,
+    *Status.VERIFIED.value,
+    *Status.TM_PM_VERIFY.value,
+)
+QA_STATUSES = (
+    *Status.IN_QA.value,
+)
+# work on issue starts when it leaves these statuses, see `build_cycle_time`
+NOT_STARTED_STATUSES = (
+    *Status.BACKLOG.value,
+    *Status.READY_FOR_DEVELOPMENT.value,
+)
+DURATION_PERCENTILES = (50, 85, 95)
+
+
+@dataclasses.dataclass(slots=True)
+class Totals:
+    """Issues count, estimated and spent hours."""
+
+    count: int = 0
+    estimate: float = 0
+    spent: float = 0
+
+    @property
+    def left(self) -> float:
+        return self.estimate - self.spent
+
+
+@dataclasses.dataclass(slots=True)
+class ComponentInfo:
+    id: str
+    name: str
+
+
+@dataclasses.dataclass(slots=True)
+class ProjectTotals:
+    """Totals of versioned, unversioned and backlog issues."""
+
+    versioned: Totals
+    unversioned: Totals
+    backlog: Totals
+
+    @property
+    def summary(self) -> Totals:
+        parts = (self.versioned, self.unversioned, self.backlog)
+        return Totals(
+            sum(part.count for part in parts),
+            sum(part.estimate for part in parts),
+            sum(part.spent for part in parts),
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class MatrixRow:
+    """Totals of row issues and their split by components.
+
+    Components without issues are missing in `components`.
+
+    """
+
+    id: typing.Any
+    name: str | None
+    totals: Totals
+    components: dict[str, Totals]
+
+
+@dataclasses.dataclass(slots=True)
+class Matrix:
+    """Statuses or assignees by components."""
+
+    components: list[ComponentInfo]
+    rows: list[MatrixRow]
+    summary: MatrixRow | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class TimelineCell:
+    """Totals of version or sprint issues with overtime forecast.
+
+    `overtime` is spent to estimated hours ratio, `historical_overtime`
+    is average overtime of closed versions or sprints before this one,
+    `projection` is estimated hours multiplied by it. `forecast` is
+    percentiles of projection (see `FORECAST_PERCENTILES`) simulated
+    from overtime of the same closed items.
+
+    """
+
+    totals: Totals
+    overtime: float | None = None
+    historical_overtime: float | None = None
+    projection: float | None = None
+    forecast: tuple[float, ...] | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class TimelineRow:
+    """Version or sprint totals.
+
+    `logged_in_period` is hours logged between sprint start and end by
+    worklogs of its board issues, whatever sprint the issue was in then
+    (issues keep their latest sprint only), None if worklogs weren't
+    collected.
+
+    """
+
+    id: typing.Any
+    name: str
+    start_date: str
+    end_date: str
+    closed: bool
+    cell: TimelineCell
+    components: dict[str, TimelineCell]
+    logged_in_period: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class Timeline:
+    """Versions or sprints by components, in chronological order."""
+
+    components: list[ComponentInfo]
+    rows: list[TimelineRow]
+    summary: TimelineRow
+
+
+@dataclasses.dataclass(slots=True)
+class RollupRow:
+    """Epic or story with totals of its child issues."""
+
+    id: str
+    key: str
+    summary: str
+    status: str
+    link: str
+    totals: Totals
+    testing: int
+    completed: int
+
+
+@dataclasses.dataclass(slots=True)
+class Distribution:
+    """Count and percentiles of durations in days.
+
+    Percentiles are of `DURATION_PERCENTILES`.
+
+    """
+
+    count: int
+    percentiles: tuple[float, ...]
+
+
+@dataclasses.dataclass(slots=True)
+class DistributionRow:
+    """Durations of row issues and their split by components."""
+
+    id: typing.Any
+    name: str | None
+    total: Distribution
+    components: dict[str, Distribution]
+
+
+@dataclasses.dataclass(slots=True)
+class DistributionMatrix:
+    """Durations by statuses or assignees and components."""
+
+    components: list[ComponentInfo]
+    rows: list[DistributionRow]
+    summary: DistributionRow | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class WeekRow:
+    """Hours logged during week starting on Monday `start`.
+
+    Hours are split by components of logged issues.
+
+    """
+
+    start: str
+    spent: float
+    authors: int
+    components: dict[str, float]
+
+
+@dataclasses.dataclass(slots=True)
+class Weeks:
+    """Logged hours by weeks with worklogs, in chronological order."""
+
+    components: list[ComponentInfo]
+    rows: list[WeekRow]
+
+
+@dataclasses.dataclass(slots=True)
+class BoardModel:
+    id: int
+    name: str
+    sprints: Timeline
+
+
+@dataclasses.dataclass(slots=True)
+class ReportModel:
+    """Report data without HTML, picklable and serializable."""
+
+    project: ProjectTotals
+    statuses: Matrix
+    assignees: Matrix
+    versions: Timeline
+    boards: list[BoardModel]
+    epics: list[RollupRow]
+    stories: list[RollupRow]
+    weeks: Weeks | None = None
+    time_in_status: DistributionMatrix | None = None
+    cycle_time: DistributionMatrix | None = None
+    as_of: str | None = None
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Returns model as JSON serializable dict."""
+        return dataclasses.asdict(self)
+
+
+def to_builtin(value: typing.Any) -> typing.Any:
+    """Convert numpy scalar to built-in one, int or float as it was."""
+    return value.item() if hasattr(value, "item") else value
+
+
+def get_totals(cube: Cube) -> Totals:
+    """Returns totals of all issues of cube."""
+    return Totals(
+        int(cube.cells["count"].sum()),
+        to_builtin(cube.cells.estimate.sum()),
+        to_builtin(cube.cells.spent.sum()),
+    )
+
+
+def get_grouped_totals(
+    cube: Cube,
+    keys: list[str],
+) -> dict[typing.Any, Totals]:
+    """Returns totals of issues grouped by cube dimensions."""
+    if cube.empty:
+        return {}
+
+    grouped = cube.rollup(keys)
+
+    return {
+        key: Totals(count, estimate, spent)
+        for key, count, estimate, spent in zip(
+            grouped.index,
+            grouped["count"],
+            grouped["estimate"],
+            grouped["spent"],
+        )
+    }
+
+
+def get_components(cube: Cube) -> list[ComponentInfo]:
+    """Returns components of issues ordered by name."""
+    return [
+        ComponentInfo(id, name)
+        for id, name in sorted(
+            cube.get_names("component_id"),
+            key=lambda x: x[1],
+        )
+    ]
+
+
+def build_project_totals(
+    versioned: Cube,
+    unversioned: Cube,
+    backlog: Cube,
+) -> ProjectTotals:
+    """Build Project table data."""
+    return ProjectTotals(
+        get_totals(versioned),
+        get_totals(unversioned),
+        get_totals(backlog),
+    )
+
+
+def build_matrix(
+    cube: Cube,
+    dimension: str,
+    rows: list[tuple[typing.Any, typing.Any, str | None]],
+    skip_empty: bool = False,
+) -> Matrix:
+    """Build issues totals by rows and components.
+
+    `rows` are (key, id, name) of matrix rows, where key is the cube
+    `dimension` value, rows without issues are skipped with
+    `skip_empty`.
+
+    """
+    totals = get_grouped_totals(cube, [dimension])
+    components_totals = get_grouped_totals(
+        cube,
+        [dimension, "component_id"],
+    )
+    empty = Totals(0, 0.0, 0.0)
+    rows_components: dict[typing.Any, dict[str, Totals]] = {}
+    matrix_rows = []
+
+    for (key, component_id), component_totals in components_totals.items():
+        rows_components.setdefault(key, {})[component_id] = component_totals
+
+    for key, id, name in rows:
+        if skip_empty and key not in totals:
+            continue
+
+        matrix_rows.append(MatrixRow(
+            id,
+            name,
+            totals.get(key, empty),
+            rows_components.get(key, {}),
+        ))
+
+    return Matrix(
+        get_components(cube),
+        matrix_rows,
+        MatrixRow(
+            None,
+            "",
+            get_totals(cube),
+            get_grouped_totals(cube, ["component_id"]),
+        ),
+    )
+
+
+def build_statuses_matrix(cube: Cube, statuses: list) -> Matrix:
+    """Build Statuses table data."""
+    if cube.empty:
+        return Matrix([], [])
+
+    return build_matrix(
+        cube,
+        "status_id",
+        [(status.id, status.id, status.name) for status in statuses],
+    )
+
+
+def build_assignees_matrix(cube: Cube, assignees: list) -> Matrix:
+    """Build Assignees table data."""
+    def _get_key(assignee) -> str:
+        # unassigned issues are grouped too
+        return getattr(assignee, "accountId", None) or ""
+
+    if cube.empty:
+        return Matrix([], [])
+
+    return build_matrix(
+        cube,
+        "assignee_id",
+        [
+            (
+                _get_key(assignee),
+                getattr(assignee, "accountId", None),
+                getattr(assignee, "displayName", None),
+            )
+            for assignee in assignees
+        ],
+        skip_empty=True,
+    )
+
+
+def get_overtime(totals: Totals) -> float | None:
+    """Returns spent to estimated ratio of hours shown in tables."""
+    estimate = round(totals.estimate, HOURS_NDIGITS)
+    spent = round(totals.spent, HOURS_NDIGITS)
+
+    return spent / estimate if spent and estimate else None
+
+
+def get_average(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def get_timeline_cell(
+    totals: Totals,
+    overtime: float | None,
+    historical_overtime: float | None,
+) -> TimelineCell:
+    return TimelineCell(
+        totals,
+        overtime,
+        historical_overtime,
+        (
+            round(totals.estimate, HOURS_NDIGITS) * historical_overtime
+            if historical_overtime is not None
+            else None
+        ),
+    )
+
+
+def get_historical_overtime(
+    overtimes: dict[str, list[float]],
+    component_id: str,
+) -> float | None:
+    """Returns average overtime of component, None if nothing is closed."""
+    if not overtimes:
+        return None
+
+    return get_average(overtimes.get(component_id, []))
+
+
+def set_forecasts(
+    cells: list[tuple[TimelineCell, typing.Any, int]],
+    history: list[dict[typing.Any, float]],
+) -> None:
+    """Fill forecasts of cells with one simulation.
+
+    `history` is overtime of closed items by history keys, `cells` are
+    (cell, history key, count of closed items before it). Issues of the
+    cell are forecasted work items, estimated hours are split between
+    them evenly, cube keeps totals only.
+
+    """
+    keys = {key: index for index, key in enumerate(
+        dict.fromkeys(key for _, key, _ in cells),
+    )}
+    ratios = np.full((len(history), len(keys)), np.nan)
+
+    for index, item_ratios in enumerate(history):
+        for key, ratio in item_ratios.items():
+            if key in keys:
+                ratios[index, keys[key]] = ratio
+
+    forecasts = simulate_forecasts(
+        ratios,
+        [
+            (keys[key], count, cell.totals.count)
+            for cell, key, count in cells
+        ],
+    )
+
+    for (cell, _, _), ratios_percentiles in zip(cells, forecasts):
+        if ratios_percentiles is not None:
+            estimate = round(cell.totals.estimate, HOURS_NDIGITS)
+            cell.forecast = tuple(
+                estimate * ratio for ratio in ratios_percentiles
+            )
+
+
+def build_timeline(
+    cube: Cube,
+    dimension: str,
+    items: list[tuple[typing.Any, str, str, str, bool]],
+) -> Timeline:
+    """Build issues totals by versions or sprints and components.
+
+    `items` are (id, name, start date, end date, closed) of versions
+    or sprints, ids are values of cube `dimension`. Overtime of closed
+    items is averaged to forecast projections of next ones, overall
+    and by components, and drawn for every issue to forecast their
+    percentiles.
+
+    """
+    totals = get_grouped_totals(cube, [dimension])
+    components_totals = get_grouped_totals(
+        cube,
+        [dimension, "component_id"],
+    )
+    components = get_components(cube)
+    empty = Totals(0, 0.0, 0.0)
+    overtimes: list[float] = []
+    components_overtimes: dict[str, list[float]] = {}
+    # overtime of closed items by components, None key is overall one
+    history: list[dict[typing.Any, float]] = []
+    forecast_cells: list[tuple[TimelineCell, typing.Any, int]] = []
+    rows = []
+
+    for id, name, start_date, end_date, closed in items:
+        item_totals = totals.get(id, empty)
+        overtime = get_overtime(item_totals)
+        item_components = {
+            component.id: components_totals[(id, component.id)]
+            for component in components
+            if (id, component.id) in components_totals
+        }
+
+        rows.append(TimelineRow(
+            id,
+            name,
+            start_date,
+            end_date,
+            closed,
+            get_timeline_cell(
+                item_totals,
+                overtime,
+                get_average(overtimes) if overtimes else None,
+            ),
+            {
+                component_id: get_timeline_cell(
+                    component_totals,
+                    get_overtime(component_totals),
+                    get_historical_overtime(
+                        components_overtimes,
+                        component_id,
+                    ),
+                )
+                for component_id, component_totals in item_components.items()
+            },
+        ))
+
+        # closed items are forecasted by the ones closed before them
+        # too, like their projections
+        forecast_cells.append((rows[-1].cell, None, len(history)))
+        forecast_cells.extend(
+            (cell, component_id, len(history))
+            for component_id, cell in rows[-1].components.items()
+        )
+
+        # overtime of closed items forecasts next ones
+        if closed and overtime:
+            overtimes.append(overtime)
+            history.append({None: overtime})
+
+            for component_id, component_totals in item_components.items():
+                estimate = component_totals.estimate
+                spent = component_totals.spent
+
+                if not estimate and not spent:
+                    continue
+
+                component_overtime = (
+                    spent / estimate if estimate else float("inf")
+                )
+                components_overtimes.setdefault(component_id, []).append(
+                    component_overtime,
+                )
+                history[-1][component_id] = component_overtime
+
+    summary_components = get_grouped_totals(cube, ["component_id"])
+    summary = TimelineRow(
+        None,
+        "Summary",
+        "",
+        "",
+        False,
+        get_timeline_cell(
+            get_totals(cube),
+            None,
+            get_average(overtimes),
+        ),
+        {
+            component.id: get_timeline_cell(
+                summary_components[component.id],
+                None,
+                get_historical_overtime(
+                    components_overtimes,
+                    component.id,
+                ),
+            )
+            for component in components
+            if component.id in summary_components
+        },
+    )
+
+    forecast_cells.append((summary.cell, None, len(history)))
+    forecast_cells.extend(
+        (cell, component_id, len(history))
+        for component_id, cell in summary.components.items()
+    )
+    set_forecasts(forecast_cells, history)
+
+    return Timeline(components, rows, summary)
+
+
+def build_versions_timeline(cube: Cube, versions: list) -> Timeline:
+    """Build Versions table data."""
+    return build_timeline(
+        cube,
+        "version_id",
+        [
+            (
+                version.id,
+                version.name,
+                getattr(version, "startDate", ""),
+                getattr(version, "releaseDate", ""),
+                bool(version.released),
+            )
+            for version in versions
+        ],
+    )
+
+
+def build_sprints_timeline(
+    cube: Cube,
+    sprints: list,
+    worklogs: DataFrame | None = None,
+) -> Timeline:
+    """Build Sprints table data.
+
+    Pass `worklogs` of board issues to get hours logged during sprints
+    periods, see `TimelineRow`.
+
+    """
+    timeline = build_timeline(
+        cube,
+        "sprint_id",
+        [
+            (
+                sprint.id,
+                sprint.name,
+                getattr(sprint, "startDate", "")[:10],
+                getattr(sprint, "endDate", "")[:10],
+                sprint.state == CLOSED,
+            )
+            for sprint in sprints
+        ],
+    )
+
+    if worklogs is not None:
+        logged = get_sprints_spent(worklogs, sprints)
+
+        for row in timeline.rows:
+            row.logged_in_period = logged[row.id]
+
+        timeline.summary.logged_in_period = sum(logged.values())
+
+    return timeline
+
+
+def get_issue_components(
+    issues_dataframe: DataFrame,
+) -> tuple[DataFrame, list[ComponentInfo]]:
+    """Returns (issue_id, component) pairs and components by codes.
+
+    Components are factorized, so pairs of integers are joined with
+    worklogs and changelogs fast.
+
+    """
+    issue_components = issues_dataframe[["id", "components"]].explode(
+        "components",
+    ).dropna(subset=["components"])
+    codes, uniques = pandas.factorize(
+        issue_components.components.map(get_id),
+    )
+    # names are taken from the first issue of every component
+    firsts = issue_components.components.iloc[
+        np.unique(codes, return_index=True)[1]
+    ]
+
+    return DataFrame({
+        "issue_id": issue_components.id.astype(np.int64).to_numpy(),
+        "component": codes,
+    }), [
+        ComponentInfo(id, component.name)
+        for id, component in zip(uniques, firsts)
+    ]
+
+
+def get_sorted_components(
+    components: typing.Iterable[ComponentInfo],
+) -> list[ComponentInfo]:
+    return sorted(components, key=lambda x: x.name)
+
+
+def build_weeks(worklogs: DataFrame, issues_dataframe: DataFrame) -> Weeks:
+    """Build hours logged by weeks and components of issues.
+
+    Worklogs are summed up by weeks and issues first, then joined with
+    issues components by integer ids.
+
+    """
+    pairs, components = get_issue_components(issues_dataframe)
+    logged = DataFrame({
+        "week": get_week_starts(worklogs.started.to_numpy()),
+        "issue_id": worklogs.issue_id,
+        "author": worklogs.author,
+        "spent": worklogs.seconds / SECONDS_IN_HOUR,
+    })
+    weeks = logged.groupby("week").agg(
+        spent=("spent", "sum"),
+        authors=("author", "nunique"),
+    )
+    by_components = logged.groupby(
+        ["week", "issue_id"],
+        as_index=False,
+    ).spent.sum().merge(pairs, on="issue_id").groupby(
+        ["week", "component"],
+    ).spent.sum()
+
+    rows = {
+        week: WeekRow(str(week)[:10], to_builtin(spent), int(authors), {})
+        for week, spent, authors in zip(
+            weeks.index,
+            weeks.spent,
+            weeks.authors,
+        )
+    }
+    for (week, code), spent in by_components.items():
+        rows[week].components[components[code].id] = to_builtin(spent)
+
+    return Weeks(get_sorted_components(components), list(rows.values()))
+
+
+def get_distributions(
+    durations: DataFrame,
+    keys: list[str],
+) -> dict[typing.Any, Distribution]:
+    """Returns distributions of `days` grouped by `keys`."""
+    if durations.empty:
+        return {}
+
+    grouped = durations.groupby(keys).days
+    percentiles = grouped.quantile(
+        [percentile / 100 for percentile in DURATION_PERCENTILES],
+    ).unstack()
+    counts = grouped.size()
+
+    return {
+        key: Distribution(int(count), tuple(values.tolist()))
+        for key, count, values in zip(
+            percentiles.index,
+            counts[percentiles.index],
+            percentiles.to_numpy(),
+        )
+    }
+
+
+def build_distribution_matrix(
+    durations: DataFrame,
+    rows: list[tuple[typing.Any, str | None]],
+    issues_dataframe: DataFrame,
+    summary: bool = False,
+) -> DistributionMatrix:
+    """Build durations distributions by rows and components.
+
+    `durations` are `days` of issues (`issue_id`) by row `key`, `rows`
+    are (key, name) of matrix rows, rows without durations are skipped.
+    Summary row of all durations is added with `summary`.
+
+    """
+    pairs, components = get_issue_components(issues_dataframe)
+    by_components = durations.merge(pairs, on="issue_id")
+    totals = get_distributions(durations, ["key"])
+    rows_components: dict[typing.Any, dict[str, Distribution]] = {}
+
+    for (key, code), distribution in get_distributions(
+        by_components,
+        ["key", "component"],
+    ).items():
+        rows_components.setdefault(key, {})[components[code].id] = (
+            distribution
+        )
+
+    return DistributionMatrix(
+        get_sorted_components(
+            components[code]
+            for code in by_components.component.unique().tolist()
+        ),
+        [
+            DistributionRow(
+                key,
+                name,
+                totals[key],
+                rows_components.get(key, {}),
+            )
+            for key, name in rows
+            if key in totals
+        ],
+        DistributionRow(
+            None,
+            "",
+            get_distributions(durations.assign(key=0), ["key"])[0],
+            {
+                components[code].id: distribution
+                for code, distribution in get_distributions(
+                    by_components,
+                    ["component"],
+                ).items()
+            },
+        ) if summary and not durations.empty else None,
+    )
+
+
+def get_status_names(
+    issues_dataframe: DataFrame,
+    changelogs: Changelogs,
+) -> dict[str, str]:
+    """Returns names of current and changelogs statuses by ids."""
+    return {
+        **changelogs.statuses,
+        **{status.id: status.name for status in issues_dataframe.status},
+    }
+
+
+def build_time_in_status(
+    intervals: DataFrame,
+    issues_dataframe: DataFrame,
+    statuses: dict[str, str],
+) -> DistributionMatrix:
+    """Build days issues spent in statuses by components.
+
+    Intervals of the same status are summed up by issue, statuses are
+    ordered as they are passed on average.
+
+    """
+    durations = DataFrame({
+        "issue_id": intervals.issue_id,
+        "key": intervals.status,
+        "days": get_durations(intervals),
+    }).groupby(["issue_id", "key"], as_index=False).days.sum()
+    order = intervals.groupby("status").position.mean().sort_values()
+
+    return build_distribution_matrix(
+        durations,
+        [(id, statuses.get(id, id)) for id in order.index.tolist()],
+        issues_dataframe,
+    )
+
+
+def build_cycle_time(
+    intervals: DataFrame,
+    issues_dataframe: DataFrame,
+    statuses: dict[str, str],
+    assignees: list,
+) -> DistributionMatrix:
+    """Build cycle time of completed issues by assignees and components.
+
+    Cycle time is days since issue left not started statuses the first
+    time till it was completed the last time.
+
+    """
+    def _get_key(assignee) -> str:
+        # unassigned issues are grouped too
+        return getattr(assignee, "accountId", None) or ""
+
+    names = intervals.status.map(statuses)
+    started = intervals[~names.isin(NOT_STARTED_STATUSES)].groupby(
+        "issue_id",
+    ).start.min()
+    completed = intervals[~names.isin(COMPLETED_STATUSES)].groupby(
+        "issue_id",
+    ).end.max()
+    statuses_as_of = get_statuses_as_of(intervals).map(statuses)
+    completed = completed[
+        completed.index.isin(
+            statuses_as_of.index[statuses_as_of.isin(COMPLETED_STATUSES)],
+        )
+    ]
+    cycle_times = DataFrame({"start": started, "end": completed}).dropna()
+    cycle_times = cycle_times[cycle_times.end >= cycle_times.start]
+
+    issue_assignees = pandas.Series(
+        issues_dataframe.assignee.map(_get_key).to_numpy(),
+        index=issues_dataframe.id.astype(np.int64).to_numpy(),
+    )
+
+    return build_distribution_matrix(
+        DataFrame({
+            "issue_id": cycle_times.index.to_numpy(),
+            "key": cycle_times.index.map(issue_assignees).to_numpy(),
+            "days": get_durations(cycle_times),
+        }),
+        [
+            (_get_key(assignee), getattr(assignee, "displayName", None))
+            for assignee in assignees
+        ],
+        issues_dataframe,
+        summary=True,
+    )
+
+
+def build_statuses_as_of(issues_as_of: DataFrame) -> Matrix:
+    """Build Statuses table data of versioned issues with past statuses.
+
+    Estimated and spent hours are the current ones.
+
+    """
+    not_finished_statuses = prepare_not_finished_statuses_data(issues_as_of)
+
+    return build_statuses_matrix(
+        slice_statuses(
+            slice_versioned(build_cube(issues_as_of)),
+            not_finished_statuses,
+        ),
+        not_finished_statuses,
+    )
+
+
+def build_status_history(
+    changelogs: Changelogs,
+    versioned_df: DataFrame,
+    as_of: str | None = None,
+) -> tuple[DistributionMatrix, DistributionMatrix, Matrix | None]:
+    """Build time in status, cycle time and Statuses table data of
+    versioned issues at the end of `as_of` date (None without it).
+
+    """
+    intervals = get_status_intervals(
+        changelogs,
+        versioned_df,
+        get_as_of_time(as_of),
+    )
+    statuses = get_status_names(versioned_df, changelogs)
+
+    return (
+        build_time_in_status(intervals, versioned_df, statuses),
+        build_cycle_time(
+            intervals,
+            versioned_df,
+            statuses,
+            versioned_df.assignee.unique().tolist(),
+        ),
+        build_statuses_as_of(
+            get_issues_as_of(versioned_df, intervals, statuses),
+        ) if as_of is not None else None,
+    )
+
+
+def build_rollup(cube: Cube, parents: DataFrame) -> list[RollupRow]:
+    """Build Epics or Stories table data."""
+    if parents.empty:
+        return []
+
+    by_statuses = cube.rollup(["parent_id", "status_id"]).reset_index()
+    status_names = by_statuses.status_id.map(cube.labels["status_id"])
+    grouped = by_statuses.assign(
+        testing=by_statuses["count"].where(status_names.isin(QA_STATUSES), 0),
+        completed=by_statuses["count"].where(
+            status_names.isin(COMPLETED_STATUSES),
+            0,
+        ),
+    ).groupby("parent_id").agg(
+        count=("count", "sum"),
+        estimate=("estimate", "sum"),
+        spent=("spent", "sum"),
+        testing=("testing", "sum"),
+        completed=("completed", "sum"),
+    ).reindex(parents.id.tolist(), fill_value=0)
+
+    return [
+        RollupRow(
+            parent.id,
+            parent.key,
+            parent.summary,
+            str(parent.status),
+            parent.link,
+            Totals(count, estimate, spent),
+            testing,
+            completed,
+        )
+        for parent, count, estimate, spent, testing, completed in zip(
+            parents.itertuples(),
+            grouped["count"],
+            grouped["estimate"],
+            grouped["spent"],
+            grouped["testing"],
+            grouped["completed"],
+        )
+    ]
+
+
+def build_report_model(
+    issues_dataframe: DataFrame,
+    versions: list,
+    boards: list,
+    cube: Cube | None = None,
+    worklogs: DataFrame | None = None,
+    changelogs: Changelogs | None = None,
+    as_of: str | None = None,
+) -> ReportModel:
+    """Build report data from issues dataframe, versions and boards.
+
+    Totals are taken from `cube` of the issues, it's built if missing.
+    Hours logged by sprints and weeks are added if issues `worklogs`
+    are passed. Time in statuses and cycle time of versioned issues are
+    added if their `changelogs` are passed, Statuses table shows issues
+    statuses at the end of `as_of` date then.
+
+    """
+    if cube is None:
+        cube = build_cube(issues_dataframe)
+
+    versioned = slice_versioned(cube)
+    versioned_df = get_versioned_issues(issues_dataframe)
+    not_finished_statuses = prepare_not_finished_statuses_data(versioned_df)
+    statuses = slice_statuses(versioned, not_finished_statuses)
+    statuses_matrix = build_statuses_matrix(statuses, not_finished_statuses)
+    time_in_status = cycle_time = None
+
+    if changelogs is not None:
+        time_in_status, cycle_time, statuses_as_of = build_status_history(
+            changelogs,
+            versioned_df,
+            as_of,
+        )
+        if statuses_as_of is not None:
+            statuses_matrix = statuses_as_of
+
+    return ReportModel(
+        project=build_project_totals(
+            versioned,
+            slice_unversioned(cube),
+            slice_backlog(cube),
+        ),
+        statuses=statuses_matrix,
+        assignees=build_assignees_matrix(
+            statuses,
+            issues_dataframe.assignee.explode().unique().tolist(),
+        ),
+        versions=build_versions_timeline(versioned, versions),
+        boards=[
+            BoardModel(
+                board["board"].id,
+                board["board"].name,
+                build_sprints_timeline(
+                    slice_board(cube, board["board"]),
+                    board["sprints"],
+                    get_board_worklogs(
+                        worklogs,
+                        issues_dataframe,
+                        board["board"],
+                    ),
+                ),
+            )
+            for board in boards
+        ],
+        epics=build_rollup(cube, get_epics(issues_dataframe)),
+        stories=build_rollup(cube, get_stories(issues_dataframe)),
+        weeks=(
+            build_weeks(worklogs, issues_dataframe)
+            if worklogs is not None
+            else None
+        ),
+        time_in_status=time_in_status,
+        cycle_time=cycle_time,
+        as_of=as_of,
+    )
+
+
+def get_board_worklogs(
+    worklogs: DataFrame | None,
+    issues_dataframe: DataFrame,
+    board: typing.Any,
+) -> DataFrame | None:
+    """Returns worklogs of board issues in sprints."""
+    if worklogs is None:
+        return None
+
+    return filter_worklogs(
+        worklogs,
+        filter_by_board(get_sprinted_issues(issues_dataframe), board).id,
+    )
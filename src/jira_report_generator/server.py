@@ -0,0 +1,240 @@
+import collections
+import html
+import logging
+import re
+import sys
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Formatter, StreamHandler
+
+from jinja2 import Template
+from jira import JIRA
+
+from .app import (
+    construct_tables,
+    flush_cache,
+    flush_section_cache,
+    get_prepared_data,
+)
+from .constants import DEFAULT_MAX_AGE, MAX_THREADS_COUNT, SERVER_MAX_REPORTS
+from .utils.cache import ResponseCache, SectionCache
+from .utils.data import render_template
+
+REPORT_PATH_PATTERN = re.compile(r"^/report/(?P<key>[A-Za-z0-9_]+)/?$")
+
+logger = logging.getLogger(__name__)
+handler = StreamHandler(stream=sys.stdout)
+formatter = Formatter(fmt="[%(asctime)s: %(levelname)s] %(message)s")
+
+handler.setFormatter(formatter)
+logger.addHandler(handler)
+
+
+class ReportStore:
+    """In-memory storage of rendered reports.
+
+    Reports older than `max_age` seconds are returned as is, while fresh
+    ones are prepared in background (stale-while-revalidate). Jira
+    responses cache makes refresh incremental, sections cache lets
+    refresh render only changed sections. Without `keys` any project
+    is served, but only `max_reports` least recently requested ones are
+    kept.
+
+    """
+
+    def __init__(
+        self,
+        jira_client: JIRA,
+        jira_server_url: str,
+        template: Template,
+        max_age: int = DEFAULT_MAX_AGE,
+        cache: ResponseCache | None = None,
+        keys: list[str] | None = None,
+        section_cache: SectionCache | None = None,
+        max_reports: int = SERVER_MAX_REPORTS,
+    ):
+        self.jira_client = jira_client
+        self.jira_server_url = jira_server_url
+        self.template = template
+        self.max_age = max_age
+        self.cache = cache
+        self.section_cache = section_cache
+        self.keys = keys or []
+        self.max_reports = max_reports
+        self.entries: collections.OrderedDict[
+            str,
+            dict[str, typing.Any],
+        ] = collections.OrderedDict()
+        self.refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._executor = ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT)
+
+    def is_allowed(self, key: str) -> bool:
+        """Check if project report could be served."""
+        return not self.keys or key in self.keys
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def refresh(self, key: str) -> dict[str, typing.Any]:
+        """Fetch project data and render report."""
+        with self._get_key_lock(key):
+            started = time.monotonic()
+            # entries used by this refresh are kept by eviction
+            started_at = time.time()
+            data = get_prepared_data(
+                self.jira_client,
+                key,
+                self.jira_server_url,
+                cache=self.cache,
+            )
+            report = render_template(
+                construct_tables(
+                    data["issues"],
+                    data["versions"],
+                    data["boards"],
+                    section_cache=self.section_cache,
+                ),
+                key,
+                self.template,
+            )
+            flush_cache(self.cache, started_at)
+            flush_section_cache(self.section_cache, started_at)
+            entry = {"report": report, "updated_at": time.time()}
+
+            with self._lock:
+                self.entries[key] = entry
+                self.entries.move_to_end(key)
+                self._drop_least_recent()
+
+        logger.info(
+            f"Refreshed {key} in {round(time.monotonic() - started, 1)}s",
+        )
+        return entry
+
+    def _drop_least_recent(self) -> None:
+        # known projects are never dropped
+        if self.keys:
+            return
+
+        while len(self.entries) > self.max_reports:
+            key, _ = self.entries.popitem(last=False)
+            self._key_locks.pop(key, None)
+
+    def _refresh_in_background(self, key: str) -> None:
+        try:
+            self.refresh(key)
+        except Exception as e:
+            logger.error(f"Failed to refresh {key}: {e}")
+        finally:
+            with self._lock:
+                self.refreshing.discard(key)
+
+    def schedule_refresh(self, key: str) -> None:
+        """Refresh project report in background if not refreshing yet."""
+        with self._lock:
+            if key in self.refreshing:
+                return
+            self.refreshing.add(key)
+
+        self._executor.submit(self._refresh_in_background, key)
+
+    def get_report(self, key: str) -> str:
+        """Returns project report, refreshes it if it's outdated."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+        if entry is None:
+            # nothing to serve yet, wait for the first fetch
+            with self._get_key_lock(key):
+                entry = self.entries.get(key)
+            if entry is None:
+                entry = self._refresh_first(key)
+        elif time.time() - entry["updated_at"] > self.max_age:
+            self.schedule_refresh(key)
+
+        return entry["report"]
+
+    def _refresh_first(self, key: str) -> dict[str, typing.Any]:
+        try:
+            return self.refresh(key)
+        except Exception:
+            # don't keep locks of missing projects
+            with self._lock:
+                if key not in self.entries:
+                    self._key_locks.pop(key, None)
+            raise
+
+    def warm_up(self) -> None:
+        """Prepare reports of known projects in background."""
+        for key in self.keys:
+            self.schedule_refresh(key)
+
+
+def get_request_handler(store: ReportStore) -> type[BaseHTTPRequestHandler]:
+    """Returns request handler serving reports from the store."""
+
+    class ReportRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path in ("", "/"):
+                return self.send_index()
+
+            match = REPORT_PATH_PATTERN.match(self.path)
+            if not match or not store.is_allowed(match.group("key")):
+                return self.send_text(404, "Not found.")
+
+            try:
+                report = store.get_report(match.group("key"))
+            except Exception as e:
+                logger.error(f"Failed to get {match.group('key')}: {e}")
+                return self.send_text(502, "Failed to get report.")
+
+            self.send_text(200, report, content_type="text/html")
+
+        def send_index(self):
+            keys = sorted(set(store.keys) | set(store.entries))
+            links = "".join(
+                f"<li><a href=\"/report/{key}\">{html.escape(key)}</a></li>"
+                for key in keys
+            )
+            self.send_text(200, f"<ul>{links}</ul>", content_type="text/html")
+
+        def send_text(
+            self,
+            status: int,
+            text: str,
+            content_type: str = "text/plain",
+        ):
+            body = text.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.info(format % args)
+
+    return ReportRequestHandler
+
+
+def serve(store: ReportStore, host: str, port: int) -> None:
+    """Serve reports until interrupted."""
+    store.warm_up()
+    server = ThreadingHTTPServer((host, port), get_request_handler(store))
+
+    logger.info(f"Serve reports on http://{host}:{port}/report/<KEY>")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
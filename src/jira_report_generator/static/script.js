@@ -1,10 +1,60 @@
 const TAB_CONTENT_CLASS = 'tab-content';
-const SUM_COLUMNS_NAMES = ['tasks', 'estimated', 'spent'];
+const SUM_COLUMNS_NAMES = [
+  'tasks', 'estimated', 'spent', 'logged-in-period',
+];
 const AVERAGE_COLUMN_NAMES = ['overtime'];
 const VERSION_TAB_ID = 1;
 const VERSION_SETTINGS_ID = 'versions';
 const VERSION_ID_CHECKBOX_ATTRIBUTE = 'data-version-id';
 const SPRINT_ID_CHECKBOX_ATTRIBUTE = 'data-sprint-id';
+const VIRTUAL_TABLE_SELECTOR = '.combined.virtual';
+const COMPACT_TABLE_SELECTOR = '.combined.compact';
+// rows rendered above and below the visible ones
+const VIRTUAL_OVERSCAN = 10;
+const VIRTUAL_DEFAULT_ROW_HEIGHT = 22;
+// fields of virtual table rows, see `get_virtual_rows`
+const VIRTUAL_ROW = {
+  SUMMARY: 0,
+  TYPE: 1,
+  KEY: 2,
+  LINK: 3,
+  STATUS_ID: 4,
+  STATUS: 5,
+  STATUS_CLASS: 6,
+  BACKGROUND: 7,
+  ASSIGNEE_ID: 8,
+  ASSIGNEE: 9,
+  PARENT_ID: 10,
+  CELLS: 11,
+  ESTIMATE: 12,
+  SPENT: 13,
+  DANGER: 14,
+};
+// highlight class name -> row attribute and highlighted values
+// and rows of summary tables by value
+const HIGHLIGHTS = {
+  'highlighted': {
+    attribute: 'data-assignee-id',
+    values: new Set(),
+    rows: new Map(),
+  },
+  'highlighted-epic': {
+    attribute: 'data-parent-id',
+    values: new Set(),
+    rows: new Map(),
+  },
+  'highlighted-story': {
+    attribute: 'data-parent-id',
+    values: new Set(),
+    rows: new Map(),
+  },
+};
+const virtualTables = [];
+const TAB_TEMPLATE_SELECTOR = ':scope > template.tab-template';
+const TAB_FRAME_SELECTOR = 'iframe.tab-frame';
+const mountedTabIds = new Set();
+// tab content element -> its elements by ids, see `indexTab`
+const tabIndexes = new Map();
 
 function getSprintSettingsId(tab) {
   const tabId = tab.getAttribute('data-tab-content-id');
@@ -12,337 +62,766 @@ function getSprintSettingsId(tab) {
 }
 
 /**
- * Adds an ability for highlight rows by clicking.
+ * Component table which renders only rows and columns in view.
+ *
+ * Rows are read from embedded JSON payload. Collapsed and hidden
+ * columns and highlights are kept as state and applied to rows
+ * when they are rendered.
  */
-function init_highlights() {
-  var assignees = document.querySelectorAll(".assignees > tbody > tr");
-  var epics = document.querySelectorAll(".epics > tbody > tr");
-  var stories = document.querySelectorAll(".stories > tbody > tr");
+class VirtualTable {
+  constructor(container) {
+    const payload = JSON.parse(
+      container.querySelector('script.virtual-rows').textContent
+    );
 
-  function deselect(doc, className) {
-    doc.querySelectorAll(`tr.${className}`).forEach((el) => {
-      el.classList.remove(className);
-    })
+    this.container = container;
+    this.kind = payload.kind;
+    this.componentId = payload.componentId;
+    this.columns = payload.columns;
+    this.empty = payload.empty;
+    this.rows = payload.rows.map((data) => ({
+      data: data,
+      ids: data[VIRTUAL_ROW.CELLS].map((index) => payload.columns[index]),
+    }));
+
+    this.scrollable = container.querySelector('.combined-right');
+    this.subheader = this.scrollable.querySelector('tr.h25');
+    this.leftBody = container.querySelector(
+      '.combined-left table'
+    ).createTBody();
+    this.rightBody = this.scrollable.querySelector('table').createTBody();
+
+    this.collapsed = new Set();
+    this.hidden = new Set();
+    this.visibleRows = this.rows;
+    this.isFiltered = true;
+    this.rowHeight = 0;
+    this.renderedState = null;
+    this.isRenderScheduled = false;
+
+    this.scrollable.addEventListener(
+      'scroll',
+      () => this.scheduleRender(),
+      {passive: true},
+    );
   }
 
-  for (var i in assignees) {
-    var assignee = assignees[i];
-
-    if (
-        assignee !== undefined
-        && assignee.attributes !== undefined
-        && assignee.attributes['data-assignee-id'] !== undefined
-    ) {
-      var assigneeId = assignee.attributes['data-assignee-id'];
+  setCollapsed(id, collapsed) {
+    collapsed ? this.collapsed.add(id) : this.collapsed.delete(id);
+    this.isFiltered = false;
+    this.scheduleRender();
+  }
 
-      var listenerSelector = (
-        `table.assignees [${assigneeId.name}="${assigneeId.value}"]`
-      );
+  setHidden(id, hidden) {
+    hidden ? this.hidden.add(id) : this.hidden.delete(id);
+    this.isFiltered = false;
+    this.scheduleRender();
+  }
 
-      document.querySelector(listenerSelector).onclick = function () {
-        var attr = this.attributes['data-assignee-id'];
-        var selector = (
-          `table.component [${attr.name}="${attr.value}"]`
-        );
+  /**
+   * Rows of collapsed column are the rows which belong to it only.
+   */
+  filterRows() {
+    this.visibleRows = this.rows.filter((row) => !(
+      (row.ids.length === 1 && this.collapsed.has(row.ids[0]))
+      || row.ids.some((id) => this.hidden.has(id))
+    ));
+    this.isFiltered = true;
+  }
 
-        deselect(document, "highlighted-epic");
-        deselect(document, "highlighted-story");
+  scheduleRender() {
+    if (this.isRenderScheduled) {
+      return;
+    }
 
-        this.classList.toggle("highlighted");
+    this.isRenderScheduled = true;
+    requestAnimationFrame(() => {
+      this.isRenderScheduled = false;
+      this.render();
+    });
+  }
 
-        document.querySelectorAll(selector).forEach((el) => {
-          el.classList.toggle("highlighted");
-        })
+  /**
+   * Returns visibility of every column: true if it's in view,
+   * false if it's scrolled out and null if it's hidden.
+   */
+  getColumnsInView() {
+    const cells = this.subheader.children;
+    const left = this.scrollable.scrollLeft;
+    const right = left + this.scrollable.clientWidth;
+
+    return this.columns.map((id, index) => {
+      if (this.hidden.has(id)) {
+        return null;
       }
-    }
+
+      const first = cells[index * 2];
+      const last = cells[index * 2 + 1];
+
+      return (
+        first.offsetLeft < right
+        && last.offsetLeft + last.offsetWidth > left
+      );
+    });
   }
 
-  for (var i in epics) {
-    var epic = epics[i];
+  render() {
+    // table in inactive tab
+    if (this.container.offsetParent === null) {
+      return;
+    }
+
+    if (!this.isFiltered) {
+      this.filterRows();
+    }
+
+    const rows = this.visibleRows;
+    const rowHeight = this.rowHeight || VIRTUAL_DEFAULT_ROW_HEIGHT;
+    const top = this.leftBody.getBoundingClientRect().top;
+    const first = Math.min(
+      rows.length,
+      Math.max(0, Math.floor(-top / rowHeight) - VIRTUAL_OVERSCAN),
+    );
+    const last = Math.min(
+      rows.length,
+      Math.max(
+        first,
+        Math.ceil((window.innerHeight - top) / rowHeight) + VIRTUAL_OVERSCAN,
+      ),
+    );
+    const columnsInView = this.getColumnsInView();
+    const state = [
+      rows,
+      first,
+      last,
+      rowHeight,
+      columnsInView.join(),
+      ...Object.values(HIGHLIGHTS).map((h) => [...h.values].join()),
+    ];
 
     if (
-        epic !== undefined
-        && epic.attributes !== undefined
-        && epic.attributes['data-epic-id'] !== undefined
+      this.renderedState
+      && state.every((value, index) => value === this.renderedState[index])
     ) {
-      var epicId = epic.attributes['data-epic-id'];
+      return;
+    }
+    this.renderedState = state;
 
-      var listenerSelector = (
-        `table.epics [${epicId.name}="${epicId.value}"]`
-      );
+    const leftRows = [];
+    const rightRows = [];
 
-      document.querySelector(listenerSelector).onclick = function () {
-        var attr = this.attributes['data-epic-id'];
-        var selector = (
-          `table.component [data-parent-id="${attr.value}"]`
-        );
+    leftRows.push(this.createSpacer(5, first * rowHeight));
+    rightRows.push(this.createSpacer(
+      columnsInView.filter((inView) => inView !== null).length * 2,
+      first * rowHeight,
+    ));
 
-        deselect(document, "highlighted");
-        deselect(document, "highlighted-story");
+    for (const row of rows.slice(first, last)) {
+      const [left, right] = this.createRows(row, columnsInView);
+      leftRows.push(left);
+      rightRows.push(right);
+    }
 
-        this.classList.toggle("highlighted-epic");
+    leftRows.push(this.createSpacer(5, (rows.length - last) * rowHeight));
+    rightRows.push(this.createSpacer(
+      columnsInView.filter((inView) => inView !== null).length * 2,
+      (rows.length - last) * rowHeight,
+    ));
 
-        document.querySelectorAll(selector).forEach((el) => {
-          el.classList.toggle("highlighted-epic");
-        })
-      }
+    this.leftBody.replaceChildren(...leftRows.filter(Boolean));
+    this.rightBody.replaceChildren(...rightRows.filter(Boolean));
+
+    // measure rendered rows once to align left and right parts
+    if (!this.rowHeight && last > first) {
+      this.rowHeight = Math.max(
+        leftRows[1].offsetHeight,
+        rightRows[1].offsetHeight,
+      );
+      this.scheduleRender();
     }
   }
 
-  for (var i in stories) {
-    var story = stories[i];
+  createSpacer(colspan, height) {
+    if (!height || !colspan) {
+      return null;
+    }
 
-    if (
-        story !== undefined
-        && story.attributes !== undefined
-        && story.attributes['data-story-id'] !== undefined
-    ) {
-      var storyId = story.attributes['data-story-id'];
+    const tr = document.createElement('tr');
+    const td = document.createElement('td');
 
-      var listenerSelector = (
-        `table.stories [${storyId.name}="${storyId.value}"]`
-      );
+    tr.className = 'virtual-spacer';
+    td.colSpan = colspan;
+    td.style.height = `${height}px`;
+    tr.appendChild(td);
 
-      document.querySelector(listenerSelector).onclick = function () {
-        var attr = this.attributes['data-story-id'];
-        var selector = (
-          `table.component [data-parent-id="${attr.value}"]`
-        );
+    return tr;
+  }
 
-        deselect(document, "highlighted");
-        deselect(document, "highlighted-epic");
+  createCell(className, text, title) {
+    const td = document.createElement('td');
 
-        this.classList.toggle("highlighted-story");
+    td.className = className;
+    td.textContent = text;
+    if (title !== undefined) {
+      td.title = title;
+    }
 
-        document.querySelectorAll(selector).forEach((el) => {
-          el.classList.toggle("highlighted-story");
-        })
+    return td;
+  }
+
+  createRows(row, columnsInView) {
+    const data = row.data;
+    const attributes = {
+      'data-status-id': data[VIRTUAL_ROW.STATUS_ID],
+      'data-assignee-id': data[VIRTUAL_ROW.ASSIGNEE_ID],
+      'data-parent-id': data[VIRTUAL_ROW.PARENT_ID],
+      [`data-${this.kind}-ids`]: row.ids.join(','),
+      'data-component-id': this.componentId,
+    };
+    const left = document.createElement('tr');
+    const right = document.createElement('tr');
+
+    for (const [name, value] of Object.entries(attributes)) {
+      left.setAttribute(name, value);
+      right.setAttribute(name, value);
+    }
+
+    for (const [className, highlight] of Object.entries(HIGHLIGHTS)) {
+      if (highlight.values.has(attributes[highlight.attribute])) {
+        left.classList.add(className);
+        right.classList.add(className);
       }
     }
+
+    if (this.rowHeight) {
+      left.style.height = right.style.height = `${this.rowHeight}px`;
+    }
+
+    const link = document.createElement('a');
+    link.href = data[VIRTUAL_ROW.LINK];
+    link.title = link.textContent = data[VIRTUAL_ROW.KEY];
+
+    const linkCell = this.createCell('link nowrap', '');
+    linkCell.appendChild(link);
+
+    left.append(
+      this.createCell(
+        'summary',
+        data[VIRTUAL_ROW.SUMMARY],
+        data[VIRTUAL_ROW.SUMMARY],
+      ),
+      this.createCell('type nowrap', data[VIRTUAL_ROW.TYPE]),
+      linkCell,
+      this.createCell(data[VIRTUAL_ROW.STATUS_CLASS], data[VIRTUAL_ROW.STATUS]),
+      this.createCell(
+        'assignee nowrap',
+        data[VIRTUAL_ROW.ASSIGNEE],
+        data[VIRTUAL_ROW.ASSIGNEE],
+      ),
+    );
+
+    // columns scrolled out of view are replaced with one spacer cell
+    let skipped = 0;
+    const appendSkipped = () => {
+      if (skipped) {
+        const td = document.createElement('td');
+        td.colSpan = skipped * 2;
+        right.appendChild(td);
+        skipped = 0;
+      }
+    };
+
+    const background = data[VIRTUAL_ROW.BACKGROUND];
+    this.columns.forEach((id, index) => {
+      if (columnsInView[index] === null) {
+        return;
+      }
+      if (!columnsInView[index]) {
+        skipped += 1;
+        return;
+      }
+      appendSkipped();
+
+      let estimate = this.createCell('numeric hours', '');
+      let spent = this.createCell('numeric hours', '');
+
+      if (data[VIRTUAL_ROW.CELLS].includes(index)) {
+        const className = `numeric hours ${this.kind}`;
+        const danger = data[VIRTUAL_ROW.DANGER] ? ' danger' : '';
+
+        estimate = this.createCell(
+          `${className} ${background}`,
+          data[VIRTUAL_ROW.ESTIMATE],
+        );
+        spent = this.createCell(
+          `${className}${danger} ${background}`,
+          data[VIRTUAL_ROW.SPENT],
+        );
+      } else {
+        estimate.innerHTML = spent.innerHTML = this.empty;
+      }
+
+      estimate.setAttribute(`data-${this.kind}-id`, id);
+      spent.setAttribute(`data-${this.kind}-id`, id);
+      right.append(estimate, spent);
+    });
+    appendSkipped();
+
+    return [left, right];
   }
 }
 
 /**
- * Saves settings into local storage.
+ * Initializes virtual component tables inside of element.
  */
-function saveSettings(tableName, settingsJson) {
-  localStorage.setItem(tableName, JSON.stringify(settingsJson));
+function initVirtualTables(element = document) {
+  const hasTables = virtualTables.length > 0;
+
+  element.querySelectorAll(VIRTUAL_TABLE_SELECTOR).forEach((container) => {
+    virtualTables.push(new VirtualTable(container));
+  });
+
+  if (hasTables || !virtualTables.length) {
+    return;
+  }
+
+  window.addEventListener('scroll', renderVirtualTables, {passive: true});
+  window.addEventListener('resize', renderVirtualTables, {passive: true});
 }
 
 /**
- * Returns settings json if exists else returns an empty object.
+ * Renders rows in view of all virtual tables.
  */
-function getSettings(tableName) {
-  const data = localStorage.getItem(tableName);
+function renderVirtualTables() {
+  virtualTables.forEach((table) => table.scheduleRender());
+}
 
-  if (!data) {
-    return JSON.constructor();
-  }
+/**
+ * Returns virtual tables of kind ("version" or "sprint"), optionally
+ * only of component or only inside of element.
+ */
+function getVirtualTables(kind, componentId = null, element = null) {
+  return virtualTables.filter((table) => (
+    table.kind === kind
+    && (componentId === null || table.componentId === componentId)
+    && (element === null || element.contains(table.container))
+  ));
+}
 
-  return JSON.parse(data);
+/**
+ * Toggles highlight of virtual table rows.
+ */
+function toggleVirtualHighlight(className, value) {
+  const values = HIGHLIGHTS[className].values;
+
+  values.has(value) ? values.delete(value) : values.add(value);
+  renderVirtualTables();
 }
 
 /**
- * Adds an ability to control visibility of component issue rows
- * by clicking on version columns.
+ * Appends element to the list of elements stored by key.
  */
-function init_version_columns() {
-  var versions = document.querySelectorAll(".issues th.version");
-  var settings = getSettings("components");
-  const collapsedClassName = "collapsed";
+function addToIndex(map, key, element) {
+  const elements = map.get(key);
 
-  for (var i in versions) {
-    var version = versions[i];
+  if (elements) {
+    elements.push(element);
+  } else {
+    map.set(key, [element]);
+  }
+}
 
-    if (
-        version !== undefined
-        && version.attributes !== undefined
-        && version.attributes['data-version-id'] !== undefined
-    ) {
-      var versionId = version.attributes['data-version-id'];
-      var componentId = version.attributes['data-component-id'];
+/**
+ * Returns elements stored by key in maps of all mounted tabs
+ * or only of given tab.
+ */
+function getIndexed(getMap, key, tab = null) {
+  const indexes = tab ? [tabIndexes.get(tab)] : tabIndexes.values();
+  const elements = [];
 
-      var listenerSelector = (
-        `table.component [${versionId.name}="${versionId.value}"]`
-        +`[${componentId.name}="${componentId.value}"] > span.collapse`
-      );
+  for (const index of indexes) {
+    const indexed = index && getMap(index).get(key);
 
-      document.querySelector(listenerSelector).onclick = function () {
-        var versionAttr = this.parentNode.attributes['data-version-id'];
-        var componentAttr = this.parentNode.attributes['data-component-id'];
+    if (indexed) {
+      elements.push(...indexed);
+    }
+  }
 
-        var selector = (
-          `table.component [data-version-ids="${versionAttr.value}"]`
-          +`[data-component-id="${componentAttr.value}"]`
-        );
+  return elements;
+}
+
+/**
+ * Returns scrollable rows of compact component tables by their left
+ * rows and indexes their hours cells by column ids.
+ *
+ * Compact tables set issue metadata on left rows only, component id
+ * on the table and no column ids on cells, rows and cells are matched
+ * by position.
+ */
+function indexCompactTables(tab, index) {
+  const twins = new Map();
 
-        this.classList.toggle("up");
-        this.parentNode.classList.toggle(collapsedClassName);
+  tab.querySelectorAll(COMPACT_TABLE_SELECTOR).forEach((container) => {
+    const kind = container.getAttribute('data-kind');
+    const rows = container.querySelectorAll(
+      `.combined-left tr[data-${kind}-ids]`
+    );
+    const scrollableRows = container.querySelector(
+      '.combined-right table'
+    ).rows;
+    const offset = scrollableRows.length - rows.length;
+    const columns = [...container.querySelectorAll(
+      `th.${kind}[data-${kind}-id]`
+    )].map((column) => column.getAttribute(`data-${kind}-id`));
+
+    rows.forEach((row, i) => {
+      const scrollableRow = scrollableRows[offset + i];
+
+      twins.set(row, scrollableRow);
+      [...scrollableRow.cells].forEach((cell, j) => {
+        // every column has estimate and spent cells
+        addToIndex(index[kind].elements, columns[Math.floor(j / 2)], cell);
+      });
+    });
 
-        var isVersionCollapsed = this.parentNode.classList.contains(
-          collapsedClassName
-        )
+    // long values are cut, show them on hover
+    container.querySelector('.combined-left').addEventListener(
+      'mouseover',
+      (event) => {
+        const cell = event.target.closest('td');
 
-        if (!settings[componentAttr.value]) {
-          settings[componentAttr.value] = JSON.constructor();
+        if (cell && !cell.title) {
+          cell.title = cell.textContent;
         }
+      },
+    );
+  });
+
+  return twins;
+}
+
+/**
+ * Builds maps of just mounted tab elements by assignee, parent,
+ * version, sprint and component ids.
+ *
+ * Clicks and settings look elements up in these maps instead of
+ * querying the whole document.
+ */
+function indexTab(tab) {
+  const index = {highlights: {}};
+
+  for (const kind of ['version', 'sprint']) {
+    // columns and rows by "componentId/id" and all elements by id
+    index[kind] = {
+      columns: new Map(),
+      rows: new Map(),
+      elements: new Map(),
+    };
+  }
+
+  const twins = indexCompactTables(tab, index);
+  const addRowToIndex = (map, key, row) => {
+    addToIndex(map, key, row);
+    if (twins.has(row)) {
+      addToIndex(map, key, twins.get(row));
+    }
+  };
+
+  for (const {attribute} of Object.values(HIGHLIGHTS)) {
+    if (index.highlights[attribute]) {
+      continue;
+    }
+
+    const map = index.highlights[attribute] = new Map();
+    tab.querySelectorAll(`table.component [${attribute}]`).forEach((el) => {
+      addRowToIndex(map, el.getAttribute(attribute), el);
+    });
+  }
+
+  for (const kind of ['version', 'sprint']) {
+    const kindIndex = index[kind];
+
+    tab.querySelectorAll(`.issues [data-${kind}-id]`).forEach((el) => {
+      const id = el.getAttribute(`data-${kind}-id`);
+
+      addToIndex(kindIndex.elements, id, el);
+
+      if (el.matches(`th.${kind}[data-component-id]`)) {
+        addToIndex(
+          kindIndex.columns,
+          `${el.getAttribute('data-component-id')}/${id}`,
+          el,
+        );
+      }
+    });
+
+    tab.querySelectorAll(
+      `table.component [data-${kind}-ids]`
+    ).forEach((row) => {
+      const ids = row.getAttribute(`data-${kind}-ids`);
 
-        settings[componentAttr.value][versionAttr.value] = isVersionCollapsed;
-        saveSettings("components", settings)
+      // row is hidden with any of its columns
+      for (const id of ids.split(',')) {
+        addRowToIndex(kindIndex.elements, id, row);
+      }
 
-        document.querySelectorAll(selector).forEach((el) => {
-          el.classList.toggle(collapsedClassName);
-        })
+      // and collapsed only with its single column
+      const component = row.closest('[data-component-id]');
+      if (component) {
+        addRowToIndex(
+          kindIndex.rows,
+          `${component.getAttribute('data-component-id')}/${ids}`,
+          row,
+        );
       }
+    });
+  }
+
+  tabIndexes.set(tab, index);
+}
+
+/**
+ * Highlights rows of just mounted tab as already highlighted ones.
+ */
+function applyHighlights(tab) {
+  for (const [className, highlight] of Object.entries(HIGHLIGHTS)) {
+    for (const value of highlight.values) {
+      getIndexed(
+        (index) => index.highlights[highlight.attribute],
+        value,
+        tab,
+      ).forEach((el) => {
+        el.classList.add(className);
+      });
     }
   }
 }
 
 /**
- * Adds an ability to control visibility of component issue rows
- * by clicking on version columns.
+ * Highlights or unhighlights rows related to value.
+ */
+function setHighlighted(className, value, highlighted) {
+  const highlight = HIGHLIGHTS[className];
+  const row = highlight.rows.get(value);
+
+  if (highlighted) {
+    highlight.values.add(value);
+  } else {
+    highlight.values.delete(value);
+  }
+
+  if (row) {
+    row.classList.toggle(className, highlighted);
+  }
+
+  getIndexed(
+    (index) => index.highlights[highlight.attribute],
+    value,
+  ).forEach((el) => {
+    el.classList.toggle(className, highlighted);
+  });
+  renderVirtualTables();
+
+  document.querySelectorAll(TAB_FRAME_SELECTOR).forEach((frame) => {
+    postHighlighted(frame, className, value, highlighted);
+  });
+}
+
+/**
+ * Sends highlight to tab page of split report loaded into frame.
  */
-function init_sprint_columns() {
-  var sprints = document.querySelectorAll(".issues th.sprint");
-  var settings = getSettings("components");
-  const collapsedClassName = "collapsed";
+function postHighlighted(frame, className, value, highlighted) {
+  if (frame.contentWindow) {
+    frame.contentWindow.postMessage(
+      {highlight: className, value: value, highlighted: highlighted},
+      '*',
+    );
+  }
+}
 
-  for (var i in sprints) {
-    var sprint = sprints[i];
+/**
+ * Forwards highlights of split report index page into tab frames.
+ *
+ * Frames are loaded when tabs are opened, so already highlighted rows
+ * are sent to every loaded frame, later changes are sent by
+ * `setHighlighted`.
+ */
+function initFrameHighlights() {
+  // load events don't bubble, they are captured
+  document.addEventListener('load', (event) => {
+    if (!event.target.matches || !event.target.matches(TAB_FRAME_SELECTOR)) {
+      return;
+    }
+
+    for (const [className, highlight] of Object.entries(HIGHLIGHTS)) {
+      for (const value of highlight.values) {
+        postHighlighted(event.target, className, value, true);
+      }
+    }
+  }, true);
+
+  window.addEventListener('message', (event) => {
+    const data = event.data;
 
     if (
-        sprint !== undefined
-        && sprint.attributes !== undefined
-        && sprint.attributes['data-sprint-id'] !== undefined
+      event.source !== window.parent
+      || !data
+      || !Object.hasOwn(HIGHLIGHTS, data.highlight)
     ) {
-      var sprintId = sprint.attributes['data-sprint-id'];
-      var componentId = sprint.attributes['data-component-id'];
+      return;
+    }
 
-      var listenerSelector = (
-        `table.component [${sprintId.name}="${sprintId.value}"]`
-        +`[${componentId.name}="${componentId.value}"] > span.collapse`
-      );
+    setHighlighted(data.highlight, data.value, data.highlighted);
+  });
+}
 
-      document.querySelector(listenerSelector).onclick = function () {
-        var sprintAttr = this.parentNode.attributes['data-sprint-id'];
-        var componentAttr = this.parentNode.attributes['data-component-id'];
+/**
+ * Adds an ability for highlight rows by clicking.
+ */
+function init_highlights() {
+  const sources = {
+    'highlighted': ['.assignees > tbody > tr', 'data-assignee-id'],
+    'highlighted-epic': ['.epics > tbody > tr', 'data-epic-id'],
+    'highlighted-story': ['.stories > tbody > tr', 'data-story-id'],
+  };
+
+  for (const [className, [selector, attribute]] of Object.entries(sources)) {
+    document.querySelectorAll(selector).forEach((row) => {
+      const value = row.getAttribute(attribute);
+
+      if (value === null || HIGHLIGHTS[className].rows.has(value)) {
+        return;
+      }
+
+      HIGHLIGHTS[className].rows.set(value, row);
+      row.onclick = function () {
+        // only one kind of highlight at once
+        for (const other in HIGHLIGHTS) {
+          if (other !== className) {
+            for (const highlighted of [...HIGHLIGHTS[other].values]) {
+              setHighlighted(other, highlighted, false);
+            }
+          }
+        }
 
-        var selector = (
-          `table.component [data-sprint-ids="${sprintAttr.value}"]`
-          +`[data-component-id="${componentAttr.value}"]`
+        setHighlighted(
+          className,
+          value,
+          !HIGHLIGHTS[className].values.has(value),
         );
+      }
+    });
+  }
+}
 
-        this.classList.toggle("up");
-        this.parentNode.classList.toggle(collapsedClassName);
+/**
+ * Saves settings into local storage.
+ */
+function saveSettings(tableName, settingsJson) {
+  localStorage.setItem(tableName, JSON.stringify(settingsJson));
+}
 
-        var isSprintCollapsed = this.parentNode.classList.contains(
-          collapsedClassName
-        )
+/**
+ * Returns settings json if exists else returns an empty object.
+ */
+function getSettings(tableName) {
+  const data = localStorage.getItem(tableName);
 
-        if (!settings[componentAttr.value]) {
-          settings[componentAttr.value] = JSON.constructor();
-        }
+  if (!data) {
+    return JSON.constructor();
+  }
 
-        settings[componentAttr.value][sprintAttr.value] = isSprintCollapsed;
-        saveSettings("components", settings)
+  return JSON.parse(data);
+}
 
-        document.querySelectorAll(selector).forEach((el) => {
-          el.classList.toggle(collapsedClassName);
-        })
+/**
+ * Adds an ability to control visibility of component issue rows
+ * by clicking on column headers of kind ("version" or "sprint").
+ */
+function initCollapsibleColumns(tab, kind, setCollapsed) {
+  tab.querySelectorAll(
+    `table.component th.${kind}[data-${kind}-id][data-component-id]`
+    + ' > span.collapse'
+  ).forEach((collapse) => {
+    collapse.onclick = function () {
+      var id = this.parentNode.getAttribute(`data-${kind}-id`);
+      var componentId = this.parentNode.getAttribute('data-component-id');
+      var settings = getSettings("components");
+      var isCollapsed = !this.parentNode.classList.contains("collapsed");
+
+      if (!settings[componentId]) {
+        settings[componentId] = JSON.constructor();
       }
+
+      settings[componentId][id] = isCollapsed;
+      saveSettings("components", settings)
+
+      setCollapsed(componentId, id, isCollapsed);
     }
-  }
+  });
 }
 
 /**
- * Collapses version column and hides related rows.
+ * Adds an ability to control visibility of component issue rows
+ * by clicking on version columns.
  */
-function setVersionCollapsed(componentId, versionId, collapsed = true) {
-  var versionColumnsSelector = (
-    `.issues th.version[data-component-id="${componentId}"]`
-    + `[data-version-id="${versionId}"]`
-  )
-  var versionRowsSelector = (
-    `table.component [data-component-id="${componentId}"]`
-    + `[data-version-ids="${versionId}"]`
-  );
-
-  document.querySelectorAll(versionColumnsSelector).forEach((column) => {
-    if (collapsed) {
-      column.classList.add("collapsed");
-      column.querySelector("span.collapse").classList.add("up");
-    } else {
-      column.classList.remove("collapsed");
-      column.querySelector("span.collapse").classList.remove("up");
-    }
+function init_version_columns(tab = document) {
+  initCollapsibleColumns(tab, "version", setVersionCollapsed);
+}
+
+/**
+ * Adds an ability to control visibility of component issue rows
+ * by clicking on sprint columns.
+ */
+function init_sprint_columns(tab = document) {
+  initCollapsibleColumns(tab, "sprint", setSprintCollapsed);
+}
+
+/**
+ * Collapses column of kind ("version" or "sprint") in component
+ * tables and hides related rows.
+ */
+function setColumnCollapsed(kind, componentId, id, collapsed) {
+  const key = `${componentId}/${id}`;
+
+  getIndexed((index) => index[kind].columns, key).forEach((column) => {
+    column.classList.toggle("collapsed", collapsed);
+    column.querySelector("span.collapse").classList.toggle("up", collapsed);
   });
 
-  document.querySelectorAll(versionRowsSelector).forEach((row) => {
-    if (collapsed) {
-      row.classList.add("collapsed");
-    } else {
-      row.classList.remove("collapsed");
-    }
+  getIndexed((index) => index[kind].rows, key).forEach((row) => {
+    row.classList.toggle("collapsed", collapsed);
+  });
+
+  getVirtualTables(kind, componentId).forEach((table) => {
+    table.setCollapsed(id, collapsed);
   });
 }
 
+/**
+ * Collapses version column and hides related rows.
+ */
+function setVersionCollapsed(componentId, versionId, collapsed = true) {
+  setColumnCollapsed("version", componentId, versionId, collapsed);
+}
+
 /**
  * Collapses sprint column and hides related rows.
  */
 function setSprintCollapsed(componentId, sprintId, collapsed = true) {
-  var sprintColumnsSelector = (
-    `.issues th.sprint[data-component-id="${componentId}"]`
-    + `[data-sprint-id="${sprintId}"]`
-  )
-  var sprintRowsSelector = (
-    `table.component [data-component-id="${componentId}"]`
-    + `[data-sprint-ids="${sprintId}"]`
-  );
-
-  document.querySelectorAll(sprintColumnsSelector).forEach((column) => {
-    if (collapsed) {
-      column.classList.add("collapsed");
-      column.querySelector("span.collapse").classList.add("up");
-    } else {
-      column.classList.remove("collapsed");
-      column.querySelector("span.collapse").classList.remove("up");
-    }
-  });
-
-  document.querySelectorAll(sprintRowsSelector).forEach((row) => {
-    if (collapsed) {
-      row.classList.add("collapsed");
-    } else {
-      row.classList.remove("collapsed");
-    }
-  });
+  setColumnCollapsed("sprint", componentId, sprintId, collapsed);
 }
 
 /**
  * Hides version column and hides related rows.
  */
 function setVersionHidden(versionId, hidden = true) {
-  var versionColumnsSelector = (
-    `.issues [data-version-id="${versionId}"]`
-  )
-  var versionRowsSelector = (
-    `table.component [data-version-ids*="${versionId}"]`
-  );
-
-  document.querySelectorAll(versionColumnsSelector).forEach((column) => {
-    if (hidden) {
-      column.classList.add("hidden");
-    } else {
-      column.classList.remove("hidden");
-    }
+  getIndexed((index) => index.version.elements, versionId).forEach((el) => {
+    el.classList.toggle("hidden", hidden);
   });
 
-  document.querySelectorAll(versionRowsSelector).forEach((row) => {
-    if (hidden) {
-      row.classList.add("hidden");
-    } else {
-      row.classList.remove("hidden");
-    }
+  getVirtualTables("version").forEach((table) => {
+    table.setHidden(versionId, hidden);
   });
 }
 
@@ -350,27 +829,16 @@ function setVersionHidden(versionId, hidden = true) {
  * Hides sprint column and hides related rows.
  */
 function setSprintHidden(sprintId, tab, hidden = true) {
-  var sprintColumnsSelector = (
-    `.issues [data-sprint-id="${sprintId}"]`
-  )
-  var sprintRowsSelector = (
-    `table.component [data-sprint-ids="${sprintId}"]`
-  );
-
-  tab.querySelectorAll(sprintColumnsSelector).forEach((column) => {
-    if (hidden) {
-      column.classList.add("hidden");
-    } else {
-      column.classList.remove("hidden");
-    }
+  getIndexed(
+    (index) => index.sprint.elements,
+    sprintId,
+    tab,
+  ).forEach((el) => {
+    el.classList.toggle("hidden", hidden);
   });
 
-  tab.querySelectorAll(sprintRowsSelector).forEach((row) => {
-    if (hidden) {
-      row.classList.add("hidden");
-    } else {
-      row.classList.remove("hidden");
-    }
+  getVirtualTables("sprint", null, tab).forEach((table) => {
+    table.setHidden(sprintId, hidden);
   });
 }
 
@@ -400,103 +868,121 @@ function applyVersionComponentTableSettings() {
 }
 
 /**
- * Applies stored settings for version "components" table.
+ * Applies stored settings for board tab "components" tables.
  */
-function applySprintComponentTableSettings() {
+function applySprintComponentTableSettings(tab) {
   const componentSettings = getSettings("components");
-  const tabs = document.getElementsByClassName(TAB_CONTENT_CLASS);
-
-  for (const tab of tabs) {
-    const sprintSettings = getSettings(getSprintSettingsId(tab));
-    for (const componentId in componentSettings) {
-      for (var sprintId in componentSettings[componentId]) {
-        setSprintCollapsed(
-          componentId,
-          sprintId,
-          componentSettings[componentId][sprintId],
-        );
-      }
-    }
-  
-    for (const sprintId in sprintSettings) {
-      setSprintHidden(
+  const sprintSettings = getSettings(getSprintSettingsId(tab));
+
+  for (const componentId in componentSettings) {
+    for (var sprintId in componentSettings[componentId]) {
+      setSprintCollapsed(
+        componentId,
         sprintId,
-        tab,
-        !sprintSettings[sprintId],
+        componentSettings[componentId][sprintId],
       );
-    } 
+    }
   }
-}
 
-/**
- * Calculate summary for selected versions
- */
-function recalculateSelectedVersions(tab, checkboxArray) {
-  aggregateSelectedRows(tab, checkboxArray, SUM_COLUMNS_NAMES, true, calculateSumForSelected);  
-  aggregateSelectedRows(tab, checkboxArray, AVERAGE_COLUMN_NAMES, true, calculateAverageForSelected);    
+  for (const sprintId in sprintSettings) {
+    setSprintHidden(
+      sprintId,
+      tab,
+      !sprintSettings[sprintId],
+    );
+  }
 }
 
 /**
- * Calculate summary for selected sprints
+ * Summary of selected Versions or Sprints table rows.
+ *
+ * Row values are read once, sums are updated incrementally when rows
+ * are selected or deselected.
  */
-function recalculateSelectedSprints(tab, checkboxArray) {
-  aggregateSelectedRows(tab, checkboxArray, SUM_COLUMNS_NAMES, false, calculateSumForSelected);
-  aggregateSelectedRows(tab, checkboxArray, AVERAGE_COLUMN_NAMES, false, calculateAverageForSelected);  
-}
-
-function aggregateSelectedRows(
-  tab, 
-  checkboxArray, 
-  columnNames,
-  isVersion,
-  aggregator
-) {
-  const attributePrefix = isVersion ? 'version' : 'sprint';
+class Selection {
+  constructor(tab, kind) {
+    this.cells = new Map();
+    this.values = new Map();
+    this.selected = new Set();
+    this.sums = {};
+    this.counts = {};
+
+    for (const columnName of [...SUM_COLUMNS_NAMES, ...AVERAGE_COLUMN_NAMES]) {
+      const cell = tab.querySelector(`[data-column-name="${columnName}"]`);
+
+      if (cell) {
+        this.cells.set(columnName, cell);
+      }
+      this.sums[columnName] = 0;
+      this.counts[columnName] = 0;
+    }
 
-  const selectedRowIds = checkboxArray
-    .filter(checkbox => checkbox.checked)
-    .map(checkbox => checkbox.getAttribute(`data-${attributePrefix}-id`));
-  
-    for (const columnName of columnNames) {
-      const aggregationCell = tab.querySelector(`[data-column-name="${columnName}"]`);
+    tab.querySelectorAll(`[data-row-${kind}-id]`).forEach((row) => {
+      const id = row.getAttribute(`data-row-${kind}-id`);
+      const values = {};
 
-      if (!aggregationCell) {
-        continue;
+      if (this.values.has(id)) {
+        return;
       }
-    
-      const cells = selectedRowIds.map(selectedRowId => tab.querySelector(
-        `[data-row-${attributePrefix}-id="${selectedRowId}"] [data-row-${attributePrefix}-column-name="${columnName}"]`
-      ));
 
-      aggregationCell.textContent = aggregator(cells) ?? '';
+      row.querySelectorAll(
+        `[data-row-${kind}-column-name]`
+      ).forEach((cell) => {
+        values[cell.getAttribute(`data-row-${kind}-column-name`)] = (
+          parseFloat(cell.textContent) || 0
+        );
+      });
+      this.values.set(id, values);
+    });
+  }
+
+  setSelected(id, selected) {
+    if (selected === this.selected.has(id)) {
+      return;
     }
-}
 
-function calculateSumForSelected(cells) {
-  const value = cells.reduce((acc, cell) => acc + parseFloat(cell.textContent) || 0, 0);
+    const sign = selected ? 1 : -1;
+    const values = this.values.get(id) || {};
 
-  return Number(value.toFixed(2));
-}
+    if (selected) {
+      this.selected.add(id);
+    } else {
+      this.selected.delete(id);
+    }
 
-function calculateAverageForSelected(cells) {
-  let value = 0;
-  let divider = 0;
-  cells.forEach(cell => {
-    let parsedValue = parseFloat(cell.textContent)
+    for (const columnName of SUM_COLUMNS_NAMES) {
+      this.sums[columnName] += sign * (values[columnName] || 0);
+    }
 
-    if (parsedValue && parsedValue > 0) {
-      value += parsedValue;
-      divider += 1;
+    // average of positive values only
+    for (const columnName of AVERAGE_COLUMN_NAMES) {
+      if (values[columnName] > 0) {
+        this.sums[columnName] += sign * values[columnName];
+        this.counts[columnName] += sign;
+      }
     }
-  });
+  }
 
-  return divider ? Number((value/divider).toFixed(2)) : null;
+  render() {
+    for (const [columnName, cell] of this.cells) {
+      let value = this.sums[columnName];
+
+      if (AVERAGE_COLUMN_NAMES.includes(columnName)) {
+        value = this.counts[columnName]
+          ? value / this.counts[columnName]
+          : null;
+      }
+
+      cell.textContent = value === null ? '' : Number(value.toFixed(2));
+    }
+  }
 }
 
 function initSelectAllCheckbox(
-  tab, 
-  checkboxArray, 
-  isVersion
+  tab,
+  checkboxArray,
+  isVersion,
+  selection
 ) {
   const selectAllCheckbox = document.createElement('input');
   selectAllCheckbox.type = 'checkbox';
@@ -511,23 +997,20 @@ function initSelectAllCheckbox(
     const settings = getSettings(settingsId);
     for (const checkbox of checkboxArray) {
       checkbox.checked = checked;
-      
+
       let id = 0;
       if (isVersion)  {
         id = checkbox.getAttribute(VERSION_ID_CHECKBOX_ATTRIBUTE);
         setVersionHidden(id, !checked);
       } else {
         id = checkbox.getAttribute(SPRINT_ID_CHECKBOX_ATTRIBUTE);
-        setSprintHidden(id, tab, !checked);  
+        setSprintHidden(id, tab, !checked);
       }
       settings[id] = checked;
+      selection.setSelected(id, checked);
     }
     saveSettings(settingsId, settings);
-    if (isVersion) {
-      recalculateSelectedVersions(tab, checkboxArray);
-    } else {
-      recalculateSelectedSprints(tab, checkboxArray);
-    }
+    selection.render();
   });
 
   const setChecked = () => {
@@ -535,7 +1018,7 @@ function initSelectAllCheckbox(
   };
 
   for (const checkbox of checkboxArray) {
-    checkbox.addEventListener('change', setChecked);  
+    checkbox.addEventListener('change', setChecked);
   }
 
   setChecked();
@@ -553,6 +1036,12 @@ function init_version_selector() {
 
   const checkboxArray = [...checkboxes];
 
+  if (checkboxes.length === 0) {
+    return;
+  }
+
+  const selection = new Selection(tab, 'version');
+
   checkboxArray.forEach(function(checkbox) {
     var attr = checkbox.attributes["data-version-id"];
     var isChecked = true;
@@ -563,6 +1052,7 @@ function init_version_selector() {
     }
 
     checkbox.checked = isChecked;
+    selection.setSelected(attr.value, isChecked);
 
     checkbox.addEventListener("change", function() {
       settings = getSettings(VERSION_SETTINGS_ID);
@@ -570,57 +1060,95 @@ function init_version_selector() {
       saveSettings(VERSION_SETTINGS_ID, settings);
       setVersionHidden(attr.value, !this.checked);
 
-      recalculateSelectedVersions(tab, checkboxArray);
+      selection.setSelected(attr.value, this.checked);
+      selection.render();
     });
   });
 
-  recalculateSelectedVersions(tab, checkboxArray);
-  initSelectAllCheckbox(tab, checkboxArray, true);
+  selection.render();
+  initSelectAllCheckbox(tab, checkboxArray, true, selection);
 }
 
 /**
- * Initializes checkboxes in Sprint table.
+ * Initializes checkboxes in Sprint table of board tab.
  */
-function init_sprint_selector() {
-  const tabs = document.getElementsByClassName(TAB_CONTENT_CLASS);
-  
-  for (const tab of tabs) {
-    const settingsId = getSprintSettingsId(tab);
-    let settings = getSettings(settingsId);
-    const checkboxes = tab.querySelectorAll(
-      "table.sprints input[type=checkbox]"
-    )
+function init_sprint_selector(tab) {
+  const settingsId = getSprintSettingsId(tab);
+  let settings = getSettings(settingsId);
+  const checkboxes = tab.querySelectorAll(
+    "table.sprints input[type=checkbox]"
+  )
 
-    const checkboxArray = [...checkboxes];
+  const checkboxArray = [...checkboxes];
 
-    if (checkboxes.length === 0) {
-      continue;
+  if (checkboxes.length === 0) {
+    return;
+  }
+
+  const selection = new Selection(tab, 'sprint');
+
+  checkboxArray.forEach(function(checkbox) {
+    const attr = checkbox.attributes[SPRINT_ID_CHECKBOX_ATTRIBUTE];
+    let isChecked = true;
+
+    // set initial state -- displayed
+    if (settings[attr.value] != undefined) {
+      isChecked = settings[attr.value];
     }
-  
-    checkboxArray.forEach(function(checkbox) {
-      const attr = checkbox.attributes[SPRINT_ID_CHECKBOX_ATTRIBUTE];
-      let isChecked = true;
-  
-      // set initial state -- displayed
-      if (settings[attr.value] != undefined) {
-        isChecked = settings[attr.value];
-      }
-  
-      checkbox.checked = isChecked;
-  
-      checkbox.addEventListener("change", function() {
-        settings = getSettings(settingsId);
-        settings[attr.value] = this.checked;
-        saveSettings(settingsId, settings);
-        setSprintHidden(attr.value, tab, !this.checked);
-  
-        recalculateSelectedSprints(tab, checkboxArray);
-      });
+
+    checkbox.checked = isChecked;
+    selection.setSelected(attr.value, isChecked);
+
+    checkbox.addEventListener("change", function() {
+      settings = getSettings(settingsId);
+      settings[attr.value] = this.checked;
+      saveSettings(settingsId, settings);
+      setSprintHidden(attr.value, tab, !this.checked);
+
+      selection.setSelected(attr.value, this.checked);
+      selection.render();
     });
+  });
+
+  // summary for selected sprints
+  selection.render();
+  initSelectAllCheckbox(tab, checkboxArray, false, selection);
+}
+
+/**
+ * Mounts tab content from its template and applies tab settings.
+ *
+ * Tab contents are kept inert until the tab is opened for the first
+ * time, so page load doesn't depend on the number of boards.
+ */
+function mountTab(id) {
+  id = String(id);
 
-    // recalculate summary for selected sprints
-    recalculateSelectedSprints(tab, checkboxArray);
-    initSelectAllCheckbox(tab, checkboxArray, false);
+  if (mountedTabIds.has(id)) {
+    return;
+  }
+  mountedTabIds.add(id);
+
+  const tab = document.querySelector(`[data-tab-content-id="${id}"]`);
+  const template = tab.querySelector(TAB_TEMPLATE_SELECTOR);
+
+  if (template) {
+    tab.appendChild(template.content);
+    template.remove();
+  }
+
+  indexTab(tab);
+  initVirtualTables(tab);
+  applyHighlights(tab);
+
+  if (id == VERSION_TAB_ID) {
+    init_version_selector();
+    init_version_columns(tab);
+    applyVersionComponentTableSettings();
+  } else {
+    init_sprint_selector(tab);
+    init_sprint_columns(tab);
+    applySprintComponentTableSettings(tab);
   }
 }
 
@@ -631,7 +1159,9 @@ function setActiveTab(id) {
   var contentSelector = `[data-tab-content-id="${id}"]`;
   var tab = document.querySelector(`[data-tab-header-id="${id}"]`);
   var tabs = document.querySelectorAll(".tab-header");
-  var contents = document.querySelectorAll(".tab-content");
+  var contents = document.querySelectorAll(`.${TAB_CONTENT_CLASS}`);
+
+  mountTab(id);
 
   tabs.forEach(function(item) {
     item.classList.remove("active");
@@ -643,6 +1173,8 @@ function setActiveTab(id) {
   // set current tab active
   tab.classList.toggle("active");
   document.querySelector(contentSelector).classList.toggle("active");
+
+  renderVirtualTables();
 }
 
 /**
@@ -673,6 +1205,18 @@ function applyTabsSettings() {
       a => a.attributes["data-tab-header-id"].value
   )
 
+  // standalone tab page of split report has no tabs header
+  if (!availableTabIds.length) {
+    document.querySelectorAll(`.${TAB_CONTENT_CLASS}`).forEach(
+      function(item) {
+        mountTab(item.attributes["data-tab-content-id"].value);
+        item.classList.add("active");
+      },
+    );
+    renderVirtualTables();
+    return;
+  }
+
   if (activeTabId && availableTabIds.includes(activeTabId)) {
     setActiveTab(activeTabId);
   } else {
@@ -685,19 +1229,14 @@ function applyTabsSettings() {
  */
 function init_reports() {
   init_highlights();
-
-  init_version_selector();
-  init_version_columns();
-
-  init_sprint_selector()
-  init_sprint_columns();
-
+  initFrameHighlights();
   initTabs();
 
-  applyVersionComponentTableSettings();
-  applySprintComponentTableSettings();
+  // tabs are mounted when they are opened
   applyTabsSettings();
 }
 
-document.addEventListener("DOMContentLoaded", init_reports);
-export { init_reports };
\ No newline at end of file
+document.addEventListener("DOMContentLoaded", () => {
+  // tables of compressed report are inflated by loader in template
+  Promise.resolve(window.sectionsLoaded).then(init_reports);
+});
\ No newline at end of file
@@ -1,5 +1,7 @@
 from pandas import DataFrame
 
+from ..cube import Cube, build_cube
+from ..model import Matrix, MatrixRow, build_assignees_matrix
 from ..utils.colors import get_danger_color_class
 from ..utils.tables import generate_component_columns
 from ..utils.tags import TD, TH, TR, Div, NumTD, Table
@@ -8,23 +10,32 @@ from ..utils.tags import TD, TH, TR, Div, NumTD, Table
 def generate_assignees_table(
     df: DataFrame,
     assignees: list,
+    cube: Cube | None = None,
     **table_options: str,
 ):
+    return render_assignees_table(
+        build_assignees_matrix(
+            build_cube(df) if cube is None else cube,
+            assignees,
+        ),
+        **table_options,
+    )
+
+
+def render_assignees_table(matrix: Matrix, **table_options: str):
     rows = []
     scrollable_rows = []
+    components = matrix.components
 
-    components = sorted(
-        df.components.explode().unique().tolist(),
-        key=lambda x: getattr(x, "name", ""),
-    )
-
-    def _generate_row(name, df, components, estimate, spent, **attrs) -> TR:
+    def _generate_row(row_data: MatrixRow, **attrs) -> TR:
         row = TR(**attrs)
         scrollable_row = TR(**attrs)
+        estimate = round(row_data.totals.estimate, 1)
+        spent = round(row_data.totals.spent, 1)
         left = round(estimate - spent, 1)
 
-        row.append(TD(name))
-        row.append(NumTD(len(df)))
+        row.append(TD(row_data.name))
+        row.append(NumTD(row_data.totals.count))
         row.append(NumTD(estimate))
         row.append(NumTD(spent, **{
             "class": get_danger_color_class(spent > estimate),
@@ -32,7 +43,10 @@ def generate_assignees_table(
         row.append(NumTD(left if estimate and left > 0 else 0))
 
         # add component columns filled in with values
-        for col in generate_component_columns(df, components):
+        for col in generate_component_columns(
+            row_data.components,
+            components,
+        ):
             scrollable_row.append(col)
 
         return row, scrollable_row
@@ -63,23 +77,11 @@ def generate_assignees_table(
     scrollable_header.append(scrollable_subheader)
 
     # body
-    for assignee in assignees:
-        assignee_issues = df[df["assignee"].apply(
-            lambda x: x == assignee,
-        )]
-        count = len(assignee_issues)
-
-        if count == 0:
-            continue
-
+    for assignee in matrix.rows:
         row, scollable_row = _generate_row(
-            getattr(assignee, "displayName", None),
-            assignee_issues,
-            components,
-            round(assignee_issues.estimate.sum(), 1),
-            round(assignee_issues.spent.sum(), 1),
+            assignee,
             **{
-                "data-assignee-id": getattr(assignee, "accountId", None),
+                "data-assignee-id": assignee.id,
             },
         )
 
@@ -0,0 +1,153 @@
+from typing import List
+
+from ..model import (
+    DURATION_PERCENTILES,
+    Distribution,
+    DistributionMatrix,
+    DistributionRow,
+)
+from ..utils.tags import TD, TH, TR, Div, NumTD, Table
+
+DAYS_NDIGITS = 1
+
+
+def generate_percentile_columns(distribution: Distribution) -> List[TD]:
+    return [
+        NumTD(round(value, DAYS_NDIGITS))
+        for value in distribution.percentiles
+    ]
+
+
+def generate_component_columns(
+    matrix: DistributionMatrix,
+    row: DistributionRow,
+) -> List[TD]:
+    """Count and median days of components, the rest of percentiles in
+    title. Columns of components without issues are empty.
+
+    """
+    columns = []
+
+    for component in matrix.components:
+        distribution = row.components.get(component.id)
+
+        if distribution is None:
+            columns.append(TD("&nbsp;"))
+            columns.append(TD("&nbsp;"))
+            continue
+
+        columns.append(NumTD(distribution.count))
+        columns.append(NumTD(
+            round(distribution.percentiles[0], DAYS_NDIGITS),
+            title=", ".join(
+                f"P{percentile}: {round(value, DAYS_NDIGITS)}"
+                for percentile, value in zip(
+                    DURATION_PERCENTILES,
+                    distribution.percentiles,
+                )
+            ),
+        ))
+
+    return columns
+
+
+def render_durations_table(
+    matrix: DistributionMatrix,
+    title: str,
+    **table_options: str,
+):
+    """Render days distributions of `title` rows (status or assignee)."""
+    rows = []
+    scrollable_rows = []
+    components = matrix.components
+
+    def _generate_row(row_data: DistributionRow, **attrs) -> TR:
+        row = TR(**attrs)
+        scrollable_row = TR(**attrs)
+
+        row.append(TD(row_data.name))
+        row.append(NumTD(row_data.total.count))
+        for col in generate_percentile_columns(row_data.total):
+            row.append(col)
+
+        # add component columns filled in with values
+        for col in generate_component_columns(matrix, row_data):
+            scrollable_row.append(col)
+
+        return row, scrollable_row
+
+    # header
+    header = TR(**{"class": "h50"})
+    header.append(TH(title, **{"class": "nowrap"}))
+    header.append(TH("Issues", **{"class": "hours"}))
+    for percentile in DURATION_PERCENTILES:
+        header.append(TH(f"P{percentile}", **{
+            "class": "hours",
+            "title": f"Days, {percentile}th percentile",
+        }))
+
+    rows.append(header)
+
+    # scrollable header
+    scrollable_header = TR(**{"class": "h25"})
+    for component in components:
+        scrollable_header.append(TH(component.name, **{"colspan": 2}))
+
+    scrollable_rows.append(scrollable_header)
+
+    # scrollable subheader
+    scrollable_subheader = TR(**{"class": "h25"})
+    kwargs = {"class": "subheader hours"}
+    for _component in components:
+        scrollable_subheader.append(TH("Issues", **kwargs))
+        scrollable_subheader.append(TH(
+            f"P{DURATION_PERCENTILES[0]}",
+            **kwargs,
+        ))
+
+    scrollable_header.append(scrollable_subheader)
+
+    # body
+    for row_data in matrix.rows:
+        row, scrollable_row = _generate_row(
+            row_data,
+            **{"data-row-id": row_data.id},
+        )
+
+        rows.append(row)
+        scrollable_rows.append(scrollable_row)
+
+    # footer
+    if matrix.summary is not None:
+        footer_row, footer_scrollable_row = _generate_row(
+            matrix.summary,
+            **{"class": "summary"},
+        )
+        rows.append(footer_row)
+        scrollable_rows.append(footer_scrollable_row)
+
+    if not components:
+        return Table(rows, **table_options)
+
+    return Div(
+        Div(
+            Table(rows, **table_options),
+            **{"class": "combined-left"},
+        ),
+        Div(
+            Table(scrollable_rows, **table_options),
+            **{"class": "combined-right scrollable"},
+        ),
+        **{"class": "combined"},
+    )
+
+
+def render_time_in_status_table(
+    matrix: DistributionMatrix,
+    **table_options: str,
+):
+    return render_durations_table(matrix, "Status", **table_options)
+
+
+def render_cycle_time_table(matrix: DistributionMatrix, **table_options: str):
+    return render_durations_table(matrix, "Assignee", **table_options)
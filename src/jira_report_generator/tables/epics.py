@@ -1,31 +1,29 @@
 from pandas import DataFrame
 
-from ..constants import Status
+from ..cube import Cube, build_cube
+from ..model import RollupRow, build_rollup
 from ..utils.tags import TD, TH, TR, A, NumTD, Table
 
 
 def generate_epics_table(
         df: DataFrame,
         epics: DataFrame,
+        cube: Cube | None = None,
         **table_options: str,
 ):
+    return render_epics_table(
+        build_rollup(build_cube(df) if cube is None else cube, epics),
+        **table_options,
+    )
+
+
+def render_epics_table(epics: list[RollupRow], **table_options: str):
     rows = []
     header = TR()
 
-    if epics.empty:
+    if not epics:
         return Table(rows, **table_options)
 
-    epics_list = list(epics.iterrows())
-    completed_statuses = (
-        *Status.CLIENT_REVIEW.value,
-        *Status.COMPLETED.value,
-        *Status.VERIFIED.value,
-        *Status.TM_PM_VERIFY.value,
-    )
-    qa_statuses = (
-        *Status.IN_QA.value,
-    )
-
     header.append(TH("Epic"))
     header.append(TH("Jira ID"))
     header.append(TH("Status", **{"class": "status"}))
@@ -38,42 +36,22 @@ def generate_epics_table(
 
     rows.append(header)
 
-    for _, epic in epics_list:
+    for epic in epics:
         row = TR(**{"data-epic-id": epic.id})
-        epic_tasks = df[df["parent"].apply(
-            lambda x: x is not None and x.id == epic.id,
-        )]
-        epic_completed_tasks = epic_tasks[epic_tasks["status"].apply(
-            lambda x: x.name in completed_statuses,
-        )]
-        epic_qa_tasks = epic_tasks[epic_tasks["status"].apply(
-            lambda x: x.name in qa_statuses,
-        )]
-        estimate = round(epic_tasks.estimate.sum(), 1)
-        spent = round(epic_tasks.spent.sum(), 1)
+        estimate = round(epic.totals.estimate, 1)
+        spent = round(epic.totals.spent, 1)
         left = round(estimate - spent, 1)
 
         row.append(TD(epic.summary))
         row.append(TD(A(epic.key, href=epic.link)))
         row.append(TD(epic.status, **{"class": "status nowrap"}))
-        row.append(NumTD(epic_tasks.id.count()))
-        row.append(NumTD(
-            epic_qa_tasks.id.count()
-            if not epic_qa_tasks.empty
-            else 0,
-        ))
-        row.append(NumTD(
-            epic_completed_tasks.id.count()
-            if not epic_completed_tasks.empty
-            else 0,
-        ))
+        row.append(NumTD(epic.totals.count))
+        row.append(NumTD(epic.testing))
+        row.append(NumTD(epic.completed))
         row.append(NumTD(estimate))
         row.append(NumTD(spent))
         row.append(NumTD(left if left > 0 else 0))
 
         rows.append(row)
 
-    if not epics_list:
-        rows = []
-
     return Table(rows, **table_options)
@@ -1,7 +1,12 @@
 from pandas import DataFrame
 
-from ..constants import Status
 from ..utils.formatters import format_name
+from ..utils.tables import (
+    generate_compact_table,
+    generate_virtual_table,
+    get_status_classes,
+    get_virtual_rows,
+)
 from ..utils.tags import TD, TH, TR, A, Div, NumTD, Table
 
 
@@ -9,8 +14,17 @@ def generate_issues_table(
     df: DataFrame,
     versions: list,
     component_id: str,
+    virtual: bool = False,
+    compact: bool = False,
     **table_options: str,
 ):
+    """Generate component issues table.
+
+    With `virtual` issues rows are embedded as JSON and rendered
+    by `script.js` only when they are scrolled into view. With `compact`
+    issues rows are rendered with minimal markup.
+
+    """
     rows = []
     scrollable_rows = []
 
@@ -65,6 +79,49 @@ def generate_issues_table(
 
     scrollable_header.append(scrollable_subheader)
 
+    version_indexes = {
+        version.id: index
+        for index, version in enumerate(versions)
+    }
+    columns = [str(version.id) for version in versions]
+
+    def get_cells(item) -> tuple[list[int], int]:
+        """Returns indexes of issue columns and divisor of its hours."""
+        return (
+            [
+                version_indexes[version.id]
+                for version in versions
+                if version in item.versions
+            ],
+            len(item.versions),
+        )
+
+    if virtual:
+        return generate_virtual_table(
+            rows,
+            scrollable_rows,
+            {
+                "kind": "version",
+                "componentId": component_id,
+                "columns": columns,
+                "empty": "&nbsp;",
+                "rows": get_virtual_rows(df, get_cells),
+            },
+            **table_options,
+        )
+
+    if compact:
+        return generate_compact_table(
+            df,
+            rows,
+            scrollable_rows,
+            "version",
+            columns,
+            component_id,
+            get_cells,
+            **table_options,
+        )
+
     # table body
     for _, item in df.iterrows():
         version_ids = []
@@ -94,8 +151,7 @@ def generate_issues_table(
                 else ""
             ),
         })
-        status_attrs = {"class": "status nowrap"}
-        background = "default"
+        status_class, background = get_status_classes(item.status)
 
         # summary
         tr.append(TD(item.summary, **{
@@ -117,23 +173,8 @@ def generate_issues_table(
             ),
         )
 
-        if item.status.name in (
-                *Status.VERIFIED.value,
-                *Status.CLIENT_REVIEW.value,
-                *Status.COMPLETED.value,
-                *Status.TM_PM_VERIFY.value,
-        ):
-            status_attrs.update({"class": "status nowrap success"})
-            background = "done"
-        elif item.status.name in (
-                *Status.IN_QA.value,
-                *Status.CODE_REVIEW.value,
-        ):
-            status_attrs.update({"class": "status nowrap warning"})
-            background = "in-progress"
-
         # status
-        tr.append(TD(item.status.name, **status_attrs))
+        tr.append(TD(item.status.name, **{"class": status_class}))
 
         # assignee
         display_name = format_name(getattr(item.assignee, "displayName", ""))
@@ -1,9 +1,10 @@
-from collections import defaultdict
 from typing import List
 
-from jira.resources import Component
 from pandas import DataFrame
 
+from ..cube import Cube, build_cube
+from ..forecast import FORECAST_PERCENTILES
+from ..model import Timeline, TimelineCell, TimelineRow, build_sprints_timeline
 from ..utils.tags import TD, TH, TR, Div, Input, NumTD, Table
 
 HOURS_NDIGITS = 1
@@ -13,77 +14,53 @@ TASKS = "tasks"
 ESTIMATED = "estimated"
 SPENT = "spent"
 OVERTIME = "overtime"
-PROJECTION = "projection"
+LOGGED = "logged-in-period"
 
 DATA_ROW_SPRINT_ID = "data-row-sprint-id"
 DATA_ROW_SPRINT_COLUMN_NAME = "data-row-sprint-column-name"
 DATA_COLUMN_NAME = "data-column-name"
 
-CLOSED = "closed"
 
-
-def calculate_avg_overtime(overtimes: List[float]) -> float:
-
-    try:
-        result = sum(overtimes) / len(overtimes)
-    except ZeroDivisionError:
-        result = 0.0
-
-    return result
-
-
-def predict_estimate(estimate: float, overtime: float) -> float:
-    return estimate * overtime
+def generate_forecast_columns(cell: TimelineCell) -> List[TD]:
+    """Projected hours percentiles, empty without forecast."""
+    return [
+        NumTD(round(value, HOURS_NDIGITS) if cell.forecast else "")
+        for value in cell.forecast or FORECAST_PERCENTILES
+    ]
 
 
 def generate_component_columns(
-        df: DataFrame,
-        components: list,
-        component_overtimes_map: dict = None,
+        timeline: Timeline,
+        row: TimelineRow,
         display_overtime: bool = False,
         summary: bool = False,
 ) -> List[TD]:
     columns = []
 
-    for component in components:
-        component_tasks = df[df["components"].apply(
-            lambda x: component in x,
-        )]
-        avg_component_overtime = None
+    for component in timeline.components:
+        cell = row.components.get(component.id)
 
         # generate empty columns
-        if component_tasks.empty:
-            columns.append(TD("&nbsp;"))
+        if cell is None:
             columns.append(TD("&nbsp;"))
             columns.append(TD("&nbsp;"))
             columns.append(TD("&nbsp;"))
             columns.append(TD("&nbsp;"))
+            for _ in FORECAST_PERCENTILES:
+                columns.append(TD("&nbsp;"))
             continue
 
-        component_estimate = round(
-            component_tasks.estimate.sum(),
-            HOURS_NDIGITS,
-        )
-        component_spent = round(
-            component_tasks.spent.sum(),
-            HOURS_NDIGITS,
-        )
-        component_overtime = None
-
-        # calculate overtime only for non-summary rows
-        if component_spent and component_estimate and not summary:
-            component_overtime = component_spent / component_estimate
-
-        # calculate component avg overtime
-        if component_overtimes_map:
-            avg_component_overtime = calculate_avg_overtime(
-                component_overtimes_map[component.id],
-            )
+        component_estimate = round(cell.totals.estimate, HOURS_NDIGITS)
+        component_spent = round(cell.totals.spent, HOURS_NDIGITS)
 
-        if summary and avg_component_overtime:
-            component_overtime = avg_component_overtime
+        # summary rows show average overtime
+        component_overtime = (
+            cell.historical_overtime
+            if summary
+            else cell.overtime
+        )
 
-        columns.append(NumTD(component_tasks.id.count()))
+        columns.append(NumTD(cell.totals.count))
         columns.append(NumTD(component_estimate))
         columns.append(NumTD(component_spent, **{
             "class": (
@@ -98,15 +75,7 @@ def generate_component_columns(
             if component_overtime and (display_overtime or summary)
             else "",
         ))
-        columns.append(NumTD(
-            round(predict_estimate(
-                component_estimate,
-                avg_component_overtime,
-            ), HOURS_NDIGITS)
-            if avg_component_overtime
-            else "",
-            title=f"{component_estimate}*{avg_component_overtime}",
-        ))
+        columns.extend(generate_forecast_columns(cell))
 
     return columns
 
@@ -114,19 +83,28 @@ def generate_component_columns(
 def generate_sprints_table(
     df: DataFrame,
     sprints: list,
+    cube: Cube | None = None,
+    worklogs: DataFrame | None = None,
     **table_options: str,
 ):
-    rows = []
-    scrollable_rows = []
-    components = sorted(
-        filter(
-            lambda x: isinstance(x, Component),
-            df.components.explode().unique().tolist(),
+    """Pass `worklogs` of board issues to show hours logged in sprints."""
+    return render_sprints_table(
+        build_sprints_timeline(
+            build_cube(df) if cube is None else cube,
+            sprints,
+            worklogs,
         ),
-        key=lambda x: getattr(x, "name", ""),
+        **table_options,
     )
-    overtimes = []
-    component_overtimes_map = defaultdict(list)
+
+
+def render_sprints_table(timeline: Timeline, **table_options: str):
+    rows = []
+    scrollable_rows = []
+    components = timeline.components
+    # hours logged during sprints periods are shown if worklogs were
+    # collected
+    logged = timeline.summary.logged_in_period is not None
 
     # table header
     header = TR(**{"class": "h50"})
@@ -137,15 +115,29 @@ def generate_sprints_table(
     header.append(TH("Tasks", **{"class": "subheader hours"}))
     header.append(TH("Estimated", **{"class": "subheader hours"}))
     header.append(TH("Spent", **{"class": "subheader hours"}))
+    if logged:
+        header.append(TH("Logged in period", **{
+            "class": "subheader hours",
+            "title": (
+                "Hours logged on board issues between sprint start and "
+                "end, whatever sprint the issue was in"
+            ),
+        }))
     header.append(TH("Overtime", **{"class": "subheader hours"}))
-    header.append(TH("Projection", **{"class": "subheader hours"}))
+    for percentile in FORECAST_PERCENTILES:
+        header.append(TH(f"P{percentile}", **{
+            "class": "subheader hours",
+            "title": f"Projected hours, {percentile}th percentile",
+        }))
 
     rows.append(header)
 
     # scrollable header
     scrollable_header = TR(**{"class": "h25"})
     for component in components:
-        scrollable_header.append(TH(component.name, **{"colspan": 5}))
+        scrollable_header.append(TH(component.name, **{
+            "colspan": 4 + len(FORECAST_PERCENTILES),
+        }))
 
     scrollable_rows.append(scrollable_header)
 
@@ -157,25 +149,18 @@ def generate_sprints_table(
         scrollable_subheader.append(TH("Estimated", **kwargs))
         scrollable_subheader.append(TH("Spent", **kwargs))
         scrollable_subheader.append(TH("Overtime", **kwargs))
-        scrollable_subheader.append(TH("Projection", **kwargs))
+        for percentile in FORECAST_PERCENTILES:
+            scrollable_subheader.append(TH(f"P{percentile}", **kwargs))
 
     scrollable_header.append(scrollable_subheader)
 
     # body
-    for sprint in sprints:
+    for sprint in timeline.rows:
         row = TR(**{DATA_ROW_SPRINT_ID: sprint.id})
         scrollable_row = TR()
-        sprint_tasks = df[df["sprint_id"] == sprint.id]
-        estimate = round(sprint_tasks.estimate.sum(), HOURS_NDIGITS)
-        spent = round(sprint_tasks.spent.sum(), HOURS_NDIGITS)
-        overtime = None
-        avg_overtime = None
-
-        if spent and estimate:
-            overtime = spent / estimate
-
-        if overtimes:
-            avg_overtime = calculate_avg_overtime(overtimes)
+        cell = sprint.cell
+        estimate = round(cell.totals.estimate, HOURS_NDIGITS)
+        spent = round(cell.totals.spent, HOURS_NDIGITS)
 
         row.append(TD(
             Input(**{
@@ -186,17 +171,16 @@ def generate_sprints_table(
         ))
 
         row.append(TD(sprint.name, **{
-            "class": f"name {'released' if sprint.state == CLOSED else ''}",
+            "class": f"name {'released' if sprint.closed else ''}",
             "title": sprint.name,
         }))
-
-        row.append(TD(getattr(sprint, "startDate", "")[:10], **{
+        row.append(TD(sprint.start_date, **{
             "class": "date",
         }))
-        row.append(TD(getattr(sprint, "endDate", "")[:10], **{
+        row.append(TD(sprint.end_date, **{
             "class": "date",
         }))
-        row.append(NumTD(sprint_tasks.id.count(), **{
+        row.append(NumTD(cell.totals.count, **{
             DATA_ROW_SPRINT_COLUMN_NAME: TASKS,
         }))
         row.append(NumTD(estimate, **{
@@ -210,69 +194,44 @@ def generate_sprints_table(
             ),
             DATA_ROW_SPRINT_COLUMN_NAME: SPENT,
         }))
+        if logged:
+            row.append(NumTD(round(sprint.logged_in_period, HOURS_NDIGITS), **{
+                DATA_ROW_SPRINT_COLUMN_NAME: LOGGED,
+            }))
 
         # overtime
         row.append(NumTD(
-            round(overtime, OVERTIME_NDIGITS)
-            if overtime is not None and sprint.state == CLOSED
+            round(cell.overtime, OVERTIME_NDIGITS)
+            if cell.overtime is not None and sprint.closed
             else "",
             **{DATA_ROW_SPRINT_COLUMN_NAME: OVERTIME},
         ))
 
-        # estimate prediction
-        row.append(NumTD(
-            round(predict_estimate(
-                estimate,
-                avg_overtime,
-            ), HOURS_NDIGITS)
-            if avg_overtime
-            else "",
-            title=f"{estimate}*{avg_overtime}",
-        ))
+        # projected hours percentiles
+        for col in generate_forecast_columns(cell):
+            row.append(col)
 
         # add component columns filled in with values
         for col in generate_component_columns(
-                sprint_tasks,
-                components,
-                component_overtimes_map,
-                display_overtime=(sprint.state == CLOSED),
+                timeline,
+                sprint,
+                display_overtime=sprint.closed,
                 summary=False,
         ):
             scrollable_row.append(col)
 
-        # add overtime prediction
-        if sprint.state == CLOSED and overtime:
-            overtimes.append(overtime)
-
-            # generate and store component overtimes map
-            for component in components:
-                component_tasks = sprint_tasks[
-                    sprint_tasks["components"].apply(
-                        lambda x: component in x,
-                    )
-                ]
-                component_estimate = component_tasks.estimate.sum()
-                component_spent = component_tasks.spent.sum()
-
-                if not component_estimate and not component_spent:
-                    continue
-
-                component_overtimes_map[component.id].append(
-                    (component_spent / component_estimate),
-                )
-
         rows.append(row)
         scrollable_rows.append(scrollable_row)
 
     # footer
     row = TR(**{"class": "summary"})
-    estimate = round(df.estimate.sum(), HOURS_NDIGITS)
-    spent = round(df.spent.sum(), HOURS_NDIGITS)
-    avg_overtime = calculate_avg_overtime(overtimes)
+    cell = timeline.summary.cell
+    estimate = round(cell.totals.estimate, HOURS_NDIGITS)
+    spent = round(cell.totals.spent, HOURS_NDIGITS)
 
     row.append(TD(""))
     row.append(TD("Summary", colspan=3))
-    row.append(NumTD(df.id.count()))
+    row.append(NumTD(cell.totals.count))
     row.append(NumTD(estimate))
     row.append(NumTD(spent, **{
         "class": (
@@ -282,24 +241,22 @@ def generate_sprints_table(
             else ""
         ),
     }))
+    if logged:
+        row.append(NumTD(
+            round(timeline.summary.logged_in_period, HOURS_NDIGITS),
+        ))
     row.append(NumTD(
-        round(avg_overtime, OVERTIME_NDIGITS) or "",
-    ))
-    row.append(NumTD(
-        round(predict_estimate(
-            estimate,
-            avg_overtime,
-        ), HOURS_NDIGITS) or "",
-        title=f"{estimate}*{avg_overtime}",
+        round(cell.historical_overtime, OVERTIME_NDIGITS) or "",
     ))
+    for col in generate_forecast_columns(cell):
+        row.append(col)
 
     rows.append(row)
     # add summary component columns filled in with values
     scrollable_summary_row = TR(
         generate_component_columns(
-            df,
-            components,
-            component_overtimes_map,
+            timeline,
+            timeline.summary,
             display_overtime=False,
             summary=True,
         ),
@@ -315,8 +272,11 @@ def generate_sprints_table(
     row.append(NumTD("", **{DATA_COLUMN_NAME: TASKS}))
     row.append(NumTD("", **{DATA_COLUMN_NAME: ESTIMATED}))
     row.append(NumTD("", **{DATA_COLUMN_NAME: SPENT}))
+    if logged:
+        row.append(NumTD("", **{DATA_COLUMN_NAME: LOGGED}))
     row.append(NumTD("", **{DATA_COLUMN_NAME: OVERTIME}))
-    row.append(NumTD("", **{DATA_COLUMN_NAME: PROJECTION}))
+    # percentiles of projections don't sum up
+    row.append(TD("", colspan=len(FORECAST_PERCENTILES)))
 
     rows.append(row)
 
@@ -330,7 +290,9 @@ def generate_sprints_table(
         scrollable_selected_row.append(TD("&nbsp;", **{data_attr: ESTIMATED}))
         scrollable_selected_row.append(TD("&nbsp;", **{data_attr: SPENT}))
         scrollable_selected_row.append(TD("&nbsp;", **{data_attr: OVERTIME}))
-        scrollable_selected_row.append(TD("&nbsp;", **{data_attr: PROJECTION}))
+        scrollable_selected_row.append(
+            TD("&nbsp;", colspan=len(FORECAST_PERCENTILES)),
+        )
 
     scrollable_rows.append(scrollable_selected_row)
 
@@ -346,5 +308,11 @@ def generate_sprints_table(
             Table(scrollable_rows, **table_options),
             **{"class": "combined-right scrollable"},
         ),
-        **{"class": "combined"},
+        **{
+            "class": (
+                f"combined forecast {LOGGED}"
+                if logged
+                else "combined forecast"
+            ),
+        },
     )
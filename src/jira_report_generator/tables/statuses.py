@@ -1,5 +1,7 @@
 from pandas import DataFrame
 
+from ..cube import Cube, build_cube
+from ..model import Matrix, MatrixRow, build_statuses_matrix
 from ..utils.colors import get_danger_color_class
 from ..utils.tables import generate_component_columns
 from ..utils.tags import TD, TH, TR, Div, NumTD, Table
@@ -8,30 +10,37 @@ from ..utils.tags import TD, TH, TR, Div, NumTD, Table
 def generate_statuses_table(
     df: DataFrame,
     statuses: list,
+    cube: Cube | None = None,
     **table_options: str,
 ):
     """Generate statuses table."""
-    rows = []
-    scrollable_rows = []
+    return render_statuses_table(
+        build_statuses_matrix(
+            build_cube(df) if cube is None else cube,
+            statuses,
+        ),
+        **table_options,
+    )
 
-    if "status" not in df.columns:
-        return Table(rows, **table_options)
 
-    components = sorted(
-        df.components.explode().unique().tolist(),
-        key=lambda x: x.name,
-    )
+def render_statuses_table(matrix: Matrix, **table_options: str):
+    """Render statuses table."""
+    rows = []
+    scrollable_rows = []
+    components = matrix.components
 
-    if df.empty:
+    if matrix.summary is None:
         return Table(rows, **table_options)
 
-    def _generate_row(name, df, components, estimate, spent, **attrs) -> TR:
+    def _generate_row(row_data: MatrixRow, **attrs) -> TR:
         row = TR(**attrs)
         scrollable_row = TR(**attrs)
+        estimate = round(row_data.totals.estimate, 1)
+        spent = round(row_data.totals.spent, 1)
         left = round(estimate - spent, 1)
 
-        row.append(TD(name))
-        row.append(NumTD(df.id.count()))
+        row.append(TD(row_data.name))
+        row.append(NumTD(row_data.totals.count))
         row.append(NumTD(estimate))
         row.append(NumTD(spent, **{
             "class": get_danger_color_class(spent > estimate),
@@ -39,7 +48,10 @@ def generate_statuses_table(
         row.append(NumTD(left if left > 0 else 0))
 
         # add component columns filled in with values
-        for col in generate_component_columns(df, components):
+        for col in generate_component_columns(
+            row_data.components,
+            components,
+        ):
             scrollable_row.append(col)
 
         return row, scrollable_row
@@ -73,14 +85,9 @@ def generate_statuses_table(
     scrollable_header.append(scrollable_subheader)
 
     # body
-    for status in statuses:
-        status_df = df[df["status"].apply(lambda x: x == status)]
+    for status in matrix.rows:
         row, scrollable_row = _generate_row(
-            status.name,
-            status_df,
-            components,
-            round(status_df.estimate.sum(), 1),
-            round(status_df.spent.sum(), 1),
+            status,
             **{
                 "data-status-id": status.id,
             },
@@ -91,11 +98,7 @@ def generate_statuses_table(
 
     # footer
     footer_row, footer_scrollable_row = _generate_row(
-        "",
-        df,
-        components,
-        round(df.estimate.sum(), 1),
-        round(df.spent.sum(), 1),
+        matrix.summary,
         **{"class": "summary"},
     )
     rows.append(footer_row)
@@ -1,31 +1,29 @@
 from pandas import DataFrame
 
-from ..constants import Status
+from ..cube import Cube, build_cube
+from ..model import RollupRow, build_rollup
 from ..utils.tags import TD, TH, TR, A, NumTD, Table
 
 
 def generate_stories_table(
         df: DataFrame,
         stories: DataFrame,
+        cube: Cube | None = None,
         **table_options: str,
 ):
+    return render_stories_table(
+        build_rollup(build_cube(df) if cube is None else cube, stories),
+        **table_options,
+    )
+
+
+def render_stories_table(stories: list[RollupRow], **table_options: str):
     rows = []
     header = TR()
 
-    if stories.empty:
+    if not stories:
         return Table(rows, **table_options)
 
-    stories_list = list(stories.iterrows())
-    completed_statuses = (
-        *Status.CLIENT_REVIEW.value,
-        *Status.COMPLETED.value,
-        *Status.VERIFIED.value,
-        *Status.TM_PM_VERIFY.value,
-    )
-    qa_statuses = (
-        *Status.IN_QA.value,
-    )
-
     header.append(TH("Story"))
     header.append(TH("Jira ID"))
     header.append(TH("Status", **{"class": "status"}))
@@ -38,42 +36,22 @@ def generate_stories_table(
 
     rows.append(header)
 
-    for _, story in stories_list:
+    for story in stories:
         row = TR(**{"data-story-id": story.id})
-        story_tasks = df[df["parent"].apply(
-            lambda x: x is not None and x.id == story.id,
-        )]
-        story_completed_tasks = story_tasks[story_tasks["status"].apply(
-            lambda x: x.name in completed_statuses,
-        )]
-        story_qa_tasks = story_tasks[story_tasks["status"].apply(
-            lambda x: x.name in qa_statuses,
-        )]
-        estimate = round(story_tasks.estimate.sum(), 1)
-        spent = round(story_tasks.spent.sum(), 1)
+        estimate = round(story.totals.estimate, 1)
+        spent = round(story.totals.spent, 1)
         left = round(estimate - spent, 1)
 
         row.append(TD(story.summary))
         row.append(TD(A(story.key, href=story.link)))
         row.append(TD(story.status, **{"class": "status nowrap"}))
-        row.append(NumTD(story_tasks.id.count()))
-        row.append(NumTD(
-            story_qa_tasks.id.count()
-            if not story_qa_tasks.empty
-            else 0,
-        ))
-        row.append(NumTD(
-            story_completed_tasks.id.count()
-            if not story_completed_tasks.empty
-            else 0,
-        ))
+        row.append(NumTD(story.totals.count))
+        row.append(NumTD(story.testing))
+        row.append(NumTD(story.completed))
         row.append(NumTD(estimate))
         row.append(NumTD(spent))
         row.append(NumTD(left if left > 0 else 0))
 
         rows.append(row)
 
-    if not stories_list:
-        rows = []
-
     return Table(rows, **table_options)
@@ -0,0 +1,417 @@
+import collections
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import typing
+
+from ..constants import (
+    CACHE_DIR,
+    CACHE_MAX_SIZE,
+    CACHE_TTLS,
+    SECTIONS_CACHE_MAX_SIZE,
+)
+from .formatters import parse_jira_datetime
+
+SPRINTS_CACHE_DIR = "sprints"
+RESPONSES_CACHE_DIR = "responses"
+SECTIONS_CACHE_DIR = "sections"
+WORKLOGS_CACHE_DIR = "worklogs"
+CHANGELOGS_CACHE_DIR = "changelogs"
+ISSUES_CACHE_DIR = "issues"
+FINGERPRINT_SUFFIX = ".fingerprint.json"
+
+
+def get_cache_path(*parts: str | int, cache_dir: str = CACHE_DIR) -> str:
+    """Returns path inside cache directory, creates parent directories."""
+    path = os.path.join(cache_dir, *map(str, parts))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def read_json(path: str, default=None):
+    """Read JSON file, returns `default` if file is missing or broken."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path: str, data) -> None:
+    """Write JSON file atomically."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    os.replace(tmp_path, path)
+
+
+def load_closed_sprints(
+    project_key: str,
+    board_id: int,
+    cache_dir: str = CACHE_DIR,
+) -> dict[int, list[str]]:
+    """Load cached issue IDs of closed board sprints.
+
+    Closed sprints never change membership, so once collected their
+    issues are stored and never requested again.
+
+    """
+    data = read_json(
+        get_cache_path(
+            SPRINTS_CACHE_DIR,
+            project_key,
+            f"{board_id}.json",
+            cache_dir=cache_dir,
+        ),
+        default={},
+    )
+    return {int(sprint_id): ids for sprint_id, ids in data.items()}
+
+
+def save_closed_sprints(
+    project_key: str,
+    board_id: int,
+    sprints: dict[int, list[str]],
+    cache_dir: str = CACHE_DIR,
+) -> None:
+    """Store issue IDs of closed board sprints."""
+    write_json(
+        get_cache_path(
+            SPRINTS_CACHE_DIR,
+            project_key,
+            f"{board_id}.json",
+            cache_dir=cache_dir,
+        ),
+        {str(sprint_id): ids for sprint_id, ids in sprints.items()},
+    )
+
+
+def read_issues_header(path: str) -> dict | None:
+    """Returns count and the latest update time of issues stored with
+    `IssuesWriter`, None if file is missing or broken.
+
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def iter_stored_issues(path: str) -> typing.Iterator[dict]:
+    """Yield raw issues stored with `IssuesWriter` one by one."""
+    with open(path, encoding="utf-8") as f:
+        f.readline()
+
+        for line in f:
+            yield json.loads(line)
+
+
+class IssuesWriter:
+    """Writes raw issues to JSON lines file one by one.
+
+    Header with issues count and the latest update time goes first, so
+    issues are written to temporary file and the file is replaced with
+    header and them on `close`. Readers never see partially written
+    issues, `discard` removes them.
+
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.updated: str | None = None
+        self._tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._file = open(f"{self._tmp_path}.issues", "w", encoding="utf-8")
+
+    def write(self, raw: dict) -> None:
+        """Store raw issue."""
+        self._file.write(json.dumps(raw))
+        self._file.write("\n")
+        self.count += 1
+
+        updated = raw["fields"]["updated"]
+        if self.updated is None or (
+            parse_jira_datetime(updated)
+            > parse_jira_datetime(self.updated)
+        ):
+            self.updated = updated
+
+    def close(self) -> None:
+        """Replace the file with written issues."""
+        self._file.close()
+
+        with open(self._tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"count": self.count, "updated": self.updated}, f)
+            f.write("\n")
+
+            with open(self._file.name, encoding="utf-8") as issues:
+                shutil.copyfileobj(issues, f)
+
+        os.remove(self._file.name)
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        """Remove written issues, the file is left as is."""
+        self._file.close()
+
+        for path in (self._file.name, self._tmp_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class ResponseCache:
+    """On-disk cache of Jira responses.
+
+    Every entity type (boards, sprints, versions, issues) has own TTL,
+    see `CACHE_TTLS`. Call `evict` when the run is finished to remove
+    least recently used entries exceeding `max_size` bytes.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = CACHE_DIR,
+        max_size: int = CACHE_MAX_SIZE,
+        ttls: dict[str, int | None] = CACHE_TTLS,
+    ):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.ttls = ttls
+        self.hits: collections.Counter = collections.Counter()
+        self.misses: collections.Counter = collections.Counter()
+        self.created_at = time.time()
+        self._lock = threading.Lock()
+
+    def _get_path(self, entity: str, key: str | int) -> str:
+        return get_cache_path(
+            RESPONSES_CACHE_DIR,
+            entity,
+            f"{key}.json",
+            cache_dir=self.cache_dir,
+        )
+
+    def read(self, entity: str, key: str | int) -> typing.Any:
+        """Returns cached data or None if it's missing or expired.
+
+        Doesn't affect hit/miss statistics.
+
+        """
+        path = self._get_path(entity, key)
+        entry = read_json(path)
+        ttl = self.ttls.get(entity)
+
+        if entry is None or (
+            ttl is not None and time.time() - entry["created"] > ttl
+        ):
+            return None
+
+        # mark entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry["data"]
+
+    def get(self, entity: str, key: str | int) -> typing.Any:
+        """Returns cached data or None if it's missing or expired."""
+        data = self.read(entity, key)
+
+        if data is None:
+            self.miss(entity)
+        else:
+            self.hit(entity)
+
+        return data
+
+    def set(self, entity: str, key: str | int, data: typing.Any) -> None:
+        """Store data in cache."""
+        write_json(
+            self._get_path(entity, key),
+            {"created": time.time(), "data": data},
+        )
+
+    def hit(self, entity: str) -> None:
+        """Count cache hit for entity."""
+        with self._lock:
+            self.hits[entity] += 1
+
+    def miss(self, entity: str) -> None:
+        """Count cache miss for entity."""
+        with self._lock:
+            self.misses[entity] += 1
+
+    def evict(self, since: float | None = None) -> None:
+        """Remove least recently used entries exceeding max size.
+
+        Entries used since `since` timestamp, by default since the cache
+        was created, are kept.
+
+        """
+        evict_files(
+            os.path.join(self.cache_dir, RESPONSES_CACHE_DIR),
+            self.max_size,
+            self.created_at if since is None else since,
+        )
+
+    def get_stats(self) -> str:
+        """Returns human readable hit/miss statistics."""
+        entities = sorted(set(self.hits) | set(self.misses))
+        return ", ".join(
+            f"{entity} {self.hits[entity]} hit(s)/"
+            f"{self.misses[entity]} miss(es)"
+            for entity in entities
+        ) or "not used"
+
+
+class SectionCache:
+    """On-disk cache of rendered report sections.
+
+    Sections are stored by hash of their inputs (see
+    `utils.data.get_section_hash`), so unchanged sections are reused
+    by next runs. Call `evict` when rendering is finished to remove
+    least recently used sections exceeding `max_size` bytes.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = CACHE_DIR,
+        max_size: int = SECTIONS_CACHE_MAX_SIZE,
+    ):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.created_at = time.time()
+        self._lock = threading.Lock()
+
+    def _get_path(self, key: str) -> str:
+        return get_cache_path(
+            SECTIONS_CACHE_DIR,
+            key[:2],
+            f"{key}.html",
+            cache_dir=self.cache_dir,
+        )
+
+    def get(self, key: str) -> str | None:
+        """Returns cached section HTML or None if it's missing."""
+        path = self._get_path(key)
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+            # mark entry as recently used
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return html
+
+    def set(self, key: str, html: str) -> None:
+        """Store section HTML."""
+        path = self._get_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+        os.replace(tmp_path, path)
+
+    def evict(self, since: float | None = None) -> None:
+        """Remove least recently used sections exceeding max size.
+
+        Sections used since `since` timestamp, by default since the
+        cache was created, are kept.
+
+        """
+        evict_files(
+            os.path.join(self.cache_dir, SECTIONS_CACHE_DIR),
+            self.max_size,
+            self.created_at if since is None else since,
+        )
+
+    def get_stats(self) -> str:
+        """Returns human readable hit ratio."""
+        total = self.hits + self.misses
+        if not total:
+            return "not used"
+
+        return (
+            f"{self.hits} hit(s)/{self.misses} miss(es), "
+            f"{round(self.hits / total * 100)}% reused"
+        )
+
+
+def evict_files(
+    dirname: str,
+    max_size: int,
+    since: float | None = None,
+) -> None:
+    """Remove least recently used files exceeding max size.
+
+    Files modified since `since` timestamp are used by the current run,
+    they are never removed, even if they exceed max size alone.
+
+    """
+    entries = []
+    for root, _dirs, files in os.walk(dirname):
+        for filename in files:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(entry_size for _, entry_size, _ in entries)
+    for mtime, entry_size, path in sorted(entries):
+        if size <= max_size or (since is not None and mtime >= since):
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        size -= entry_size
+
+
+def dump_resources(resources: list) -> list[dict]:
+    """Returns raw JSON data of Jira resources."""
+    return [resource.raw for resource in resources]
+
+
+def load_resources(jira_client, resource_class: type, raws: list) -> list:
+    """Construct Jira resources from raw JSON data."""
+    return [
+        resource_class(jira_client._options, jira_client._session, raw=raw)
+        for raw in raws
+    ]
+
+
+def get_data_hash(data: typing.Any) -> str:
+    """Returns hash of JSON serializable data."""
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8"),
+    ).hexdigest()
+
+
+def load_fingerprint(filename: str) -> dict | None:
+    """Load project fingerprint stored next to the report file."""
+    return read_json(f"{filename}{FINGERPRINT_SUFFIX}")
+
+
+def save_fingerprint(filename: str, fingerprint: dict) -> None:
+    """Store project fingerprint next to the report file."""
+    write_json(f"{filename}{FINGERPRINT_SUFFIX}", fingerprint)
@@ -0,0 +1,127 @@
+import hashlib
+import math
+import os
+import shutil
+import threading
+import time
+import typing
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from ..constants import CHECKPOINT_DIR, CHECKPOINT_MAX_AGE
+from .cache import get_cache_path, read_json, write_json
+from .formatters import format_jql_datetime
+
+PAGES_DIR = "pages"
+CREATED_FILENAME = "created.json"
+
+
+class Checkpoint:
+    """Jira search pages of the project fetched so far.
+
+    Pages are stored in `work_dir` as soon as they arrive, so
+    interrupted fetch is resumed from the last stored page. Checkpoint
+    is removed with `clear` after successful report generation,
+    checkpoints older than `max_age` seconds are not used.
+
+    Searches are limited to issues created before the checkpoint with
+    `pin`, so issues created between runs don't shift stored pages.
+
+    """
+
+    def __init__(
+        self,
+        project_key: str,
+        work_dir: str = CHECKPOINT_DIR,
+        max_age: int = CHECKPOINT_MAX_AGE,
+    ):
+        self.project_key = project_key
+        self.work_dir = work_dir
+        self.path = os.path.join(work_dir, project_key)
+
+        self._lock = threading.Lock()
+        self._time_zone: str | None = None
+
+        created = read_json(self._get_created_path())
+        if created is None or time.time() - created > max_age:
+            self.clear()
+            created = time.time()
+            write_json(self._get_created_path(), created)
+
+        self.created = created
+
+    def _get_created_path(self) -> str:
+        return get_cache_path(
+            self.project_key,
+            CREATED_FILENAME,
+            cache_dir=self.work_dir,
+        )
+
+    def _get_pages_path(self, jql_str: str) -> str:
+        jql_hash = hashlib.sha1(jql_str.encode()).hexdigest()
+        return os.path.join(self.path, PAGES_DIR, jql_hash)
+
+    def _get_page_path(self, jql_str: str, start_at: int) -> str:
+        jql_hash = hashlib.sha1(jql_str.encode()).hexdigest()
+        return get_cache_path(
+            self.project_key,
+            PAGES_DIR,
+            jql_hash,
+            f"{start_at}.json",
+            cache_dir=self.work_dir,
+        )
+
+    def pin(
+        self,
+        jql_str: str,
+        get_time_zone: typing.Callable[[], str],
+    ) -> str:
+        """Returns JQL query of issues created before the checkpoint.
+
+        JQL dates are in Jira user time zone, it's requested with
+        `get_time_zone` once. Checkpoint time is rounded up to minute.
+
+        """
+        with self._lock:
+            if self._time_zone is None:
+                self._time_zone = get_time_zone()
+
+        created = datetime.fromtimestamp(
+            math.ceil(self.created / 60) * 60,
+            ZoneInfo(self._time_zone),
+        )
+        query, _, order = jql_str.partition(" ORDER BY ")
+        condition = f"created <= \"{format_jql_datetime(created)}\""
+
+        return (
+            f"{query} AND {condition}"
+            f"{f' ORDER BY {order}' if order else ''}"
+        )
+
+    def get_page(
+        self,
+        jql_str: str,
+        start_at: int,
+    ) -> dict[str, typing.Any] | None:
+        """Returns stored search page or None."""
+        return read_json(self._get_page_path(jql_str, start_at))
+
+    def set_page(
+        self,
+        jql_str: str,
+        start_at: int,
+        page: dict[str, typing.Any],
+    ) -> None:
+        """Store search page with total count and raw issues."""
+        write_json(
+            self._get_page_path(jql_str, start_at),
+            {"total": page["total"], "issues": page["issues"]},
+        )
+
+    def remove_pages(self, jql_str: str) -> None:
+        """Remove stored pages of JQL query."""
+        shutil.rmtree(self._get_pages_path(jql_str), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all stored pages of the project."""
+        shutil.rmtree(self.path, ignore_errors=True)
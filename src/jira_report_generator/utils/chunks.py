@@ -0,0 +1,191 @@
+import os
+import typing
+
+import numpy
+import pandas
+from pandas import DataFrame, Series
+
+from ..constants import MEMORY_BUDGET
+from .snapshot import (
+    RESOURCE_COLUMNS,
+    decode_column,
+    encode_column,
+    import_pyarrow,
+)
+
+# text columns which are read only by tables rendering issues
+LAZY_COLUMNS = ("summary", "link")
+
+
+def get_chunks_schema(pyarrow):
+    """Returns schema of issues dataframe encoded with `encode_column`."""
+    string = pyarrow.string()
+    number = pyarrow.float64()
+
+    return pyarrow.schema([
+        ("id", string),
+        ("key", string),
+        ("status", string),
+        ("summary", string),
+        ("assignee", string),
+        ("components", string),
+        ("estimate", number),
+        ("spent", number),
+        ("ratio", number),
+        ("versions", string),
+        ("link", string),
+        ("type", string),
+        ("parent", string),
+        ("release_date", string),
+        ("sprint_date", string),
+        ("board_id", pyarrow.int64()),
+        ("sprint_id", pyarrow.int64()),
+    ])
+
+
+class IssueChunks:
+    """Issues dataframe spilled to disk as Arrow IPC record batches.
+
+    Appended rows are buffered until they take `memory_budget` bytes,
+    then written as one chunk. Chunks are read one by one, so tables
+    are built without loading all issues: aggregates are computed
+    chunk by chunk (see `iter_frames`) and every table loads only its
+    rows (see `take`).
+
+    Pass path of closed chunks to read them in other process.
+
+    """
+
+    def __init__(self, path: str, memory_budget: int = MEMORY_BUDGET):
+        self.pyarrow = import_pyarrow()
+        self.path = path
+        self.memory_budget = memory_budget
+        self.schema = get_chunks_schema(self.pyarrow)
+        self.rows = 0
+        self._buffer: list[DataFrame] = []
+        self._buffer_size = 0
+        self._sink = None
+        self._writer = None
+        # decoded resources are compared by identity, so rows of all
+        # loaded frames share them
+        self._decoded: dict[str, typing.Any] = {}
+
+    def _open(self) -> None:
+        self._sink = self.pyarrow.OSFile(self.path, "wb")
+        self._writer = self.pyarrow.ipc.new_file(self._sink, self.schema)
+
+    def append(self, df: DataFrame) -> None:
+        """Encode and buffer issues, spill buffer if it's over budget."""
+        if df.empty:
+            return
+
+        df = df.copy()
+        for column in RESOURCE_COLUMNS:
+            df[column] = encode_column(df[column])
+
+        self._buffer.append(df)
+        self._buffer_size += int(df.memory_usage(deep=True).sum())
+        self.rows += len(df)
+
+        if self._buffer_size >= self.memory_budget:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered issues as a chunk."""
+        if not self._buffer:
+            return
+
+        if self._writer is None:
+            self._open()
+
+        self._writer.write_table(self.pyarrow.Table.from_pandas(
+            pandas.concat(self._buffer, ignore_index=True),
+            schema=self.schema,
+            preserve_index=False,
+        ))
+        self._buffer = []
+        self._buffer_size = 0
+
+    def close(self) -> None:
+        """Write the rest of buffered issues and close chunks file."""
+        self.flush()
+
+        if self._writer is None:
+            self._open()
+
+        self._writer.close()
+        self._sink.close()
+
+    def remove(self) -> None:
+        """Remove chunks file.
+
+        Loaded dataframes stay valid, they don't refer to the file.
+
+        """
+        if self._sink is not None and not self._sink.closed:
+            self._writer.close()
+            self._sink.close()
+
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def iter_batches(self) -> typing.Iterator[typing.Any]:
+        """Yield chunks as Arrow record batches, resources are encoded."""
+        with self.pyarrow.memory_map(self.path, "r") as source:
+            reader = self.pyarrow.ipc.open_file(source)
+
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+    def _decode(self, batch) -> DataFrame:
+        chunk = batch.select([
+            name for name in self.schema.names
+            if name not in LAZY_COLUMNS
+        ]).to_pandas()
+
+        for column in RESOURCE_COLUMNS:
+            chunk[column] = decode_column(chunk[column], self._decoded)
+
+        return chunk
+
+    def iter_frames(self) -> typing.Iterator[DataFrame]:
+        """Yield decoded chunks without text columns.
+
+        Index of every chunk is positions of its rows, see `take`.
+
+        """
+        for batch in self.iter_batches():
+            yield self._decode(batch)
+
+    def take(self, positions: dict[int, numpy.ndarray]) -> DataFrame:
+        """Load rows at `positions` of chunks by chunks indexes.
+
+        Only chunks with taken rows are read and decoded.
+
+        """
+        frames = []
+
+        for index, batch in enumerate(self.iter_batches()):
+            if index not in positions:
+                continue
+
+            batch = batch.take(self.pyarrow.array(positions[index]))
+            chunk = self._decode(batch)
+
+            for column in LAZY_COLUMNS:
+                chunk[column] = Series(
+                    pandas.arrays.ArrowExtensionArray(batch.column(column)),
+                    index=chunk.index,
+                )
+
+            frames.append(chunk)
+
+        if not frames:
+            return DataFrame()
+
+        return pandas.concat(
+            frames,
+            ignore_index=True,
+        )[self.schema.names]
@@ -0,0 +1,99 @@
+import base64
+import contextlib
+import gzip
+import os
+import typing
+import zlib
+
+# output filename suffix -> compression
+COMPRESSIONS = {
+    ".gz": "gzip",
+    ".br": "brotli",
+    ".zst": "zstd",
+}
+# gzip container for `zlib.compressobj`
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def import_compressor(compression: str):
+    """Import optional brotli or zstd dependency."""
+    try:
+        if compression == "brotli":
+            import brotli
+            return brotli
+
+        import zstandard
+        return zstandard
+    except ImportError as e:
+        raise ImportError(
+            f"{compression} output requires {e.name}: "
+            "pip install jira-report-generator[compression]",
+        ) from e
+
+
+def get_compression(filename: str) -> str | None:
+    """Returns compression of output file by its suffix."""
+    return COMPRESSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+class BrotliWriter:
+    """Binary file-like object compressing data with brotli."""
+
+    def __init__(self, filename: str):
+        self.compressor = import_compressor("brotli").Compressor()
+        self.file = open(filename, "wb")
+
+    def write(self, data: bytes) -> int:
+        self.file.write(self.compressor.process(data))
+        return len(data)
+
+    def close(self):
+        self.file.write(self.compressor.finish())
+        self.file.close()
+
+
+@contextlib.contextmanager
+def open_output(filename: str) -> typing.Iterator[typing.BinaryIO]:
+    """Open binary output file, compressed according to its suffix.
+
+    Data is compressed as it's written, so the whole output is never
+    kept in memory.
+
+    """
+    compression = get_compression(filename)
+
+    if compression == "gzip":
+        f = gzip.open(filename, "wb")
+    elif compression == "brotli":
+        f = BrotliWriter(filename)
+    elif compression == "zstd":
+        f = import_compressor("zstd").ZstdCompressor().stream_writer(
+            open(filename, "wb"),
+        )
+    else:
+        f = open(filename, "wb")
+
+    try:
+        yield f
+    finally:
+        f.close()
+
+
+def iter_gzip_base64(chunks: typing.Iterable[str]) -> typing.Iterator[str]:
+    """Compress text chunks with gzip and encode them to base64 on the fly.
+
+    Result can be inflated in browser with `DecompressionStream`.
+
+    """
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    rest = b""
+
+    for chunk in chunks:
+        data = rest + compressor.compress(chunk.encode("utf-8"))
+        # base64 encodes every 3 bytes separately
+        size = len(data) - len(data) % 3
+        rest = data[size:]
+        if size:
+            yield base64.b64encode(data[:size]).decode("ascii")
+
+    yield base64.b64encode(rest + compressor.flush()).decode("ascii")
@@ -1,14 +1,32 @@
-from typing import Any
+import functools
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Iterator
 
 from jinja2 import Template
 from jira import Issue
 from jira.resources import Board
 from pandas import DataFrame
+from pandas.util import hash_pandas_object
 
 from ..constants import Status, Type
+from .compression import iter_gzip_base64
 from .formatters import get_issue_permalink
 from .tags import Table
 
+# modules sections are built by, relative to the package
+RENDERER_MODULES = (
+    "tables/*.py",
+    "utils/*.py",
+    "changelogs.py",
+    "cube.py",
+    "forecast.py",
+    "model.py",
+    "worklogs.py",
+)
+
 
 def get_dataframe(
         data: list[Issue],
@@ -70,6 +88,26 @@ def get_dataframe(
     return DataFrame(result)
 
 
+def apply_board_data(
+        df: DataFrame,
+        extra_data: dict[int, dict],
+) -> DataFrame:
+    """Fill board and sprint columns of the dataframe from extra data."""
+    df = df.copy()
+    extras = df["id"].map(lambda x: extra_data.get(x, {}))
+    sprints = extras.map(lambda x: x.get("sprint", None))
+
+    df["sprint_date"] = sprints.map(
+        lambda x: getattr(x, "endDate", "") if x else None,
+    )
+    df["board_id"] = extras.map(
+        lambda x: x["board"].id if x.get("board", None) else None,
+    )
+    df["sprint_id"] = sprints.map(lambda x: x.id if x else None)
+
+    return df
+
+
 def get_versioned_issues(df: DataFrame) -> DataFrame:
     return df[df["versions"].apply(
         lambda x: any([not getattr(v, "archived", False) for v in x]),
@@ -84,19 +122,141 @@ def get_sprinted_issues(df: DataFrame) -> DataFrame:
     )
 
 
+def generate_template(
+    tables: list[Table],
+    title: str,
+    template: Template,
+    assets: dict[str, str] | None = None,
+    minify: bool = False,
+    compressed: bool = False,
+) -> Iterator[str]:
+    """Render template chunk by chunk.
+
+    Styles and scripts are inlined unless `assets` paths are given,
+    inlined ones are minified with `minify`. Tables are embedded
+    compressed with `compressed`, `template.html` inflates them in
+    browser.
+
+    """
+    sections = map(str, tables)
+
+    return template.generate(
+        title=title,
+        sections=iter_gzip_base64(sections) if compressed else sections,
+        assets=assets,
+        minify=minify,
+        compressed=compressed,
+    )
+
+
 def render_template(
     tables: list[Table],
     title: str,
     template: Template,
+    assets: dict[str, str] | None = None,
+    minify: bool = False,
+    compressed: bool = False,
 ) -> str:
     """Render template."""
-    sections = map(str, tables)
+    return "".join(
+        generate_template(tables, title, template, assets, minify, compressed),
+    )
 
-    return template.render(
-        title=title,
-        sections=sections,
+
+@functools.cache
+def get_renderer_hash() -> str:
+    """Returns hash of tables data and rendering code.
+
+    It's a part of sections hashes, so cached sections are rendered
+    again after the code is changed.
+
+    """
+    package_dir = os.path.dirname(os.path.dirname(__file__))
+    digest = hashlib.sha1()
+
+    for pattern in RENDERER_MODULES:
+        for filename in sorted(
+            glob.glob(os.path.join(package_dir, pattern)),
+        ):
+            with open(filename, "rb") as f:
+                digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def _dump_value(value: Any) -> Any:
+    # Jira resources are compared by their raw data
+    return getattr(value, "raw", None) or str(value)
+
+
+def _get_value_key(value: Any, digests: dict[int, str]) -> str:
+    """Returns text key of dataframe object value.
+
+    Jira resources are keyed by digest of their raw data, rows share
+    resources, so every resource is serialized once (see `digests`).
+
+    """
+    key = digests.get(id(value))
+    if key is not None:
+        return key
+
+    if isinstance(value, (list, tuple)):
+        return ",".join(_get_value_key(item, digests) for item in value)
+
+    if getattr(value, "raw", None) is None:
+        return str(value)
+
+    key = digests[id(value)] = get_json_digest(value.raw)
+    return key
+
+
+def get_json_digest(data: Any) -> str:
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=_dump_value).encode("utf-8"),
+    ).hexdigest()
+
+
+def get_dataframe_digest(df: DataFrame, digests: dict[int, str]) -> bytes:
+    """Returns digest of dataframe columns, index and values.
+
+    Values are hashed with `hash_pandas_object`, object columns are
+    replaced with keys of their values first.
+
+    """
+    df = df.assign(**{
+        str(column): [
+            _get_value_key(value, digests)
+            for value in df[column].tolist()
+        ]
+        for column in df.columns
+        if df[column].dtype == object
+    })
+    digest = hashlib.sha1(json.dumps(list(map(str, df.columns))).encode())
+    digest.update(
+        hash_pandas_object(df, index=True).to_numpy().tobytes(),
     )
 
+    return digest.digest()
+
+
+def get_section_hash(*inputs: Any) -> str:
+    """Returns hash of section inputs.
+
+    Inputs are dataframes with issues covered by the section, Jira
+    resources (versions, sprints, components) and rendering options.
+
+    """
+    digest = hashlib.sha1(get_renderer_hash().encode("ascii"))
+    digests: dict[int, str] = {}
+
+    for value in inputs:
+        if isinstance(value, DataFrame):
+            digest.update(get_dataframe_digest(value, digests))
+        else:
+            digest.update(get_json_digest(value).encode("ascii"))
+
+    return digest.hexdigest()
+
 
 def prepare_components_data(issues_dataframe: DataFrame):
     """Prepare components data for usage."""
@@ -1,5 +1,9 @@
+from datetime import datetime
 from urllib.parse import urljoin
 
+JIRA_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+JQL_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
 
 def format_name(name: str) -> str:
     """Format name
@@ -21,3 +25,17 @@ def get_issue_permalink(
 ) -> str:
     """Returns URL for browse issue details."""
     return urljoin(jira_server_url, f"browse/{issue_key}")
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse datetime returned by Jira API.
+
+    Turns "2023-04-24T14:38:04.370+0300" into datetime.
+
+    """
+    return datetime.strptime(value, JIRA_DATETIME_FORMAT)
+
+
+def format_jql_datetime(value: datetime) -> str:
+    """Format datetime for usage in JQL queries."""
+    return value.strftime(JQL_DATETIME_FORMAT)
@@ -0,0 +1,34 @@
+import re
+
+
+def minify_css(text: str) -> str:
+    """Returns styles without comments and extra whitespace."""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r" ?([{};,>]) ?", r"\1", text)
+    # space before colon is a descendant selector, only space after it
+    return text.replace(": ", ":").strip()
+
+
+def minify_js(text: str) -> str:
+    """Returns script without comments, indentation and empty lines.
+
+    Line breaks are kept, so automatic semicolon insertion isn't
+    affected. Only comments on their own lines are removed, script
+    shouldn't have multiline string literals.
+
+    """
+    lines = []
+    in_comment = False
+
+    for line in text.splitlines():
+        line = line.strip()
+
+        if in_comment or line.startswith("/*"):
+            in_comment = "*/" not in line
+            continue
+
+        if line and not line.startswith("//"):
+            lines.append(line)
+
+    return "\n".join(lines)
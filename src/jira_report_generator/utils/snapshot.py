@@ -0,0 +1,199 @@
+import json
+import typing
+
+from jira.resources import Resource, dict2resource
+from pandas import DataFrame
+
+SNAPSHOT_METADATA_KEY = b"jira_report_generator"
+SNAPSHOT_FORMAT_VERSION = 1
+PARQUET_EXTENSION = ".parquet"
+
+# dataframe columns which contain Jira resources
+RESOURCE_COLUMNS = (
+    "status",
+    "assignee",
+    "components",
+    "versions",
+    "type",
+    "parent",
+)
+
+
+def import_pyarrow():
+    """Import optional `pyarrow` dependency."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Snapshots and streaming mode require pyarrow: "
+            "pip install jira-report-generator[snapshot]",
+        ) from e
+
+    return pyarrow
+
+
+def encode_resource(value: typing.Any) -> typing.Any:
+    """Returns raw JSON data of Jira resource or list of resources."""
+    if isinstance(value, Resource):
+        return value.raw
+    if isinstance(value, (list, tuple)):
+        return [encode_resource(item) for item in value]
+    return value
+
+
+def decode_resource(value: typing.Any) -> typing.Any:
+    """Construct Jira resource or list of resources from raw JSON data."""
+    return dict2resource({"value": value}).value
+
+
+def encode_column(column) -> list[str]:
+    """Encode column of Jira resources to JSON strings."""
+    return [json.dumps(encode_resource(value)) for value in column]
+
+
+def decode_column(column, decoded: dict | None = None) -> list:
+    """Decode column of JSON strings to Jira resources.
+
+    Equal values are decoded once, so rows share resource objects.
+    Pass the same `decoded` dict to share them between columns.
+
+    """
+    if decoded is None:
+        decoded = {}
+
+    for value in set(column):
+        if value not in decoded:
+            decoded[value] = decode_resource(json.loads(value))
+
+    return [decoded[value] for value in column]
+
+
+def encode_metadata(data: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Encode project key, versions and boards of prepared data."""
+    return {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "project_key": data.get("project_key", ""),
+        "versions": encode_resource(data["versions"]),
+        "boards": [
+            {
+                "board": encode_resource(board["board"]),
+                "sprints": encode_resource(board["sprints"]),
+            }
+            for board in data["boards"]
+        ],
+    }
+
+
+def encode_data(data: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Encode prepared data to plain dataframe and JSON metadata.
+
+    Encoded data contains no Jira resources, so it could be pickled to
+    be passed to other processes or saved as snapshot.
+
+    """
+    df = data["issues"].copy()
+    for column in RESOURCE_COLUMNS:
+        if column in df.columns:
+            df[column] = encode_column(df[column])
+
+    return {
+        "issues": df,
+        "metadata": encode_metadata(data),
+    }
+
+
+def decode_data(encoded_data: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Decode data encoded with `encode_data`."""
+    df = encoded_data["issues"]
+    for column in RESOURCE_COLUMNS:
+        if column in df.columns:
+            df[column] = decode_column(df[column])
+
+    return {
+        **decode_metadata(encoded_data["metadata"]),
+        "issues": df,
+    }
+
+
+def decode_metadata(metadata: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Decode metadata encoded with `encode_metadata`."""
+    if metadata["format_version"] != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version: {metadata['format_version']}",
+        )
+
+    return {
+        "project_key": metadata["project_key"],
+        "versions": decode_resource(metadata["versions"]),
+        "boards": [
+            {
+                "board": decode_resource(board["board"]),
+                "sprints": decode_resource(board["sprints"]),
+            }
+            for board in metadata["boards"]
+        ],
+    }
+
+
+def save_snapshot(path: str, data: dict[str, typing.Any]) -> None:
+    """Save prepared data: issues dataframe, versions and boards.
+
+    Snapshot is written as Arrow IPC file, or as Parquet file if `path`
+    has `.parquet` extension. Issues of data prepared in streaming mode
+    are written chunk by chunk, see `utils.chunks.IssueChunks`.
+
+    """
+    pyarrow = import_pyarrow()
+
+    if "chunks" in data:
+        schema = data["chunks"].schema
+        batches = data["chunks"].iter_batches()
+    else:
+        table = pyarrow.Table.from_pandas(
+            encode_data(data)["issues"],
+            preserve_index=False,
+        )
+        schema = table.schema
+        batches = [table]
+
+    schema = schema.with_metadata({
+        **(schema.metadata or {}),
+        SNAPSHOT_METADATA_KEY: json.dumps(encode_metadata(data)),
+    })
+
+    if path.endswith(PARQUET_EXTENSION):
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            for batch in batches:
+                writer.write(batch)
+        return
+
+    with pyarrow.OSFile(path, "wb") as sink:
+        with pyarrow.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write(batch)
+
+
+def load_snapshot(path: str) -> dict[str, typing.Any]:
+    """Load snapshot saved by `save_snapshot`.
+
+    Arrow IPC files are memory-mapped, so only used columns are read.
+
+    """
+    pyarrow = import_pyarrow()
+
+    if path.endswith(PARQUET_EXTENSION):
+        table = pyarrow.parquet.read_table(path, memory_map=True)
+        df = table.to_pandas()
+    else:
+        with pyarrow.memory_map(path, "r") as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+            df = table.to_pandas()
+
+    return decode_data({
+        "issues": df,
+        "metadata": json.loads(
+            table.schema.metadata[SNAPSHOT_METADATA_KEY],
+        ),
+    })
@@ -1,62 +1,39 @@
-from typing import List
+import json
+from typing import Any, Callable, List
 
 from pandas import DataFrame
 
+from ..constants import Status
+from ..model import Totals
 from .colors import get_danger_color_class
-from .tags import TD, NumTD
+from .formatters import format_name
+from .tags import TD, TR, A, Div, NumTD, Script, Table
 
 
-def calculate_issues_count(component_issues: DataFrame) -> int:
-    """Calculate issues count for component."""
-    return len(component_issues)
+def generate_component_columns(
+    components_totals: dict[str, Totals],
+    components: list,
+) -> List[TD]:
+    """Generate count, estimated, spent and left columns of components.
 
+    Columns of components without issues are empty.
 
-def calculate_component_estimate(component_issues: DataFrame) -> float:
-    """Calculate component estimate."""
-    return (
-        .0 if component_issues.empty
-        else round(component_issues.estimate.sum(), 1)
-    )
-
-
-def calculate_component_spent(component_issues: DataFrame) -> float:
-    """Calculate component spent."""
-    return (
-        .0 if component_issues.empty
-        else round(component_issues.spent.sum(), 1)
-    )
-
-
-def calculate_component_left(
-    component_issues: DataFrame,
-    component_estimate: float,
-    component_spent: float,
-) -> float:
-    """Calculate component left."""
-    return (
-        .0 if component_issues.empty
-        else round(component_estimate - component_spent, 1)
-    )
-
-
-def generate_component_columns(df: DataFrame, components: list) -> List[TD]:
+    """
     columns = []
 
     for component in components:
         default = ""
-        component_issues = df[
-            df["components"].apply(lambda x: component in x)
-        ]
+        totals = components_totals.get(component.id, Totals())
 
-        issues_count = calculate_issues_count(component_issues)
+        issues_count = totals.count
         if issues_count:
             default = 0
         columns.append(NumTD(str(issues_count or default)))
 
-        component_estimate = calculate_component_estimate(component_issues)
+        component_estimate = round(totals.estimate, 1)
         columns.append(NumTD(str(component_estimate or default)))
 
-        component_spent = calculate_component_spent(component_issues)
+        component_spent = round(totals.spent, 1)
         columns.append(NumTD(
             str(component_spent or default),
             **{
@@ -66,11 +43,186 @@ def generate_component_columns(df: DataFrame, components: list) -> List[TD]:
             },
         ))
 
-        component_left = calculate_component_left(
-            component_issues,
-            component_estimate,
-            component_spent,
-        )
+        component_left = round(component_estimate - component_spent, 1)
         columns.append(NumTD(str(component_left or default)))
 
     return columns
+
+
+def get_status_classes(status: Any) -> tuple[str, str]:
+    """Returns status cell class and hours cells background of issue."""
+    if status.name in (
+            *Status.VERIFIED.value,
+            *Status.CLIENT_REVIEW.value,
+            *Status.COMPLETED.value,
+            *Status.TM_PM_VERIFY.value,
+    ):
+        return "status nowrap success", "done"
+    if status.name in (
+            *Status.IN_QA.value,
+            *Status.CODE_REVIEW.value,
+    ):
+        return "status nowrap warning", "in-progress"
+    return "status nowrap", "default"
+
+
+def get_virtual_rows(
+    df: DataFrame,
+    get_cells: Callable[[Any], tuple[list[int], int]],
+) -> list[list]:
+    """Returns compact issue rows for virtualized component table.
+
+    `get_cells` returns indexes of filled columns of the issue and
+    divisor of its hours. Row fields order is described
+    by `VIRTUAL_ROW` in `script.js`.
+
+    """
+    rows = []
+
+    for item in df.itertuples():
+        cells, divisor = get_cells(item)
+        status_class, background = get_status_classes(item.status)
+        display_name = format_name(getattr(item.assignee, "displayName", ""))
+
+        rows.append([
+            item.summary,
+            str(item.type),
+            item.key,
+            item.link,
+            item.status.id,
+            item.status.name,
+            status_class,
+            background,
+            item.assignee.accountId if item.assignee else "",
+            display_name,
+            item.parent.id if item.parent else "",
+            cells,
+            str(round(item.estimate / divisor, 1)),
+            str(round(item.spent / divisor, 1)),
+            bool(item.estimate != 0 and item.spent > item.estimate),
+        ])
+
+    return rows
+
+
+def generate_virtual_table(
+    rows: list,
+    scrollable_rows: list,
+    payload: dict[str, Any],
+    **table_options: str,
+) -> Div:
+    """Generate component table with body rendered by `script.js`.
+
+    Only header rows are rendered, issues are embedded as JSON payload.
+
+    """
+    return Div(
+        Div(
+            Table(rows, **table_options),
+            **{"class": "combined-left"},
+        ),
+        Div(
+            Table(scrollable_rows, **table_options),
+            **{"class": "combined-right scrollable"},
+        ),
+        Script(
+            json.dumps(payload, separators=(",", ":")).replace("</", "<\\/"),
+            **{"type": "application/json", "class": "virtual-rows"},
+        ),
+        **{"class": "combined issues virtual"},
+    )
+
+
+def generate_compact_table(
+    df: DataFrame,
+    rows: list,
+    scrollable_rows: list,
+    kind: str,
+    columns: list[str],
+    component_id: str,
+    get_cells: Callable[[Any], tuple[list[int], int]],
+    **table_options: str,
+) -> Div:
+    """Generate component table with compact markup.
+
+    Issue metadata is set on the left row only (empty values and
+    component ID are omitted), cells have neither column IDs nor column
+    classes: `script.js` matches scrollable rows and cells by position
+    and sets titles on hover, `style.css` styles cells by column.
+    `get_cells` is the same as for `get_virtual_rows`.
+
+    """
+    for item in df.itertuples():
+        cells, divisor = get_cells(item)
+        status_class, background = get_status_classes(item.status)
+        display_name = format_name(getattr(item.assignee, "displayName", ""))
+        # status column class is set by `style.css`, default
+        # background has no styles
+        status_class = status_class.removeprefix("status nowrap").strip()
+        background = "" if background == "default" else background
+        danger = item.estimate != 0 and item.spent > item.estimate
+
+        status_attrs = {"class": status_class} if status_class else {}
+        estimate_attrs = {"class": background} if background else {}
+        spent_attrs = (
+            {"class": f"danger {background}".strip()}
+            if danger
+            else estimate_attrs
+        )
+
+        row_attrs = {
+            "data-status-id": item.status.id,
+            "data-assignee-id": (
+                item.assignee.accountId
+                if item.assignee
+                else ""
+            ),
+            "data-parent-id": item.parent.id if item.parent else "",
+        }
+        rows.append(TR(
+            [
+                TD(item.summary),
+                TD(item.type),
+                TD(A(item.key, **{"href": item.link})),
+                TD(item.status.name, **status_attrs),
+                TD(display_name),
+            ],
+            **{key: value for key, value in row_attrs.items() if value},
+            **{
+                f"data-{kind}-ids": ",".join(
+                    columns[index] for index in cells
+                ),
+            },
+        ))
+
+        scrollable_tr = TR()
+        for index in range(len(columns)):
+            if index in cells:
+                scrollable_tr.append(TD(
+                    round(item.estimate / divisor, 1),
+                    **estimate_attrs,
+                ))
+                scrollable_tr.append(TD(
+                    round(item.spent / divisor, 1),
+                    **spent_attrs,
+                ))
+            else:
+                scrollable_tr.append(TD())
+                scrollable_tr.append(TD())
+        scrollable_rows.append(scrollable_tr)
+
+    return Div(
+        Div(
+            Table(rows, **table_options),
+            **{"class": "combined-left"},
+        ),
+        Div(
+            Table(scrollable_rows, **table_options),
+            **{"class": "combined-right scrollable"},
+        ),
+        **{
+            "class": "combined issues compact",
+            "data-kind": kind,
+            "data-component-id": component_id,
+        },
+    )
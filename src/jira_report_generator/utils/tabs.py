@@ -1,10 +1,47 @@
-from .tags import A, Div, Tag
+from .tags import A, Div, Tag, Template
+
+
+class Tabs(Div):
+    """Tabs element, keeps its header and content to be split apart."""
+
+    def __init__(
+        self,
+        header: list[tuple[str, int]],
+        content: list[tuple[str, int]],
+        *elements,
+        **attrs,
+    ):
+        super().__init__(*elements, **attrs)
+        self.header = header
+        self.content = content
+
+
+def wrap_tab_content(element, id: int, deferred: bool = True) -> Tag:
+    """Wrap content of a single tab."""
+    return Div(
+        (
+            Template(element, **{"class": "tab-template"})
+            if deferred
+            else element
+        ),
+        **{
+            "class": "tab-content",
+            "data-tab-content-id": id,
+        },
+    )
 
 
 def wrap_with_tabs(
     header: list[tuple[str, int]],
     content: list[tuple[str, int]],
-) -> Tag:
+    deferred: bool = True,
+) -> Tabs:
+    """Wrap content with tabs.
+
+    Deferred tabs content is placed into inert `<template>` elements,
+    `script.js` mounts it when the tab is opened for the first time.
+
+    """
     tabs_header = Div(
         *[Div(A(title, **{"href": "javascript:;"}), **{
             "class": "tab-header",
@@ -13,14 +50,27 @@ def wrap_with_tabs(
         **{"class": "tabs-header"},
     )
     tabs_content = Div(
-        *[Div(element, **{
-            "class": "tab-content",
-            "data-tab-content-id": id,
-        }) for element, id in content],
+        *[
+            wrap_tab_content(element, id, deferred)
+            for element, id in content
+        ],
         **{"class": "tabs-content"},
     )
 
-    return Div(
+    return Tabs(
+        header,
+        content,
         *[tabs_header, tabs_content],
         **{"class": "tabs"},
     )
+
+
+def wrap_tab_page(element, id: int) -> Tag:
+    """Wrap content of a tab shown as a standalone page."""
+    return Div(
+        Div(
+            wrap_tab_content(element, id, deferred=False),
+            **{"class": "tabs-content"},
+        ),
+        **{"class": "tabs"},
+    )
@@ -120,9 +120,24 @@ class Input(Tag):
         return f"<{self.tag} {attrs} />"
 
 
+class Template(Div):
+    tag = "template"
+
+
+class Script(Tag):
+    tag = "script"
+
+
 class Section(Div):
     tag = "section"
 
 
 class H2(Tag):
     tag = "h2"
+
+
+class IFrame(Tag):
+    tag = "iframe"
+
+    def __init__(self, **attrs):
+        super().__init__("", **attrs)
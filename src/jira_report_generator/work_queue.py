@@ -0,0 +1,290 @@
+import abc
+import contextlib
+import os
+import socket
+import sqlite3
+import time
+import typing
+from urllib.parse import urlparse
+
+DEFAULT_LEASE_TIMEOUT = 10 * 60  # seconds
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 60  # seconds
+THROUGHPUT_PERIOD = 60 * 60  # seconds
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def get_worker_id() -> str:
+    """Returns worker ID unique across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue(abc.ABC):
+    """Queue of projects to generate reports for.
+
+    Job is leased by worker for `lease_timeout` seconds, if worker
+    doesn't complete it in time, job becomes available for other
+    workers. Failed jobs are retried up to `max_attempts` times.
+
+    Subclass it to use a real broker and register in
+    `WORK_QUEUE_BACKENDS`.
+
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def from_url(cls, url: str) -> "WorkQueue":
+        """Construct queue from URL."""
+
+    @abc.abstractmethod
+    def push(self, keys: list[str]) -> int:
+        """Add projects to queue, returns count of added jobs."""
+
+    @abc.abstractmethod
+    def lease(
+        self,
+        worker_id: str,
+        lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    ) -> dict[str, typing.Any] | None:
+        """Lease next available job, returns None if there is no jobs."""
+
+    @abc.abstractmethod
+    def extend(
+        self,
+        job_id: int,
+        worker_id: str,
+        lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    ) -> bool:
+        """Extend job lease, returns False if job was leased by other."""
+
+    @abc.abstractmethod
+    def complete(self, job_id: int, worker_id: str, duration: float) -> None:
+        """Mark job as done."""
+
+    @abc.abstractmethod
+    def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        """Mark job as failed, it will be retried if attempts are left."""
+
+    @abc.abstractmethod
+    def get_status(self) -> dict[str, typing.Any]:
+        """Returns jobs counts by status and throughput."""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue stored in SQLite database file."""
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: int = DEFAULT_RETRY_DELAY,
+    ):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        with self._connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker_id TEXT,
+                    available_at REAL NOT NULL,
+                    lease_expires_at REAL,
+                    created_at REAL NOT NULL,
+                    finished_at REAL,
+                    duration REAL,
+                    error TEXT
+                )
+            """)
+
+    @classmethod
+    def from_url(cls, url: str) -> "SQLiteWorkQueue":
+        # sqlite:///relative/path or sqlite:////absolute/path
+        return cls(urlparse(url).path[1:])
+
+    @contextlib.contextmanager
+    def _connect(self) -> typing.Iterator[sqlite3.Connection]:
+        # autocommit mode, transactions are started explicitly, they are
+        # rolled back on errors and connection is closed when it's done
+        connection = sqlite3.connect(
+            self.path,
+            timeout=30,
+            isolation_level=None,
+        )
+
+        with contextlib.closing(connection), connection:
+            yield connection
+
+    def push(self, keys: list[str]) -> int:
+        now = time.time()
+        added = 0
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            for key in keys:
+                queued = connection.execute(
+                    "SELECT 1 FROM jobs WHERE key = ? AND status IN (?, ?)",
+                    (key, PENDING, LEASED),
+                ).fetchone()
+                if queued:
+                    continue
+
+                connection.execute(
+                    "INSERT INTO jobs (key, status, available_at, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, PENDING, now, now),
+                )
+                added += 1
+            connection.execute("COMMIT")
+
+        return added
+
+    def lease(
+        self,
+        worker_id: str,
+        lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    ) -> dict[str, typing.Any] | None:
+        now = time.time()
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+
+            # expired leases of exhausted jobs are failed
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                "WHERE status = ? AND lease_expires_at < ? "
+                "AND attempts >= ?",
+                (FAILED, "Lease expired", now, LEASED, now, self.max_attempts),
+            )
+            row = connection.execute(
+                "SELECT id, key, attempts FROM jobs "
+                "WHERE (status = ? AND available_at <= ?) "
+                "OR (status = ? AND lease_expires_at < ?) "
+                "ORDER BY available_at, id LIMIT 1",
+                (PENDING, now, LEASED, now),
+            ).fetchone()
+
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+
+            job_id, key, attempts = row
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, "
+                "lease_expires_at = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                (LEASED, worker_id, now + lease_timeout, job_id),
+            )
+            connection.execute("COMMIT")
+
+        return {"id": job_id, "key": key, "attempt": attempts + 1}
+
+    def extend(
+        self,
+        job_id: int,
+        worker_id: str,
+        lease_timeout: int = DEFAULT_LEASE_TIMEOUT,
+    ) -> bool:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_expires_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (time.time() + lease_timeout, job_id, worker_id, LEASED),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, job_id: int, worker_id: str, duration: float) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, duration = ?, "
+                "error = NULL WHERE id = ? AND worker_id = ?",
+                (DONE, time.time(), duration, job_id, worker_id),
+            )
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        now = time.time()
+
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "finished_at = CASE WHEN attempts >= ? THEN ? END, "
+                "available_at = ?, error = ? "
+                "WHERE id = ? AND worker_id = ?",
+                (
+                    self.max_attempts,
+                    FAILED,
+                    PENDING,
+                    self.max_attempts,
+                    now,
+                    now + self.retry_delay,
+                    error,
+                    job_id,
+                    worker_id,
+                ),
+            )
+
+    def get_status(self) -> dict[str, typing.Any]:
+        since = time.time() - THROUGHPUT_PERIOD
+
+        with self._connect() as connection:
+            counts = dict(connection.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status",
+            ).fetchall())
+            done_count, avg_duration = connection.execute(
+                "SELECT COUNT(*), AVG(duration) FROM jobs "
+                "WHERE status = ? AND finished_at >= ?",
+                (DONE, since),
+            ).fetchone()
+            workers = connection.execute(
+                "SELECT COUNT(DISTINCT worker_id) FROM jobs WHERE status = ?",
+                (LEASED,),
+            ).fetchone()[0]
+            errors = connection.execute(
+                "SELECT key, error FROM jobs WHERE status = ? "
+                "ORDER BY finished_at DESC LIMIT 10",
+                (FAILED,),
+            ).fetchall()
+
+        return {
+            "counts": {
+                status: counts.get(status, 0)
+                for status in (PENDING, LEASED, DONE, FAILED)
+            },
+            "workers": workers,
+            "throughput": done_count * 60 * 60 / THROUGHPUT_PERIOD,
+            "avg_duration": avg_duration,
+            "errors": errors,
+        }
+
+
+WORK_QUEUE_BACKENDS: dict[str, type[WorkQueue]] = {
+    "sqlite": SQLiteWorkQueue,
+}
+
+
+def get_work_queue(url: str) -> WorkQueue:
+    """Returns work queue by URL.
+
+    Plain path or `sqlite:///path` -- SQLite queue.
+
+    """
+    parsed_url = urlparse(url)
+
+    if not parsed_url.scheme:
+        return SQLiteWorkQueue(url)
+
+    if parsed_url.scheme not in WORK_QUEUE_BACKENDS:
+        raise ValueError(
+            f"Unsupported queue: {parsed_url.scheme}, available: "
+            f"{', '.join(WORK_QUEUE_BACKENDS)}",
+        )
+
+    return WORK_QUEUE_BACKENDS[parsed_url.scheme].from_url(url)
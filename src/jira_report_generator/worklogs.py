@@ -0,0 +1,242 @@
+import functools
+import os
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas
+from jira import JIRA
+from pandas import DataFrame
+
+from .constants import MAX_THREADS_COUNT, WORKLOGS_PAGE_SIZE
+
+SECONDS_IN_HOUR = 3600
+
+
+def get_author(raw: dict | None) -> str:
+    """Returns account id of Jira Cloud or name of Jira Server user."""
+    raw = raw or {}
+    return raw.get("accountId") or raw.get("name") or ""
+
+
+def get_worklogs_table(raws: list[dict]) -> DataFrame:
+    """Returns columnar table of raw worklogs.
+
+    Columns are worklog `id`, `issue_id`, `author`, `started` as naive
+    UTC datetime and `seconds` spent.
+
+    """
+    return DataFrame({
+        "id": np.array([raw["id"] for raw in raws], dtype=np.int64),
+        "issue_id": np.array(
+            [raw["issueId"] for raw in raws],
+            dtype=np.int64,
+        ),
+        "author": pandas.Categorical(
+            [get_author(raw.get("author")) for raw in raws],
+        ),
+        "started": get_datetimes([raw["started"] for raw in raws]),
+        "seconds": np.array(
+            [raw.get("timeSpentSeconds", 0) for raw in raws],
+            dtype=np.int64,
+        ),
+    })
+
+
+def get_datetimes(values: list[str]) -> np.ndarray:
+    """Parse ISO 8601 datetimes to naive UTC datetimes with seconds."""
+    return pandas.to_datetime(
+        values,
+        format="ISO8601",
+        utc=True,
+    ).tz_localize(None).to_numpy(dtype="datetime64[s]")
+
+
+def get_changed_worklog_ids(
+    jira_client: JIRA,
+    path: str,
+    since: int,
+) -> tuple[list[int], int]:
+    """Returns ids of worklogs updated or deleted since `since`.
+
+    `path` is `worklog/updated` or `worklog/deleted`, `since` is
+    timestamp in milliseconds. Returned timestamp is `since` of the
+    next call.
+
+    """
+    ids = []
+
+    while True:
+        page = jira_client._get_json(path, params={"since": since})
+        ids.extend(value["worklogId"] for value in page["values"])
+        since = page.get("until", since)
+
+        if page.get("lastPage", True):
+            return ids, since
+
+
+def get_worklogs_page(jira_client: JIRA, ids: list[int]) -> list[dict]:
+    return jira_client._get_json(
+        "worklog/list",
+        params={"ids": ids},
+        use_post=True,
+    )
+
+
+def fetch_worklogs(
+    jira_client: JIRA,
+    ids: list[int],
+    page_size: int = WORKLOGS_PAGE_SIZE,
+) -> DataFrame:
+    """Returns worklogs table requested by pages of ids concurrently."""
+    pages = [
+        ids[start:start + page_size]
+        for start in range(0, len(ids), page_size)
+    ]
+
+    with ThreadPoolExecutor(max_workers=MAX_THREADS_COUNT) as executor:
+        raws = [
+            raw
+            for page in executor.map(
+                functools.partial(get_worklogs_page, jira_client),
+                pages,
+            )
+            for raw in page
+        ]
+
+    return get_worklogs_table(raws)
+
+
+def merge_worklogs(
+    worklogs: DataFrame,
+    updated: DataFrame,
+    deleted_ids: list[int],
+) -> DataFrame:
+    """Replace updated worklogs and remove deleted ones."""
+    stale = worklogs.id.isin(updated.id) | worklogs.id.isin(deleted_ids)
+    kept = worklogs[~stale]
+
+    if kept.empty or updated.empty:
+        return (updated if kept.empty else kept).reset_index(drop=True)
+
+    merged = pandas.concat([kept, updated], ignore_index=True)
+
+    return merged.astype({"author": "category"})
+
+
+def load_worklogs(path: str) -> tuple[DataFrame, int] | None:
+    """Load worklogs table and `since` saved with `save_worklogs`.
+
+    Returns None if store is missing or broken.
+
+    """
+    try:
+        with np.load(path) as store:
+            return DataFrame({
+                "id": store["id"],
+                "issue_id": store["issue_id"],
+                "author": pandas.Categorical.from_codes(
+                    store["author_codes"],
+                    store["authors"],
+                ),
+                "started": store["started"],
+                "seconds": store["seconds"],
+            }), int(store["since"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_worklogs(path: str, worklogs: DataFrame, since: int) -> None:
+    """Store worklogs table as numpy arrays atomically.
+
+    Authors are stored once, worklogs keep their codes only. Arrays
+    aren't compressed, so millions of worklogs are saved instantly.
+
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    author = worklogs.author.astype("category").cat
+
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            id=worklogs.id.to_numpy(dtype=np.int64),
+            issue_id=worklogs.issue_id.to_numpy(dtype=np.int64),
+            author_codes=author.codes.to_numpy(),
+            authors=author.categories.to_numpy(dtype=str),
+            started=worklogs.started.to_numpy(dtype="datetime64[s]"),
+            seconds=worklogs.seconds.to_numpy(dtype=np.int64),
+            since=np.int64(since),
+        )
+
+    os.replace(tmp_path, path)
+
+
+def filter_worklogs(
+    worklogs: DataFrame,
+    issue_ids: typing.Iterable[str],
+) -> DataFrame:
+    """Returns worklogs of issues with `issue_ids`."""
+    ids = np.fromiter(map(int, issue_ids), dtype=np.int64)
+
+    return worklogs[worklogs.issue_id.isin(ids)].reset_index(drop=True)
+
+
+def get_sprint_bounds(sprint: typing.Any) -> tuple[str, str] | None:
+    """Returns start and completion or end date of started sprint."""
+    start = getattr(sprint, "startDate", None)
+    end = (
+        getattr(sprint, "completeDate", None)
+        or getattr(sprint, "endDate", None)
+    )
+
+    return (start, end) if start and end else None
+
+
+def get_sprints_spent(
+    worklogs: DataFrame,
+    sprints: list,
+) -> dict[typing.Any, float]:
+    """Returns hours logged during period of every sprint.
+
+    Worklogs are matched to sprints by dates only, not by issue sprints.
+    Worklog start is looked up in sorted sprints starts, so it's taken
+    by the latest sprint started before it, if it's logged before
+    that sprint end. Sprints of a board are expected not to overlap.
+
+    """
+    bounds = {
+        sprint.id: get_sprint_bounds(sprint)
+        for sprint in sprints
+    }
+    dated = [(id, *value) for id, value in bounds.items() if value]
+    spent = dict.fromkeys(bounds, 0.0)
+
+    if not dated or worklogs.empty:
+        return spent
+
+    ids, starts, ends = zip(*dated)
+    starts = np.concatenate([get_datetimes([value]) for value in starts])
+    ends = np.concatenate([get_datetimes([value]) for value in ends])
+    order = np.argsort(starts, kind="stable")
+    started = worklogs.started.to_numpy(dtype="datetime64[s]")
+
+    positions = np.searchsorted(starts[order], started, side="right") - 1
+    indexes = order[positions.clip(0)]
+    matched = (positions >= 0) & (started < ends[indexes])
+    hours = np.bincount(
+        indexes[matched],
+        weights=worklogs.seconds.to_numpy()[matched],
+        minlength=len(ids),
+    ) / SECONDS_IN_HOUR
+
+    spent.update(zip(ids, hours.tolist()))
+
+    return spent
+
+
+def get_week_starts(started: np.ndarray) -> np.ndarray:
+    """Returns Mondays of weeks of datetimes, 1970-01-01 is Thursday."""
+    days = started.astype("datetime64[D]").astype(np.int64)
+
+    return (days - (days + 3) % 7).astype("datetime64[D]")
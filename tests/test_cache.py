@@ -0,0 +1,69 @@
+import os
+import time
+
+from jira_report_generator.utils.cache import ResponseCache, evict_files
+
+
+def write_file(path, size: int, mtime: float) -> str:
+    path = str(path)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_evict_files_removes_least_recently_used(tmp_path):
+    now = time.time()
+    oldest = write_file(tmp_path / "a", 10, now - 30)
+    older = write_file(tmp_path / "b", 10, now - 20)
+    newest = write_file(tmp_path / "c", 10, now - 10)
+
+    evict_files(str(tmp_path), 20)
+
+    assert not os.path.exists(oldest)
+    assert os.path.exists(older)
+    assert os.path.exists(newest)
+
+
+def test_evict_files_walks_subdirectories(tmp_path):
+    now = time.time()
+    (tmp_path / "ab").mkdir()
+    old = write_file(tmp_path / "ab" / "old", 10, now - 20)
+    new = write_file(tmp_path / "new", 10, now - 10)
+
+    evict_files(str(tmp_path), 10)
+
+    assert not os.path.exists(old)
+    assert os.path.exists(new)
+
+
+def test_evict_files_keeps_files_modified_since(tmp_path):
+    now = time.time()
+    old = write_file(tmp_path / "old", 10, now - 20)
+    current = write_file(tmp_path / "current", 100, now)
+
+    evict_files(str(tmp_path), 50, since=now - 1)
+
+    assert not os.path.exists(old)
+    # exceeds max size alone, but it's used by the current run
+    assert os.path.exists(current)
+
+
+def test_response_cache_evicts_on_demand_only(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_size=1)
+
+    cache.set("issues", "A", {"total": 1})
+    cache.set("issues", "B", {"total": 2})
+
+    assert cache.get("issues", "A") == {"total": 1}
+
+    cache.evict()
+
+    # entries written by this run are kept
+    assert cache.get("issues", "A") == {"total": 1}
+    assert cache.get("issues", "B") == {"total": 2}
+
+    cache.evict(since=time.time() + 1)
+
+    assert cache.read("issues", "A") is None
+    assert cache.read("issues", "B") is None
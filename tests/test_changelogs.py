@@ -0,0 +1,126 @@
+import types
+
+from pandas import DataFrame
+
+from jira_report_generator.changelogs import (
+    get_as_of_time,
+    get_changelogs_tables,
+    get_durations,
+    get_status_intervals,
+    merge_changelogs,
+)
+
+STATUSES = {"1": "To Do", "3": "In Progress", "5": "Done"}
+
+
+def get_raw(id, created, transitions=(), updated=None):
+    return {
+        "id": id,
+        "fields": {"created": created, "updated": updated or created},
+        "changelog": {
+            "histories": [
+                {
+                    "created": time,
+                    "items": [
+                        {"field": "assignee"},
+                        {
+                            "field": "status",
+                            "from": from_status,
+                            "fromString": STATUSES[from_status],
+                            "to": to_status,
+                            "toString": STATUSES[to_status],
+                        },
+                    ],
+                }
+                for time, from_status, to_status in transitions
+            ],
+        },
+    }
+
+
+def get_issues(statuses):
+    return DataFrame({
+        "id": list(statuses),
+        "status": [
+            types.SimpleNamespace(id=status)
+            for status in statuses.values()
+        ],
+    })
+
+
+def test_get_status_intervals():
+    changelogs = get_changelogs_tables([
+        get_raw(
+            "1",
+            "2024-01-01T00:00:00.000+0000",
+            [
+                # histories are ordered by time when tables are built
+                ("2024-01-06T00:00:00.000+0000", "3", "5"),
+                ("2024-01-03T00:00:00.000+0000", "1", "3"),
+            ],
+        ),
+        # without transitions issue is in its current status
+        get_raw("2", "2024-01-02T00:00:00.000+0000"),
+        # created after as of date
+        get_raw("3", "2024-01-11T00:00:00.000+0000"),
+        # transition after as of date is skipped
+        get_raw(
+            "4",
+            "2024-01-01T12:00:00.000+0000",
+            [("2024-01-12T00:00:00.000+0000", "1", "3")],
+        ),
+    ])
+    issues = get_issues({"1": "5", "2": "3", "3": "1", "4": "3"})
+
+    intervals = get_status_intervals(
+        changelogs,
+        issues,
+        get_as_of_time("2024-01-09"),
+    )
+
+    assert intervals.issue_id.tolist() == [1, 1, 1, 2, 4]
+    assert intervals.status.tolist() == ["1", "3", "5", "3", "1"]
+    assert intervals.position.tolist() == [0, 1, 2, 0, 0]
+    assert intervals.start.astype(str).tolist() == [
+        "2024-01-01 00:00:00",
+        "2024-01-03 00:00:00",
+        "2024-01-06 00:00:00",
+        "2024-01-02 00:00:00",
+        "2024-01-01 12:00:00",
+    ]
+    assert get_durations(intervals).tolist() == [2.0, 3.0, 4.0, 8.0, 8.5]
+
+
+def test_merge_changelogs_replaces_updated_issues():
+    changelogs = get_changelogs_tables([
+        get_raw(
+            "1",
+            "2024-01-01T00:00:00.000+0000",
+            [("2024-01-02T00:00:00.000+0000", "1", "3")],
+        ),
+        get_raw(
+            "2",
+            "2024-01-01T00:00:00.000+0000",
+            [("2024-01-03T00:00:00.000+0000", "1", "3")],
+            updated="2024-01-03T00:00:00.000+0000",
+        ),
+    ])
+    updated = get_changelogs_tables([
+        get_raw(
+            "1",
+            "2024-01-01T00:00:00.000+0000",
+            [
+                ("2024-01-02T00:00:00.000+0000", "1", "3"),
+                ("2024-01-04T00:00:00.000+0000", "3", "5"),
+            ],
+            updated="2024-01-04T00:00:00.000+0000",
+        ),
+    ])
+
+    merged = merge_changelogs(changelogs, updated)
+
+    assert sorted(merged.issues.id.tolist()) == [1, 2]
+    assert merged.transitions.issue_id.tolist() == [1, 1, 2]
+    assert merged.transitions.to_status.tolist() == ["3", "5", "3"]
+    assert merged.statuses == STATUSES
+    assert merged.updated == "2024-01-04T00:00:00.000+0000"
@@ -0,0 +1,41 @@
+from pandas import DataFrame
+
+from jira_report_generator.utils.data import get_section_hash
+
+
+class Resource:
+    def __init__(self, **raw):
+        self.raw = raw
+
+
+def get_issues(status: Resource, components: list) -> DataFrame:
+    return DataFrame({
+        "id": ["1", "2"],
+        "status": [status, status],
+        "components": [components, []],
+        "estimate": [1.0, 2.0],
+    })
+
+
+def test_section_hash_is_stable_for_equal_inputs():
+    first = get_issues(Resource(id="1", name="Open"), [Resource(id="10")])
+    second = get_issues(Resource(id="1", name="Open"), [Resource(id="10")])
+
+    assert get_section_hash(first, "compact") == (
+        get_section_hash(second, "compact")
+    )
+
+
+def test_section_hash_depends_on_resources_raw_data():
+    issues = get_issues(Resource(id="1", name="Open"), [])
+    renamed = get_issues(Resource(id="1", name="Done"), [])
+
+    assert get_section_hash(issues) != get_section_hash(renamed)
+
+
+def test_section_hash_depends_on_values_and_options():
+    issues = get_issues(Resource(id="1"), [])
+    estimated = issues.assign(estimate=[1.0, 3.0])
+
+    assert get_section_hash(issues) != get_section_hash(estimated)
+    assert get_section_hash(issues, True) != get_section_hash(issues, False)
@@ -0,0 +1,85 @@
+import numpy as np
+
+from jira_report_generator.forecast import (
+    FORECAST_MAX_ITEMS,
+    get_percentiles,
+    simulate_forecasts,
+)
+
+TRIALS = 2000
+
+
+def test_get_percentiles_matches_numpy():
+    values = np.random.default_rng(0).random((101, 3))
+
+    np.testing.assert_allclose(
+        get_percentiles(values, (50, 80, 95)),
+        np.percentile(values, (50, 80, 95), axis=0),
+    )
+
+
+def test_single_closed_item_is_the_only_draw():
+    ratios = np.array([[1.5], [3.0]])
+
+    assert simulate_forecasts(ratios, [(0, 1, 10)], trials=TRIALS) == [
+        (1.5, 1.5, 1.5),
+    ]
+
+
+def test_without_history_forecast_is_none():
+    ratios = np.array([[np.nan, 1.0], [np.inf, 2.0]])
+
+    assert simulate_forecasts(
+        ratios,
+        [(0, 2, 1), (1, 0, 1), (1, 2, 1)],
+        trials=TRIALS,
+    )[:2] == [None, None]
+
+
+def test_one_item_gets_ratio_of_one_closed_item():
+    ratios = np.array([[1.0], [2.0], [4.0]])
+
+    (p50, p80, p95), = simulate_forecasts(
+        ratios,
+        [(0, 3, 1)],
+        trials=TRIALS,
+    )
+
+    # per item ratios are drawn, not averaged
+    assert p50 == 2.0
+    assert p95 == 4.0
+
+
+def test_spread_narrows_with_more_work_items():
+    ratios = np.array([[1.0], [2.0], [4.0], [0.5], [1.5]])
+
+    small, large = simulate_forecasts(
+        ratios,
+        [(0, 5, 1), (0, 5, FORECAST_MAX_ITEMS)],
+        trials=TRIALS,
+    )
+
+    assert large[2] - large[0] < small[2] - small[0]
+    assert ratios.min() <= large[0] <= large[2] <= ratios.max()
+
+
+def test_history_is_first_closed_items_only():
+    ratios = np.array([[1.0], [1.0], [10.0]])
+
+    first_two, all_three = simulate_forecasts(
+        ratios,
+        [(0, 2, 3), (0, 3, 3)],
+        trials=TRIALS,
+    )
+
+    assert first_two == (1.0, 1.0, 1.0)
+    assert all_three[2] > 1.0
+
+
+def test_same_seed_same_forecasts():
+    ratios = np.random.default_rng(1).uniform(0.5, 2, (6, 2))
+    requests = [(0, 6, 4), (1, 3, 2)]
+
+    assert simulate_forecasts(ratios, requests, trials=TRIALS) == (
+        simulate_forecasts(ratios, requests, trials=TRIALS)
+    )
@@ -0,0 +1,55 @@
+import pytest
+
+from jira_report_generator import server
+from jira_report_generator.server import ReportStore
+
+
+@pytest.fixture(autouse=True)
+def fake_report(monkeypatch):
+    def get_prepared_data(jira_client, key, jira_server_url, cache=None):
+        if key == "MISSING":
+            raise ValueError(key)
+        return {"issues": key, "versions": [], "boards": []}
+
+    monkeypatch.setattr(server, "get_prepared_data", get_prepared_data)
+    monkeypatch.setattr(
+        server,
+        "construct_tables",
+        lambda issues, versions, boards, section_cache=None: issues,
+    )
+    monkeypatch.setattr(
+        server,
+        "render_template",
+        lambda tables, key, template: f"report of {tables}",
+    )
+
+
+def test_report_store_keeps_recently_requested_reports():
+    store = ReportStore(None, "", None, max_reports=2)
+
+    assert store.get_report("A") == "report of A"
+    store.get_report("B")
+    store.get_report("A")
+    store.get_report("C")
+
+    assert list(store.entries) == ["A", "C"]
+    assert set(store._key_locks) == {"A", "C"}
+
+
+def test_report_store_keeps_known_projects():
+    store = ReportStore(None, "", None, keys=["A", "B"], max_reports=1)
+
+    store.get_report("A")
+    store.get_report("B")
+
+    assert list(store.entries) == ["A", "B"]
+
+
+def test_report_store_forgets_missing_projects():
+    store = ReportStore(None, "", None)
+
+    with pytest.raises(ValueError):
+        store.get_report("MISSING")
+
+    assert not store.entries
+    assert not store._key_locks
@@ -0,0 +1,74 @@
+import pytest
+from jira import resources
+from pandas import DataFrame
+
+from jira_report_generator.utils.snapshot import load_snapshot, save_snapshot
+
+pytest.importorskip("pyarrow")
+
+
+def get_data():
+    status = resources.Status({}, None, {"id": "3", "name": "In Progress"})
+    version = resources.Version(
+        {},
+        None,
+        {"id": "10", "name": "1.0", "archived": False},
+    )
+
+    return {
+        "project_key": "PRJ",
+        "issues": DataFrame({
+            "id": ["1", "2"],
+            "key": ["PRJ-1", "PRJ-2"],
+            "status": [status, status],
+            "assignee": [
+                resources.User(
+                    {},
+                    None,
+                    {"self": "user?accountId=a", "accountId": "a"},
+                ),
+                None,
+            ],
+            "components": [
+                [resources.Component({}, None, {"id": "7", "name": "API"})],
+                [],
+            ],
+            "versions": [[version], [version]],
+            "estimate": [2.0, 0.0],
+            "sprint_id": [5, None],
+        }),
+        "versions": [version],
+        "boards": [
+            {
+                "board": resources.Board({}, None, {"id": 1, "name": "B"}),
+                "sprints": [
+                    resources.Sprint({}, None, {"id": 5, "name": "Sprint"}),
+                ],
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize("filename", ["snapshot.arrow", "snapshot.parquet"])
+def test_snapshot_round_trip(tmp_path, filename):
+    path = str(tmp_path / filename)
+
+    save_snapshot(path, get_data())
+    data = load_snapshot(path)
+    issues = data["issues"]
+
+    assert data["project_key"] == "PRJ"
+    assert [version.name for version in data["versions"]] == ["1.0"]
+    assert data["boards"][0]["board"].name == "B"
+    assert data["boards"][0]["sprints"][0].id == 5
+    assert issues.key.tolist() == ["PRJ-1", "PRJ-2"]
+    assert issues.estimate.tolist() == [2.0, 0.0]
+    assert issues.sprint_id[0] == 5
+    assert issues.status[0].name == "In Progress"
+    # equal resources are decoded once
+    assert issues.status[0] is issues.status[1]
+    assert issues.assignee[0].accountId == "a"
+    assert issues.assignee[1] is None
+    assert [c.name for c in issues.components[0]] == ["API"]
+    assert issues.components[1] == []
+    assert issues.versions[0][0].archived is False
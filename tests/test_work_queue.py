@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from jira_report_generator.cli import keep_lease
+from jira_report_generator.work_queue import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    SQLiteWorkQueue,
+    WorkQueue,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteWorkQueue(str(tmp_path / "queue.db"), retry_delay=0)
+
+
+def test_work_queue_is_abstract():
+    with pytest.raises(TypeError):
+        WorkQueue()
+
+
+def test_push_skips_queued_keys(queue):
+    assert queue.push(["A", "B"]) == 2
+    assert queue.push(["A", "C"]) == 1
+    assert queue.get_status()["counts"][PENDING] == 3
+
+
+def test_leased_job_is_not_leased_again(queue):
+    queue.push(["A"])
+
+    job = queue.lease("worker-1", lease_timeout=60)
+
+    assert job == {"id": job["id"], "key": "A", "attempt": 1}
+    assert queue.lease("worker-2", lease_timeout=60) is None
+    assert queue.get_status()["counts"][LEASED] == 1
+
+
+def test_expired_lease_is_leased_by_other_worker(queue):
+    queue.push(["A"])
+    job = queue.lease("worker-1", lease_timeout=0)
+    time.sleep(0.01)
+
+    other_job = queue.lease("worker-2", lease_timeout=60)
+
+    assert other_job["id"] == job["id"]
+    assert other_job["attempt"] == 2
+    # the first worker lost the lease
+    assert not queue.extend(job["id"], "worker-1", lease_timeout=60)
+    assert queue.extend(job["id"], "worker-2", lease_timeout=60)
+
+
+def test_extend_keeps_job_leased(queue):
+    queue.push(["A"])
+    job = queue.lease("worker-1", lease_timeout=0)
+
+    assert queue.extend(job["id"], "worker-1", lease_timeout=60)
+    time.sleep(0.01)
+    assert queue.lease("worker-2", lease_timeout=60) is None
+
+
+def test_expired_lease_of_exhausted_job_fails(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=1)
+    queue.push(["A"])
+    queue.lease("worker-1", lease_timeout=0)
+    time.sleep(0.01)
+
+    assert queue.lease("worker-2", lease_timeout=60) is None
+
+    status = queue.get_status()
+    assert status["counts"][FAILED] == 1
+    assert status["errors"] == [("A", "Lease expired")]
+
+
+def test_complete_and_fail(queue):
+    queue.push(["A", "B"])
+    first = queue.lease("worker-1")
+    second = queue.lease("worker-1")
+
+    queue.complete(first["id"], "worker-1", 1.5)
+    queue.fail(second["id"], "worker-1", "boom")
+
+    counts = queue.get_status()["counts"]
+    assert counts[DONE] == 1
+    # failed job is retried while attempts are left
+    assert counts[PENDING] == 1
+    assert queue.lease("worker-2")["attempt"] == 2
+
+
+class LostLeaseQueue:
+    def __init__(self):
+        self.extended = 0
+
+    def extend(self, job_id, worker_id, lease_timeout):
+        self.extended += 1
+        return False
+
+
+def test_keep_lease_sets_lost_when_extend_fails():
+    queue = LostLeaseQueue()
+    stop = threading.Event()
+    lost = threading.Event()
+
+    keep_lease(queue, 1, "worker-1", 0.03, stop, lost)
+
+    assert lost.is_set()
+    assert queue.extended == 1
@@ -0,0 +1,61 @@
+import types
+
+from jira_report_generator.worklogs import (
+    get_sprints_spent,
+    get_worklogs_table,
+)
+
+
+def get_sprint(id, start, end, complete=None):
+    return types.SimpleNamespace(
+        id=id,
+        startDate=start,
+        endDate=end,
+        completeDate=complete,
+    )
+
+
+def get_worklog(id, started, seconds):
+    return {
+        "id": id,
+        "issueId": 1,
+        "started": started,
+        "timeSpentSeconds": seconds,
+    }
+
+
+def test_get_sprints_spent_matches_worklogs_by_sprint_periods():
+    sprints = [
+        get_sprint(2, "2024-01-15T00:00:00Z", "2024-01-29T00:00:00Z"),
+        get_sprint(
+            1,
+            "2024-01-01T00:00:00Z",
+            "2024-01-15T00:00:00Z",
+            complete="2024-01-12T00:00:00Z",
+        ),
+        get_sprint(3, None, None),
+    ]
+    worklogs = get_worklogs_table([
+        # before the first sprint
+        get_worklog(1, "2023-12-31T23:00:00.000+0000", 3600),
+        get_worklog(2, "2024-01-02T10:00:00.000+0000", 7200),
+        # between completion of the first sprint and its end
+        get_worklog(3, "2024-01-13T10:00:00.000+0000", 3600),
+        # 2024-01-14T23:00 UTC, after completion of the first sprint
+        get_worklog(4, "2024-01-15T01:00:00.000+0200", 1800),
+        get_worklog(5, "2024-01-20T10:00:00.000+0000", 3600),
+        # after the last sprint
+        get_worklog(6, "2024-01-29T00:00:00.000+0000", 3600),
+    ])
+
+    assert get_sprints_spent(worklogs, sprints) == {
+        2: 1.0,
+        1: 2.0,
+        3: 0.0,
+    }
+
+
+def test_get_sprints_spent_without_worklogs():
+    sprints = [get_sprint(1, "2024-01-01T00:00:00Z", "2024-01-15T00:00:00Z")]
+
+    assert get_sprints_spent(get_worklogs_table([]), sprints) == {1: 0.0}